@@ -1,11 +1,321 @@
 import argparse
+import json
+import sys
 
-def main():
+from ai_powered.core import tracing
+from ai_powered.core.parser.guard import (
+    DEFAULT_MAX_FILE_BYTES,
+    DEFAULT_QUARANTINE_PATH,
+    ParseGuard,
+    Quarantine,
+)
+from ai_powered.core.parser.git_scan import GitScanError, changed_function_map, scan_changes
+from ai_powered.core.parser.python_parser import PythonParser
+from ai_powered.core.parser.parse_cache import ParseCache
+from ai_powered.core.parser.walker import TreeWalker
+from ai_powered.core.reporter.coverage_reporter import compute_coverage
+from ai_powered.core.reporter.memory_profile import format_summary, profile_scan, write_report
+from ai_powered.core.reporter.sharding import (
+    merge_partials,
+    parse_shard,
+    scan_report,
+    scan_shard,
+    write_partial,
+)
+from ai_powered.core.validator.batch import ValidationSummary, validate_files
+from ai_powered.core.validator.budget import ValidationBudget, parse_budgets
+from ai_powered.core.validator.validation_cache import ValidationCache
+from ai_powered.core.validator.validator import CodeValidator
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description="AI Reviewer CLI")
-    parser.add_argument("--path", type=str, required=True, help="Folder to scan")
-    
-    args = parser.parse_args()
+    parser.add_argument("--path", type=str, default=None, help="Folder to scan")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Worker processes for parsing (0 = all cores)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the parse cache")
+    parser.add_argument(
+        "--include", action="append", default=None, metavar="GLOB",
+        help="File glob to scan (repeatable, default *.py)"
+    )
+    parser.add_argument(
+        "--exclude", action="append", default=None, metavar="GLOB",
+        help="File or directory glob to skip, relative to --path (repeatable)"
+    )
+    parser.add_argument("--no-gitignore", action="store_true", help="Do not honour .gitignore files")
+    parser.add_argument(
+        "--max-file-bytes", type=int, default=DEFAULT_MAX_FILE_BYTES,
+        help="Skip and quarantine files larger than this"
+    )
+    parser.add_argument(
+        "--parse-timeout", type=float, default=None, metavar="SECONDS",
+        help="Kill and quarantine a file whose parse takes longer than this"
+    )
+
+    parser.add_argument(
+        "--since", metavar="REF", default=None,
+        help="Only scan Python files changed since this git ref"
+    )
+    parser.add_argument(
+        "--staged", action="store_true",
+        help="With --since, compare the git index instead of the working tree"
+    )
+
+    parser.add_argument(
+        "--shard", type=parse_shard, default=None, metavar="I/N",
+        help="Scan only shard I of N (files split by stable path hash)"
+    )
+    parser.add_argument(
+        "--partial-out", metavar="FILE", default=None,
+        help="With --shard, where to write the partial result"
+    )
+    parser.add_argument(
+        "--merge", nargs="+", metavar="PARTIAL", default=None,
+        help="Merge partial results from every shard into one report"
+    )
+    parser.add_argument(
+        "--report", metavar="FILE", default=None,
+        help="Write the full JSON report (functions, violations, coverage)"
+    )
+    parser.add_argument(
+        "--select", metavar="CODES", default=None,
+        help="Comma-separated rule codes or prefixes to run (default: all)"
+    )
+    parser.add_argument(
+        "--ignore", metavar="CODES", default=None,
+        help="Comma-separated rule codes or prefixes to skip"
+    )
+    parser.add_argument(
+        "--fail-fast", action="store_true",
+        help="Only validate; stop and exit 1 at the first violation"
+    )
+    parser.add_argument(
+        "--max-violations", type=int, default=None, metavar="N",
+        help="Only validate; stop and exit 1 once more than N violations are found"
+    )
+    parser.add_argument(
+        "--budget", metavar="CODE=N,...", default=None,
+        help="Only validate; stop and exit 1 once a code or prefix exceeds its budget, e.g. D1=0,D202=10"
+    )
+    parser.add_argument(
+        "--profile-memory", action="store_true",
+        help="Profile memory per scan stage and write a report to storage/reports"
+    )
+    parser.add_argument(
+        "--trace", metavar="FILE", default=None,
+        help="Record stage timings and write them as Chrome trace-event JSON"
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.trace is None:
+        return _run(parser, args)
+
+    tracing.enable()
+    try:
+        return _run(parser, args)
+    finally:
+        tracing.disable()
+        _print_timings(args.trace)
+
+
+def _print_timings(trace_path):
+    print(f"{'stage':<20} {'count':>7} {'total ms':>10} {'mean ms':>9} {'p95 ms':>9}")
+    for row in tracing.summarize():
+        print(
+            f"{row['stage']:<20} {row['count']:>7} {row['total_ms']:>10.2f} "
+            f"{row['mean_ms']:>9.3f} {row['p95_ms']:>9.3f}"
+        )
+    print("Trace written to:", tracing.export_chrome_trace(trace_path))
+
+
+def _run(parser, args):
+    if args.merge:
+        report = merge_partials(args.merge)
+        return _print_report(report, args.report, ", ".join(args.merge))
+
+    if args.path is None:
+        parser.error("--path is required unless --merge is given")
+
+    try:
+        validator = CodeValidator(
+            select=args.select,
+            ignore=args.ignore,
+            cache=None if args.no_cache else ValidationCache(),
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    cache = None if args.no_cache else ParseCache()
+    walker = TreeWalker(
+        include=args.include,
+        exclude=args.exclude,
+        use_gitignore=not args.no_gitignore,
+    )
+
+    budget = _budget(parser, args)
+
+    if args.profile_memory:
+        report = profile_scan(args.path, walker)
+        print(format_summary(report))
+        print("Memory profile written to:", write_report(report))
+        return
+
+    guard = ParseGuard(
+        max_bytes=args.max_file_bytes,
+        timeout=args.parse_timeout,
+        quarantine=Quarantine(None if args.no_cache else DEFAULT_QUARANTINE_PATH),
+    )
+
+    if budget is not None:
+        return _check(args, walker, validator, budget, guard)
+
+    if args.since is not None or args.staged:
+        try:
+            return _review_changes(args, walker, cache, guard)
+        except GitScanError as exc:
+            parser.error(str(exc))
+
+    if args.shard is not None:
+        index, count = args.shard
+        partial = scan_shard(
+            args.path, index, count, cache, args.jobs, walker, guard, validator=validator
+        )
+        out_path = write_partial(
+            partial, args.partial_out or f"partial-{index}-of-{count}.json.gz"
+        )
+        print(f"Shard {index}/{count}: {len(partial['files'])} file(s), "
+              f"{len(partial['functions'])} function(s) written to {out_path}")
+        return
+
+    if args.report:
+        report = scan_report(args.path, cache, args.jobs, walker, guard, validator=validator)
+        return _print_report(report, args.report, args.path)
+
+    scanner = PythonParser(cache=cache, jobs=args.jobs, walker=walker, guard=guard)
+    functions = scanner.extract_functions(args.path)
+    aggregate = compute_coverage(functions)["aggregate"]
+
+    print(
+        f"Functions: {aggregate['total_functions']}  "
+        f"Documented: {aggregate['documented']}  "
+        f"Coverage: {aggregate['coverage_percent']}%"
+    )
+    for item in scanner.quarantined:
+        print(f"Skipped {item['file']}: {item['reason']} ({item['detail']})")
+    print("Code review completed for:", args.path)
+
+
+def _budget(parser, args):
+    """
+    Build the ValidationBudget the gating flags ask for, or None.
+    """
+    if not (args.fail_fast or args.max_violations is not None or args.budget):
+        return None
+
+    max_violations = 0 if args.fail_fast else args.max_violations
+    if max_violations is not None and max_violations < 0:
+        parser.error("--max-violations must be 0 or more")
+    try:
+        per_code = parse_budgets(args.budget) if args.budget else None
+    except ValueError as exc:
+        parser.error(str(exc))
+    return ValidationBudget(max_violations, per_code)
+
+
+def _check(args, walker, validator, budget, guard):
+    """
+    Validate until the budget is exceeded and return the exit code.
+
+    Files that cannot be read or parsed, or that the guard refuses, fail
+    the gate as well: a check that never looked at a file cannot pass it.
+
+    Returns:
+        int: 1 if the budget was exceeded or a file failed, else 0.
+    """
+    summary = ValidationSummary(keep_violations=False)
+    files = walker.walk(args.path)
+
+    try:
+        results = validate_files(
+            files, jobs=args.jobs, validator=validator, budget=budget, guard=guard
+        )
+        for result in results:
+            summary.add(result)
+            if result["error"]:
+                print(f"{result['file_path']}: {result['error']}")
+            for violation in result["violations"] or ():
+                print(f"{result['file_path']}:{violation['line']}: {violation['code']} {violation['message']}")
+    finally:
+        guard.close()
+        guard.quarantine.save()
+
+    if budget.exceeded:
+        limit = "total" if budget.exceeded_by == "total" else f"budget for {budget.exceeded_by}"
+        print(f"Validation failed: {limit} exceeded after {summary.files} file(s)")
+        return 1
+
+    if summary.failed:
+        print(f"Validation failed: {len(summary.failed)} of {summary.files} file(s) could not be validated")
+        return 1
+
+    print(f"Validation passed: {summary.issues} violation(s) in {summary.files} file(s)")
+    return 0
+
+
+def _print_report(report, report_path, source):
+    """
+    Print the coverage summary of a report and optionally save it as JSON.
+    """
+    aggregate = report["coverage"]
+    print(
+        f"Files: {report['files']}  "
+        f"Functions: {aggregate['total_functions']}  "
+        f"Documented: {aggregate['documented']}  "
+        f"Coverage: {aggregate['coverage_percent']}%  "
+        f"Violations: {sum(report['violation_counts'].values())}"
+    )
+    for item in report["quarantined"]:
+        print(f"Skipped {item['file']}: {item['reason']} ({item['detail']})")
+
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print("Report written to:", report_path)
+
+    print("Code review completed for:", source)
+
+
+def _review_changes(args, walker, cache, guard):
+    """
+    Report added, modified and removed functions since a git ref.
+    """
+    results = scan_changes(
+        args.path,
+        ref=args.since or "HEAD",
+        staged=args.staged,
+        cache=cache,
+        guard=guard,
+        walker=walker,
+    )
+
+    for result in results:
+        print(f"{result['status']} {result['file_path']}")
+        for label, sign in (("added", "+"), ("modified", "~"), ("removed", "-")):
+            for record in result[label]:
+                print(f"  {sign} {record['qualname']} (lines {record['lineno']}-{record['end_lineno']})")
+
+    aggregate = compute_coverage(changed_function_map(results))["aggregate"]
+    print(
+        f"Changed files: {len(results)}  "
+        f"Changed functions: {aggregate['total_functions']}  "
+        f"Documented: {aggregate['documented']}  "
+        f"Coverage: {aggregate['coverage_percent']}%"
+    )
     print("Code review completed for:", args.path)
 
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
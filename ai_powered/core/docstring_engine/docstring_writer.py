@@ -1,5 +1,5 @@
-from pathlib import Path
-import ast
+from ai_powered.core.docstring_engine.fix_planner import FixPlan
+from ai_powered.core.tracing import traced
 '''
 def apply_docstring(file_path, lineno, new_docstring):
     """
@@ -31,89 +31,34 @@ def apply_docstring(file_path, lineno, new_docstring):
 '''
 
 
+@traced("writer.apply", "writer")
 def apply_docstring(file_path, func_name, new_docstring):
     """
     Safely insert or replace a docstring for a specific function.
-    """
-
-    file_path = Path(file_path)
-    source = file_path.read_text()
-    tree = ast.parse(source)
-
-    lines = source.splitlines()
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name == func_name:
-            # Determine indentation
-            def_line = lines[node.lineno - 1]
-            base_indent = def_line[: len(def_line) - len(def_line.lstrip())]
-            doc_indent = base_indent + " " * 4
-
-            formatted = [
-                doc_indent + line if line.strip() else line
-                for line in new_docstring.splitlines()
-            ]
-
-            # If docstring exists → replace
-            if ast.get_docstring(node):
-                doc_node = node.body[0]
-                start = doc_node.lineno - 1
-                end = doc_node.end_lineno
-                lines[start:end] = formatted
-            else:
-                # Insert after def line
-                insert_at = node.lineno
-                lines[insert_at:insert_at] = formatted
+    file_path may be a path or a ParsedModule; func_name may be a bare
+    name or a qualified name like ``Class.method``. To fix many functions
+    in a file, plan them together with FixPlan or apply_fixes() so the
+    file is parsed and written once.
+    """
+    plan = FixPlan(file_path)
+    if not plan.set_docstring(func_name, new_docstring):
+        return False
 
-            file_path.write_text("\n".join(lines) + "\n")
-            return True
+    plan.apply()
+    return True
 
-    return False
 
 def remove_docstring(file_path, lineno):
     """
     Remove a docstring from a function body.
-    """
-
-    file_path = Path(file_path)
-    lines = file_path.read_text().splitlines()
-
-    # AST lineno is 1-based → convert to 0-based
-    func_def_index = lineno - 1
-
-    # Detect indentation of function body
-    def_line = lines[func_def_index]
-    base_indent = def_line[: len(def_line) - len(def_line.lstrip())]
-    doc_indent = base_indent + " " * 4
-
-    # Find docstring boundaries
-    start_index = None
-    end_index = None
-
-    for i in range(func_def_index + 1, len(lines)):
-        line = lines[i]
-        stripped = line.strip()
-
-        if stripped.startswith(('"""', "'''")):
-            if start_index is None:
-                start_index = i
-                if stripped.count('"""') == 2 or stripped.count("'''") == 2:
-                    end_index = i
-                    break
-            else:
-                end_index = i
-                break
-        elif start_index is not None and not stripped:
-            continue
-        elif start_index is not None:
-            break
-
-    if start_index is not None and end_index is not None:
-        del lines[start_index : end_index + 1]
-        file_path.write_text("\n".join(lines) + "\n")
-        return True
-
-    return False
-
 
+    lineno is the line of the function's ``def``.
+    """
+    plan = FixPlan(file_path)
+    node = plan.function_at(lineno)
+    if node is None or not plan.remove_docstring(node):
+        return False
 
+    plan.apply()
+    return True
@@ -0,0 +1,353 @@
+"""
+Batched docstring fixes: plan every edit of a file, then write it once.
+
+A FixPlan resolves function names against a single parse of the file and
+records each insert, replace or remove as a line range. apply() splices
+the ranges bottom-up, so no edit shifts the lines of one still pending,
+parses the result once to check it and replaces the file atomically.
+"""
+
+import ast
+import os
+import shutil
+from pathlib import Path
+
+from ai_powered.core.parser.parsed_module import MODULE_CACHE, as_module, detect_encoding, hash_bytes
+from ai_powered.core.tracing import span
+
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _leading(line):
+    return line[:len(line) - len(line.lstrip(" \t"))]
+
+
+def _newline(lines):
+    for line in lines:
+        if line.endswith("\r\n"):
+            return "\r\n"
+        if line.endswith("\n"):
+            return "\n"
+    return "\n"
+
+
+def _docstring_node(node):
+    first = node.body[0] if node.body else None
+    if (
+        isinstance(first, ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    ):
+        return first
+    return None
+
+
+class _FunctionIndexer(ast.NodeVisitor):
+    """
+    Qualified names built exactly as the parser's DefinitionCollector
+    builds them, so definitions nested in ``if`` or ``try`` blocks are
+    found too.
+    """
+
+    def __init__(self):
+        self.functions = {}
+        self._scope = []
+
+    def visit_ClassDef(self, node):
+        self._scope.append(node.name)
+        self.generic_visit(node)
+        self._scope.pop()
+
+    def visit_FunctionDef(self, node):
+        qualname = ".".join(self._scope + [node.name])
+        # Like the parser's function map, a later definition wins
+        self.functions[qualname] = node
+        self.functions[qualname.replace(".<locals>", "")] = node
+
+        self._scope.extend([node.name, "<locals>"])
+        self.generic_visit(node)
+        del self._scope[-2:]
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+
+def _index_functions(tree):
+    """
+    Map bare and qualified names to function nodes.
+
+    Qualified names may be given with or without ``<locals>``, and resolve
+    to the last definition as in the parser. A name that is no qualified
+    name at all (e.g. a bare method name) maps to its first definition in
+    ast.walk order.
+    """
+    indexer = _FunctionIndexer()
+    indexer.visit(tree)
+
+    bare = {}
+    for node in ast.walk(tree):
+        if isinstance(node, _FUNCTION_NODES):
+            bare.setdefault(node.name, node)
+
+    return bare | indexer.functions
+
+
+class FixPlan:
+    """
+    Pending docstring edits for one file.
+
+    Each function holds at most one edit; planning it again replaces the
+    earlier one. Nothing is read again or written until apply().
+
+    Args:
+        file_path (str | Path | ParsedModule): File to edit.
+    """
+
+    def __init__(self, file_path):
+        self.module = as_module(file_path)
+        self.path = Path(self.module.path)
+        self._lines = self.module.source.splitlines(keepends=True)
+        self._newline = _newline(self._lines)
+        self._functions = None
+        # id(node) -> (start, end, new lines); ranges are 0-based, end exclusive
+        self._edits = {}
+
+    def __len__(self):
+        return len(self._edits)
+
+    def function(self, func_name):
+        """
+        Return the function node for a bare or qualified name, or None.
+        """
+        if self._functions is None:
+            self._functions = _index_functions(self.module.tree)
+        return self._functions.get(func_name)
+
+    def function_at(self, lineno):
+        """
+        Return the function defined on a line, or None.
+        """
+        for node in ast.walk(self.module.tree):
+            if isinstance(node, _FUNCTION_NODES) and node.lineno == lineno:
+                return node
+        return None
+
+    def set_docstring(self, func_name, new_docstring):
+        """
+        Plan inserting new_docstring (quotes included) or replacing the
+        existing one.
+
+        Returns:
+            bool: False if the function is unknown or its body starts on
+            the ``def`` line, where a line edit cannot place a docstring.
+        """
+        node = func_name if isinstance(func_name, ast.AST) else self.function(func_name)
+        if node is None:
+            return False
+
+        doc_node = _docstring_node(node)
+        if doc_node is not None:
+            start, end = self._statement_lines(doc_node)
+        else:
+            start = self._body_start(node)
+            end = start
+        if start is None:
+            return False
+
+        indent = _leading(self._lines[start]) if start < len(self._lines) else ""
+        formatted = [
+            (indent + line if line.strip() else line) + self._newline
+            for line in new_docstring.splitlines()
+        ]
+        self._edits[id(node)] = (start, end, formatted)
+        return True
+
+    def remove_docstring(self, func_name):
+        """
+        Plan removing a function's docstring, leaving ``pass`` behind when
+        it was the only statement.
+
+        Returns:
+            bool: False if the function is unknown or has no docstring that
+            sits on lines of its own.
+        """
+        node = func_name if isinstance(func_name, ast.AST) else self.function(func_name)
+        doc_node = _docstring_node(node) if node is not None else None
+        if doc_node is None:
+            return False
+
+        start, end = self._statement_lines(doc_node)
+        if start is None:
+            return False
+
+        replacement = []
+        if len(node.body) == 1:
+            replacement = [_leading(self._lines[start]) + "pass" + self._newline]
+        self._edits[id(node)] = (start, end, replacement)
+        return True
+
+    def _body_start(self, node):
+        first = node.body[0]
+        decorators = getattr(first, "decorator_list", None)
+        if decorators:
+            return min(decorator.lineno for decorator in decorators) - 1
+        index = first.lineno - 1
+        if not self._starts_line(index, first.col_offset):
+            return None
+        return index
+
+    def _statement_lines(self, stmt):
+        """
+        Return the (start, end) line range of a statement that has its
+        lines to itself, or (None, None).
+        """
+        start, end = stmt.lineno - 1, stmt.end_lineno
+        if not self._starts_line(start, stmt.col_offset):
+            return None, None
+        tail = self._lines[end - 1].encode("utf-8")[stmt.end_col_offset:]
+        if tail.strip():
+            return None, None
+        return start, end
+
+    def _starts_line(self, index, col_offset):
+        # Indentation is ASCII, so its byte and character lengths agree
+        line = self._lines[index]
+        return len(_leading(line)) == col_offset
+
+    def render(self):
+        """
+        Return the file's source with every planned edit applied.
+
+        Raises:
+            ValueError: Two edits overlap.
+        """
+        edits = sorted(self._edits.values(), key=lambda edit: (edit[0], edit[1]))
+        for previous, current in zip(edits, edits[1:]):
+            if current[0] < previous[1]:
+                raise ValueError(
+                    f"Overlapping docstring edits at lines {previous[0] + 1} and {current[0] + 1} in {self.path}"
+                )
+
+        lines = list(self._lines)
+        if lines and not lines[-1].endswith(("\n", "\r")):
+            lines[-1] += self._newline
+
+        # Bottom-up, so the offsets of edits still to come stay valid
+        for start, end, replacement in reversed(edits):
+            lines[start:end] = replacement
+
+        return "".join(lines)
+
+    def check(self):
+        """
+        Render the edits and make sure they can be written, without
+        writing anything.
+
+        Returns:
+            bytes | None: The new file content, None with no edits.
+
+        Raises:
+            SyntaxError: The edited source does not parse.
+            ValueError: Edits overlap, or the file changed since the plan
+                was made.
+        """
+        if not self._edits:
+            return None
+
+        source = self.render()
+        ast.parse(source, filename=str(self.path))
+
+        data = self.path.read_bytes()
+        if hash_bytes(data) != self.module.content_hash:
+            raise ValueError(f"{self.path} changed since the fixes were planned")
+
+        return source.encode(detect_encoding(data))
+
+    def write(self, data):
+        """
+        Atomically replace the file with data from check().
+
+        Returns:
+            int: Number of functions edited.
+        """
+        if data is not None:
+            _write_atomic(self.path, data)
+            MODULE_CACHE.discard(self.path)
+
+        count = len(self._edits)
+        self._edits.clear()
+        return count
+
+    def apply(self):
+        """
+        Apply every planned edit with a single parse and a single write.
+
+        Returns:
+            int: Number of functions edited; 0 leaves the file untouched.
+
+        Raises:
+            SyntaxError: The edited source does not parse; nothing is
+                written.
+            ValueError: Edits overlap, or the file changed since the plan
+                was made.
+        """
+        if not self._edits:
+            return 0
+
+        with span("writer.plan", "writer", file=str(self.path), edits=len(self._edits)):
+            return self.write(self.check())
+
+
+def _write_atomic(path, data):
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    try:
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def apply_fixes(fixes):
+    """
+    Apply docstring fixes for many functions, one plan and one write per
+    file.
+
+    Args:
+        fixes (iterable): (file_path, func_name, new_docstring) tuples;
+            new_docstring None removes the docstring.
+
+    Every file is rendered and checked before the first one is written,
+    so a fix that would break a file (or a file changed meanwhile) leaves
+    all of them untouched.
+
+    Returns:
+        dict: { file_path: [func_name, ...] } of the fixes that were
+        applied. Unknown functions are left out.
+
+    Raises:
+        SyntaxError: A file would no longer parse; nothing is written.
+        ValueError: A file changed since it was read; nothing is written.
+    """
+    plans = {}
+    applied = {}
+
+    for file_path, func_name, new_docstring in fixes:
+        key = str(file_path.path if hasattr(file_path, "path") else file_path)
+        plan = plans.get(key)
+        if plan is None:
+            plan = plans[key] = FixPlan(file_path)
+
+        if new_docstring is None:
+            done = plan.remove_docstring(func_name)
+        else:
+            done = plan.set_docstring(func_name, new_docstring)
+        if done:
+            applied.setdefault(key, []).append(func_name)
+
+    contents = [(plan, plan.check()) for plan in plans.values()]
+    for plan, data in contents:
+        plan.write(data)
+
+    return applied
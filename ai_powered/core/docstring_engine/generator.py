@@ -2,12 +2,14 @@ from annotated_types import doc
 from ai_powered.core.docstring_engine.llm_integration import (
     generate_docstring_content
 )
+from ai_powered.core.tracing import traced
 
 class DocstringGenerator:
     def __init__(self, style="numpy", use_llm=True):
         self.style = style.lower()
         self.use_llm = use_llm
 
+    @traced("generator.generate", "generator")
     def generate_docstring(self, func_obj):
         content = generate_docstring_content(func_obj) if self.use_llm else {}
 
@@ -14,6 +14,8 @@ from dotenv import load_dotenv
 from langchain_groq import ChatGroq
 from langchain_core.messages import HumanMessage
 
+from ai_powered.core.tracing import span
+
 #load_dotenv()
 from pathlib import Path
 
@@ -152,7 +154,8 @@ Known raises: {raises}
 """
 
     try:
-        response = llm.invoke([HumanMessage(content=prompt)])
+        with span("llm.invoke", "llm", function=fn["name"]):
+            response = llm.invoke([HumanMessage(content=prompt)])
         payload = json.loads(response.content)
         return _validate_and_fix(payload, fn)
 
@@ -0,0 +1,369 @@
+"""
+Git-aware scans: parse only the Python files changed since a ref.
+
+Uses local git plumbing (diff-index, ls-files, cat-file) so a pull-request
+check touches a handful of files instead of the whole tree, and reports
+which functions were added, modified or removed.
+"""
+
+import re
+import subprocess
+from pathlib import Path
+
+from ai_powered.core.parser.guard import ParseGuard
+from ai_powered.core.parser.parsed_module import ParsedModule
+from ai_powered.core.parser.python_parser import (
+    _extract_records,
+    _guarded_file_functions,
+    function_key,
+    module_name,
+)
+from ai_powered.core.parser.walker import DEFAULT_WALKER
+
+
+PYTHON_PATHSPEC = "*.py"
+
+_HUNK_RE = re.compile(rb"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+class GitScanError(RuntimeError):
+    """
+    Raised when git is missing or the path is not inside a repository.
+    """
+
+
+def _git(args, cwd, input=None, check=True):
+    try:
+        result = subprocess.run(
+            ["git", "-c", "core.quotePath=false"] + args,
+            cwd=cwd,
+            input=input,
+            capture_output=True,
+        )
+    except FileNotFoundError as exc:
+        raise GitScanError("git executable not found") from exc
+
+    if check and result.returncode != 0:
+        message = result.stderr.decode("utf-8", "replace").strip()
+        raise GitScanError(f"git {args[0]} failed: {message}")
+
+    return result.stdout
+
+
+def _unquote(path):
+    # git C-quotes paths with unusual characters: "dir/na\303\257ve.py"
+    if path.startswith(b'"') and path.endswith(b'"'):
+        raw = path[1:-1].decode("unicode_escape").encode("latin-1")
+        return raw.decode("utf-8", "surrogateescape")
+    return path.decode("utf-8", "surrogateescape")
+
+
+def repo_root(path):
+    """
+    Return the top-level directory of the repository containing path.
+    """
+    path = Path(path)
+    cwd = path if path.is_dir() else path.parent
+    return Path(_git(["rev-parse", "--show-toplevel"], cwd).decode().strip())
+
+
+def _scope(path):
+    """
+    Return (cwd, pathspec) limiting git commands to path.
+    """
+    path = Path(path)
+    if path.is_file():
+        # Literal, so glob characters in the name are not a pattern
+        return path.parent, f":(literal){path.name}"
+    return path, PYTHON_PATHSPEC
+
+
+def changed_files(path, ref="HEAD", staged=False, walker=None):
+    """
+    List Python files changed since ref.
+
+    Args:
+        path (str | Path): File or directory inside a git work tree.
+        ref (str): Commit to compare against.
+        staged (bool): Compare the index instead of the working tree.
+        walker (TreeWalker | None): Include, exclude and .gitignore rules
+            a changed file must pass, as in a full scan of path.
+
+    Returns:
+        list[dict]: [{ status, path, old_path }] with repository-relative
+        paths; status is one of A, M, D, R.
+    """
+    cwd, pathspec = _scope(path)
+
+    diff_args = ["diff-index", "-z", "--name-status", "-M"]
+    if staged:
+        diff_args.append("--cached")
+    else:
+        # Refresh stat info so touched-but-unchanged files are not reported
+        _git(["update-index", "-q", "--refresh"], cwd, check=False)
+
+    fields = _git(diff_args + [ref, "--", pathspec], cwd).split(b"\0")
+    changes = []
+    i = 0
+
+    while i < len(fields) and fields[i]:
+        status = fields[i].decode()[0]
+        if status in "RC":
+            old_path, new_path = fields[i + 1], fields[i + 2]
+            i += 3
+        else:
+            old_path = new_path = fields[i + 1]
+            i += 2
+
+        if status == "C":
+            status = "A"
+        elif status not in "ADR":
+            status = "M"
+        # An added file has no old version to look up
+        if status == "A":
+            old_path = None
+
+        changes.append({
+            "status": status,
+            "path": _unquote(new_path),
+            "old_path": _unquote(old_path) if old_path is not None else None,
+        })
+
+    if not staged:
+        untracked = _git(
+            ["ls-files", "-z", "--full-name", "--others", "--exclude-standard", "--", pathspec],
+            cwd,
+        )
+        for name in untracked.split(b"\0"):
+            if name:
+                changes.append({"status": "A", "path": _unquote(name), "old_path": None})
+
+    walker = walker or DEFAULT_WALKER
+    path = Path(path).resolve()
+    root = repo_root(path)
+    return [
+        change for change in changes
+        if change["path"].endswith(".py") and walker.matches(path, root / change["path"])
+    ]
+
+
+def _header_name(line):
+    # git ends ---/+++ names that contain a space with a tab
+    name = line[4:]
+    return name[:-1] if name.endswith(b"\t") else name
+
+
+def changed_lines(path, ref="HEAD", staged=False):
+    """
+    Map each changed file to the line ranges its hunks touch.
+
+    Returns:
+        dict: { path: { "old": [(start, end)], "new": [(start, end)] } }
+    """
+    cwd, pathspec = _scope(path)
+
+    args = ["diff-index", "-p", "-U0", "-M", "--no-color"]
+    if staged:
+        args.append("--cached")
+
+    ranges = {}
+    current = None
+    old_name = None
+
+    for line in _git(args + [ref, "--", pathspec], cwd).splitlines():
+        if line.startswith(b"--- "):
+            old_name = _header_name(line)
+        elif line.startswith(b"+++ "):
+            name = _header_name(line)
+            name = name if name != b"/dev/null" else old_name
+            # Strip the a/ or b/ prefix, inside quotes if present
+            if name.startswith(b'"'):
+                name = b'"' + name[3:]
+            else:
+                name = name[2:]
+            current = ranges.setdefault(_unquote(name), {"old": [], "new": []})
+        elif line.startswith(b"@@") and current is not None:
+            match = _HUNK_RE.match(line)
+            if match is None:
+                continue
+            old_start, old_count, new_start, new_count = match.groups()
+            for side, start, count in (
+                ("old", old_start, old_count),
+                ("new", new_start, new_count),
+            ):
+                count = 1 if count is None else int(count)
+                if count:
+                    start = int(start)
+                    current[side].append((start, start + count - 1))
+
+    return ranges
+
+
+def read_blobs(root, specs):
+    """
+    Read many blobs with a single ``git cat-file --batch``.
+
+    Args:
+        specs (list[str]): Object names such as ``HEAD:pkg/mod.py`` or
+            ``:pkg/mod.py`` (the index).
+
+    Returns:
+        dict: { spec: bytes | None }
+    """
+    if not specs:
+        return {}
+
+    output = _git(
+        ["cat-file", "--batch"], root,
+        input=b"".join(spec.encode("utf-8", "surrogateescape") + b"\n" for spec in specs),
+    )
+
+    blobs = {}
+    pos = 0
+
+    for spec in specs:
+        end = output.index(b"\n", pos)
+        header = output[pos:end].split()
+        pos = end + 1
+
+        if len(header) < 3 or header[-1] == b"missing":
+            blobs[spec] = None
+            continue
+
+        size = int(header[2])
+        blobs[spec] = output[pos:pos + size]
+        pos += size + 1
+
+    return blobs
+
+
+def _blob_functions(data, file_path, module):
+    if data is None:
+        return []
+
+    try:
+        tree = ParsedModule.from_bytes(file_path, data).tree
+    except (SyntaxError, ValueError, UnicodeDecodeError):
+        return []
+
+    functions = _extract_records(tree)["functions"]
+    for record in functions:
+        record.set_location(module, file_path)
+    return functions
+
+
+def _touches(record, ranges):
+    start = record["lineno"]
+    end = record["end_lineno"] or start
+    return any(lo <= end and start <= hi for lo, hi in ranges)
+
+
+def diff_functions(old_functions, new_functions, old_ranges, new_ranges):
+    """
+    Compare two versions of a file's functions by qualified name.
+
+    A function present in both is modified when any hunk touches its old
+    or new line range.
+
+    Returns:
+        dict: { added, modified, removed } lists of records.
+    """
+    old_by_name = {record["qualname"]: record for record in old_functions}
+    new_by_name = {record["qualname"]: record for record in new_functions}
+
+    added = [r for name, r in new_by_name.items() if name not in old_by_name]
+    removed = [r for name, r in old_by_name.items() if name not in new_by_name]
+    modified = [
+        record for name, record in new_by_name.items()
+        if name in old_by_name and (
+            _touches(record, new_ranges) or _touches(old_by_name[name], old_ranges)
+        )
+    ]
+
+    return {"added": added, "modified": modified, "removed": removed}
+
+
+def scan_changes(path, ref="HEAD", staged=False, cache=None, guard=None, walker=None):
+    """
+    Parse only the Python files changed since ref.
+
+    Args:
+        path (str | Path): File or directory inside a git work tree; module
+            names are relative to it.
+        ref (str): Commit to compare against, e.g. a merge base.
+        staged (bool): Compare the index instead of the working tree.
+        cache (ParseCache | None): Optional on-disk cache of records.
+        guard (ParseGuard | None): Size and time budgets per file.
+        walker (TreeWalker | None): Include, exclude and .gitignore rules.
+
+    Returns:
+        list[dict]: [{ file_path, status, old_path, added, modified,
+        removed, lines }] in path order; lines holds the changed new-side
+        line ranges.
+    """
+    path = Path(path).resolve()
+    guard = guard if guard is not None else ParseGuard()
+    root = repo_root(path)
+    scan_root = path if path.is_dir() else path.parent
+
+    changes = changed_files(path, ref, staged, walker)
+    hunks = changed_lines(path, ref, staged) if changes else {}
+
+    specs = []
+    for change in changes:
+        if change["old_path"] is not None:
+            specs.append(f"{ref}:{change['old_path']}")
+        if staged and change["status"] != "D":
+            specs.append(f":{change['path']}")
+    blobs = read_blobs(root, specs)
+
+    try:
+        return [
+            _change_set(change, root, scan_root, ref, staged, hunks, blobs, cache, guard)
+            for change in sorted(changes, key=lambda c: c["path"])
+        ]
+    finally:
+        guard.close()
+
+
+def _change_set(change, root, scan_root, ref, staged, hunks, blobs, cache, guard):
+    file_path = root / change["path"]
+    module = module_name(file_path, scan_root)
+    ranges = hunks.get(change["path"], {"old": [], "new": []})
+
+    old_functions = []
+    if change["old_path"] is not None:
+        old_file = root / change["old_path"]
+        old_functions = _blob_functions(
+            blobs.get(f"{ref}:{change['old_path']}"),
+            str(old_file),
+            module_name(old_file, scan_root),
+        )
+
+    if change["status"] == "D":
+        new_functions = []
+    elif staged:
+        new_functions = _blob_functions(blobs.get(f":{change['path']}"), str(file_path), module)
+    else:
+        new_functions = _guarded_file_functions(file_path, scan_root, cache, guard)["functions"]
+
+    result = {
+        "file_path": str(file_path),
+        "status": change["status"],
+        "old_path": str(root / change["old_path"]) if change["old_path"] else None,
+        "lines": ranges["new"],
+    }
+    result.update(diff_functions(old_functions, new_functions, ranges["old"], ranges["new"]))
+    return result
+
+
+def changed_function_map(results):
+    """
+    Flatten scan_changes results into { key: record } for added and
+    modified functions, the shape used by the reporter.
+    """
+    functions = {}
+    for result in results:
+        for record in result["added"] + result["modified"]:
+            functions[function_key(record)] = record
+    return functions
@@ -0,0 +1,310 @@
+"""
+Per-file parse guard: size limits, timeouts and quarantine.
+
+A single pathological file (huge generated module, syntax error, parser
+blow-up) must not stall or abort a whole scan. ParseGuard enforces a byte
+budget before reading, an optional time budget by running the parse in a
+killable child process, and records failures in a Quarantine so later
+scans skip them until their content changes.
+"""
+
+import json
+import multiprocessing
+import os
+from pathlib import Path
+
+from ai_powered.core.parser.parsed_module import hash_bytes, open_source, stat_version
+
+
+DEFAULT_MAX_FILE_BYTES = 10 * 1024 * 1024
+DEFAULT_QUARANTINE_PATH = "storage/cache/quarantine.json"
+
+
+def _empty_result(error=None):
+    return {"functions": [], "classes": [], "error": error}
+
+
+def _file_hash(path):
+    with open_source(path) as data:
+        return hash_bytes(data)
+
+
+class Quarantine:
+    """
+    Files that failed to parse, keyed by path with their content hash.
+
+    Files refused for their size are never read, so they are keyed by stat
+    version alone (their hash is None).
+
+    Args:
+        path (str | Path | None): JSON file to persist to; None keeps the
+            quarantine in memory only.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.entries = {}
+        self._dirty = False
+
+        if self.path is not None and self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def check(self, py_file, stat=None):
+        """
+        Return the entry for a file if it is still quarantined.
+
+        A file leaves quarantine as soon as its content hash changes, or
+        its stat for entries without a hash.
+        """
+        entry = self.entries.get(str(py_file))
+        if entry is None:
+            return None
+
+        try:
+            version = list(stat_version(stat or os.stat(py_file)))
+        except OSError:
+            return None
+
+        # Same stat as when it failed: skip without re-hashing
+        if entry.get("version") == version:
+            return entry
+
+        if entry.get("hash") is None:
+            return None
+
+        if _file_hash(py_file) == entry.get("hash"):
+            entry["version"] = version
+            return entry
+
+        return None
+
+    def add(self, py_file, reason, content_hash, version):
+        self.entries[str(py_file)] = {
+            "reason": reason,
+            "hash": content_hash,
+            "version": list(version) if version else None,
+        }
+        self._dirty = True
+
+    def remove(self, py_file):
+        if self.entries.pop(str(py_file), None) is not None:
+            self._dirty = True
+
+    def clear(self):
+        self.entries = {}
+        self._dirty = True
+        self.save()
+
+    def report(self):
+        """
+        Return quarantined files as [{ file, reason }].
+        """
+        return [
+            {"file": file_path, "reason": entry["reason"]}
+            for file_path, entry in sorted(self.entries.items())
+        ]
+
+    def save(self):
+        """
+        Write the quarantine, dropping entries of files that no longer
+        exist.
+        """
+        if self.path is None:
+            return
+
+        for file_path in [path for path in self.entries if not os.path.exists(path)]:
+            self.remove(file_path)
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.entries, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def _worker_main(conn, func):
+    """
+    Child process loop: run jobs until told to stop.
+    """
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        try:
+            conn.send(("ok", func(*job)))
+        except SyntaxError as exc:
+            conn.send(("syntax_error", f"line {exc.lineno}: {exc.msg}"))
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+class ParseGuard:
+    """
+    Run per-file parse jobs under byte and time budgets.
+
+    Args:
+        max_bytes (int | None): Files larger than this are not read.
+        timeout (float | None): Seconds allowed per file; when set, files are
+            parsed in a child process that is killed on overrun.
+        quarantine (Quarantine | None): Where failures are recorded.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_FILE_BYTES, timeout=None, quarantine=None):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.quarantine = quarantine if quarantine is not None else Quarantine()
+        self._worker = None
+        self._func = None
+
+    def __getstate__(self):
+        # Child process handles stay with the process that started them
+        state = self.__dict__.copy()
+        state["_worker"] = None
+        state["_func"] = None
+        return state
+
+    def run(self, func, py_file, *args):
+        """
+        Call func(py_file, *args) under the guard.
+
+        Returns:
+            dict: { functions, classes, error }; error is None on success or
+            { reason, detail, hash, version, skipped }.
+        """
+        stat, error = self._precheck(py_file)
+        if error is not None:
+            return _empty_result(error)
+
+        if self.timeout is None:
+            try:
+                return self._ok(func(py_file, *args))
+            except SyntaxError as exc:
+                status, payload = "syntax_error", f"line {exc.lineno}: {exc.msg}"
+            except (OSError, UnicodeDecodeError, ValueError, RecursionError, MemoryError) as exc:
+                status, payload = "error", f"{type(exc).__name__}: {exc}"
+        else:
+            status, payload = self._run_in_worker(func, (py_file,) + args)
+            if status == "ok":
+                return self._ok(payload)
+
+        return _empty_result(self._error(py_file, status, payload, stat))
+
+    def precheck(self, py_file):
+        """
+        Return the error of a file refused without reading it (missing,
+        quarantined or too large), or None if it may be parsed.
+        """
+        return self._precheck(py_file)[1]
+
+    def _precheck(self, py_file):
+        try:
+            stat = os.stat(py_file)
+        except OSError as exc:
+            return None, self._error(py_file, "error", str(exc), None)
+
+        entry = self.quarantine.check(py_file, stat)
+        if entry is not None:
+            return stat, {
+                "reason": entry["reason"],
+                "detail": "quarantined",
+                "hash": entry["hash"],
+                "version": entry["version"],
+                "skipped": True,
+            }
+
+        if self.max_bytes is not None and stat.st_size > self.max_bytes:
+            detail = f"{stat.st_size} bytes exceeds limit of {self.max_bytes}"
+            return stat, self._error(py_file, "too_large", detail, stat)
+
+        return stat, None
+
+    def record(self, py_file, result):
+        """
+        Update the quarantine with the outcome of one file.
+
+        Called in the scanning process, so worker processes never write the
+        quarantine file themselves.
+        """
+        error = result.get("error")
+        if error is None:
+            self.quarantine.remove(py_file)
+        elif not error["skipped"]:
+            self.quarantine.add(py_file, error["reason"], error["hash"], error["version"])
+
+    def close(self):
+        """
+        Stop the child process, if one was started.
+        """
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+
+        process, conn = worker
+        try:
+            conn.send(None)
+        except OSError:
+            pass
+        process.join(timeout=1)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        conn.close()
+
+    def _ok(self, records):
+        records["error"] = None
+        return records
+
+    def _error(self, py_file, reason, detail, stat):
+        content_hash = None
+        # Oversized files stay unread; their stat version is the key
+        if reason != "too_large":
+            try:
+                content_hash = _file_hash(py_file)
+            except OSError:
+                pass
+
+        return {
+            "reason": reason,
+            "detail": detail,
+            "hash": content_hash,
+            "version": list(stat_version(stat)) if stat is not None else None,
+            "skipped": False,
+        }
+
+    def _run_in_worker(self, func, job):
+        if self._worker is None or self._func is not func:
+            self.close()
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker_main, args=(child, func), daemon=True
+            )
+            process.start()
+            child.close()
+            self._worker = (process, parent)
+            self._func = func
+
+        process, conn = self._worker
+        conn.send(job)
+
+        if not conn.poll(self.timeout):
+            # Overran its budget: kill the worker, a fresh one starts next time
+            process.kill()
+            process.join()
+            conn.close()
+            self._worker = None
+            return "timeout", f"parse exceeded {self.timeout}s"
+
+        try:
+            return conn.recv()
+        except EOFError:
+            process.join()
+            self._worker = None
+            return "crashed", f"parser process exited with code {process.exitcode}"
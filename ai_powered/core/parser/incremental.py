@@ -0,0 +1,243 @@
+"""
+Incremental rescans driven by a stat snapshot of the scanned tree.
+
+A rescan only stats files; files whose (mtime, size, inode) changed are
+re-parsed and their records are patched into the existing function map.
+"""
+
+import os
+from pathlib import Path
+
+from ai_powered.core.parser.guard import ParseGuard
+from ai_powered.core.parser.python_parser import _scan_files, function_key, module_name
+from ai_powered.core.parser.walker import DEFAULT_WALKER, walk_python_files
+from ai_powered.core.tracing import traced
+
+
+def _stat_key(stat):
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def take_snapshot(root, walker=None):
+    """
+    Stat every Python file under root.
+
+    Returns:
+        dict: { Path: (mtime_ns, size, inode) }
+    """
+    snapshot = {}
+    for py_file in walk_python_files(root, walker):
+        try:
+            snapshot[py_file] = _stat_key(os.stat(py_file))
+        except FileNotFoundError:
+            continue
+    return snapshot
+
+
+def diff_snapshots(old, new):
+    """
+    Compare two snapshots.
+
+    Returns:
+        dict: { added, changed, deleted } lists of paths.
+    """
+    return {
+        "added": sorted(path for path in new if path not in old),
+        "changed": sorted(
+            path for path in new if path in old and old[path] != new[path]
+        ),
+        "deleted": sorted(path for path in old if path not in new),
+    }
+
+
+class IncrementalScanner:
+    """
+    Keep a function map in sync with a directory tree across rescans.
+    """
+
+    def __init__(self, root, cache=None, jobs=1, walker=None, guard=None, index=None):
+        """
+        Create a scanner for one tree.
+
+        Args:
+            root (str | Path): File or directory to keep in sync.
+            cache (ParseCache | None): Optional on-disk cache of records.
+            jobs (int | None): Worker processes; 0 or None uses all cores.
+            walker (TreeWalker | None): Directory walker.
+            guard (ParseGuard | None): Size and time budgets per file.
+            index (FunctionIndex | None): Persistent index kept in step with
+                every rescan.
+        """
+        self.root = Path(root)
+        self.cache = cache
+        self.jobs = jobs
+        self.walker = walker
+        self.guard = guard if guard is not None else ParseGuard()
+        self.index = index
+
+        self.functions = {}
+        self.snapshot = {}
+        self.errors = {}
+        self.documented = 0
+        self._records_by_file = {}
+        self._files_by_key = {}
+
+    def scan(self):
+        """
+        Forget previous state and scan the whole tree.
+        """
+        self.functions.clear()
+        self.snapshot = {}
+        self.errors = {}
+        self.documented = 0
+        self._records_by_file = {}
+        self._files_by_key = {}
+        return self.rescan()
+
+    @traced("parser.rescan", "parser")
+    def rescan(self):
+        """
+        Re-parse only files added, changed or deleted since the last scan.
+
+        Returns:
+            dict: { added, changed, deleted } lists of paths.
+        """
+        snapshot = take_snapshot(self.root, self.walker)
+        changes = diff_snapshots(self.snapshot, snapshot)
+        self._apply(changes, snapshot)
+        return changes
+
+    @traced("parser.update", "parser")
+    def update(self, paths):
+        """
+        Re-check only the given paths, e.g. those reported by a watcher.
+
+        Returns:
+            dict: { added, changed, deleted } lists of paths.
+        """
+        walker = self.walker or DEFAULT_WALKER
+        snapshot = dict(self.snapshot)
+        changes = {"added": [], "changed": [], "deleted": []}
+
+        for path in sorted({Path(p) for p in paths}):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                if snapshot.pop(path, None) is not None:
+                    changes["deleted"].append(path)
+                continue
+
+            if path in snapshot:
+                key = _stat_key(stat)
+                if snapshot[path] != key:
+                    snapshot[path] = key
+                    changes["changed"].append(path)
+            elif walker.includes(self.root, path):
+                snapshot[path] = _stat_key(stat)
+                changes["added"].append(path)
+
+        self._apply(changes, snapshot)
+        return changes
+
+    def metrics(self):
+        """
+        Return coverage metrics from the running documented count.
+
+        Returns:
+            dict: { total_functions, documented, coverage_percent }
+        """
+        total = len(self.functions)
+        return {
+            "total_functions": total,
+            "documented": self.documented,
+            "coverage_percent": round((self.documented / total) * 100, 2) if total else 0
+        }
+
+    def _apply(self, changes, snapshot):
+        to_parse = changes["added"] + changes["changed"]
+        root = self.root.parent if self.root.is_file() else self.root
+        parsed = _scan_files(to_parse, root, self.cache, self.jobs, self.guard)
+
+        touched = set()
+
+        for py_file in changes["deleted"] + changes["changed"]:
+            touched.update(self._forget_file(py_file))
+
+        for py_file, records in zip(to_parse, parsed):
+            self.guard.record(py_file, records)
+            if records["error"] is not None:
+                self.errors[py_file] = records["error"]
+
+            by_key = {
+                function_key(record): record for record in records["functions"]
+            }
+            self._records_by_file[py_file] = by_key
+            for key in by_key:
+                self._files_by_key.setdefault(key, set()).add(py_file)
+                touched.add(key)
+
+        for key in touched:
+            self._resolve_key(key)
+
+        if self.index is not None:
+            self._update_index(changes, to_parse, snapshot, root)
+
+        self.guard.quarantine.save()
+        self.snapshot = snapshot
+
+    @traced("index.update", "reporter")
+    def _update_index(self, changes, parsed_files, snapshot, root):
+        with self.index.transaction():
+            if not self.snapshot:
+                # First scan of this session: drop files deleted since the
+                # index was last written
+                self.index.retain_files(snapshot)
+
+            for py_file in changes["deleted"]:
+                self.index.remove_file(py_file)
+
+            for py_file in parsed_files:
+                self.index.upsert_file(
+                    py_file, self._records_by_file[py_file], module_name(py_file, root)
+                )
+
+    @property
+    def quarantined(self):
+        """
+        Return files of the current tree that failed to parse.
+
+        Returns:
+            list[dict]: [{ file, reason, detail }]
+        """
+        return [
+            {"file": str(py_file), "reason": error["reason"], "detail": error["detail"]}
+            for py_file, error in sorted(self.errors.items())
+        ]
+
+    def _forget_file(self, py_file):
+        self.errors.pop(py_file, None)
+        records = self._records_by_file.pop(py_file, {})
+        for key in records:
+            owners = self._files_by_key.get(key)
+            if owners is not None:
+                owners.discard(py_file)
+        return records.keys()
+
+    def _resolve_key(self, key):
+        # Keys are module-qualified, so a key normally has one owner; if
+        # two paths map to the same module, match a full scan where the
+        # last file in sorted order wins.
+        owners = self._files_by_key.get(key)
+        previous = self.functions.get(key)
+        if previous is not None and previous.get("docstring"):
+            self.documented -= 1
+
+        if not owners:
+            self._files_by_key.pop(key, None)
+            self.functions.pop(key, None)
+            return
+
+        record = self._records_by_file[max(owners)][key]
+        self.functions[key] = record
+        if record.get("docstring"):
+            self.documented += 1
@@ -0,0 +1,141 @@
+"""
+On-disk cache of extracted function records.
+
+Entries are keyed by a hash of the file content plus the parser version,
+so a file whose bytes did not change is never decoded or parsed again.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+DEFAULT_CACHE_DIR = "storage/cache/parse"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def content_key(content_hash, version):
+    """
+    Build a cache key from a file's content hash and a parser version.
+
+    Returns:
+        str: Hex digest identifying this content for this parser version.
+    """
+    return hashlib.sha256(f"{version}\0{content_hash}".encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """
+    Content-addressed JSON store with size-based LRU eviction.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """
+        Return the cached records for a key, or None on a miss.
+        """
+        entry = self._entry_path(key)
+
+        try:
+            records = json.loads(entry.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        # Touch the entry so eviction drops the least recently used first
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        return records
+
+    def put(self, key, records):
+        """
+        Store records for a key, replacing any previous entry atomically.
+        """
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(records), encoding="utf-8")
+        os.replace(tmp, entry)
+
+    def discard(self, key):
+        """
+        Drop a single entry if present.
+        """
+        try:
+            self._entry_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """
+        Invalidate the whole cache.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        removed = 0
+        if not self.cache_dir.exists():
+            return removed
+
+        for entry in self.cache_dir.glob("*/*.json"):
+            try:
+                entry.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+
+        return removed
+
+    def size(self):
+        """
+        Return the total size of all entries in bytes.
+        """
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def prune(self):
+        """
+        Evict least recently used entries until the cache fits max_bytes.
+
+        Returns:
+            int: Number of entries evicted.
+        """
+        entries = self._entries()
+        total = sum(stat.st_size for _, stat in entries)
+
+        if total <= self.max_bytes:
+            return 0
+
+        evicted = 0
+        for entry, stat in sorted(entries, key=lambda item: item[1].st_mtime_ns):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except FileNotFoundError:
+                continue
+            total -= stat.st_size
+            evicted += 1
+
+        return evicted
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+
+        entries = []
+        for entry in self.cache_dir.glob("*/*.json"):
+            try:
+                entries.append((entry, entry.stat()))
+            except FileNotFoundError:
+                pass
+        return entries
@@ -0,0 +1,325 @@
+"""
+Parse-once module objects shared by the parser, validator, writer and metrics.
+
+A ParsedModule holds the decoded source, line offsets, AST and content hash
+of one version of a file. Modules are kept in an LRU cache keyed by path and
+bounded by their estimated memory (source, plus the AST once parsed); an
+entry is reused only while the file's (mtime, size, inode) is unchanged.
+"""
+
+import ast
+import bisect
+import hashlib
+import io
+import mmap
+import os
+import re
+import threading
+import tokenize
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+
+
+DEFAULT_MAX_SOURCE_BYTES = 64 * 1024 * 1024
+
+# Memory an AST holds per byte of source (tracemalloc on this repository
+# gives about 30); a parsed module is charged for it
+AST_BYTES_PER_SOURCE_BYTE = 30
+
+# Files at least this large are memory-mapped instead of read into bytes.
+MMAP_MIN_BYTES = 1024 * 1024
+
+# A def or class keyword preceded by a non-identifier byte (or file start)
+_DEFINITION_RE = re.compile(rb"(?:^|[^\w])(?:def|class)[ \t\f\\]", re.MULTILINE)
+
+
+def hash_bytes(data):
+    """
+    Return the content hash used for cache keys.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+@contextmanager
+def open_source(path):
+    """
+    Yield the raw bytes of a file, memory-mapped when it is large.
+
+    The buffer supports ``find``, slicing, hashing and decoding either way;
+    a mapping is closed when the block exits.
+    """
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+
+        if size < MMAP_MIN_BYTES or size == 0:
+            yield handle.read()
+            return
+
+        buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield buffer
+        finally:
+            buffer.close()
+
+
+def may_contain_definitions(data):
+    """
+    Cheap byte scan: False only if the source cannot define a function or
+    class, so ast.parse can be skipped entirely.
+    """
+    if data.find(b"def") == -1 and data.find(b"class") == -1:
+        return False
+    return _DEFINITION_RE.search(data) is not None
+
+
+def detect_encoding(data):
+    """
+    Return the source encoding from a BOM or PEP 263 cookie.
+
+    Only the first two lines are inspected, so the buffer is never copied
+    as a whole.
+    """
+    first = data.find(b"\n")
+    second = data.find(b"\n", first + 1) if first != -1 else -1
+    head = data[:second + 1] if second != -1 else data[:]
+    encoding, _ = tokenize.detect_encoding(io.BytesIO(head).readline)
+    return encoding
+
+
+def decode_source(data):
+    """
+    Decode Python source bytes honouring BOMs and PEP 263 coding cookies.
+
+    Works directly on bytes or an mmap buffer.
+    """
+    return str(data, detect_encoding(data))
+
+
+def stat_version(stat):
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class ParsedModule:
+    """
+    One version of a Python file, parsed at most once.
+    """
+
+    def __init__(self, path, source, content_hash, version=None, size=None):
+        self.path = str(path)
+        self.source = source
+        self.content_hash = content_hash
+        self.version = version
+        self.size = len(source) if size is None else size
+        self._tree = None
+        self._line_offsets = None
+        # The ModuleCache holding this module, told when the AST is parsed
+        self._cache = None
+
+    def __getstate__(self):
+        # Sent to worker processes as source; the AST is cheaper to rebuild
+        # there than to pickle
+        state = self.__dict__.copy()
+        state["_tree"] = None
+        state["_line_offsets"] = None
+        state["_cache"] = None
+        return state
+
+    @property
+    def footprint(self):
+        """
+        Estimated bytes held: the source, plus the AST once parsed.
+        """
+        if self._tree is None:
+            return self.size
+        return self.size * (1 + AST_BYTES_PER_SOURCE_BYTE)
+
+    @classmethod
+    def from_bytes(cls, path, data, version=None):
+        return cls(path, decode_source(data), hash_bytes(data), version, len(data))
+
+    @classmethod
+    def from_source(cls, source, path="<string>"):
+        return cls(path, source, hash_bytes(source.encode("utf-8")))
+
+    @property
+    def tree(self):
+        """
+        The module AST, parsed on first access.
+        """
+        if self._tree is None:
+            self._tree = ast.parse(self.source, filename=self.path)
+            if self._cache is not None:
+                self._cache.resize(self)
+        return self._tree
+
+    @property
+    def line_offsets(self):
+        """
+        Character offset of the start of every line (1-based line n is
+        ``line_offsets[n - 1]``).
+        """
+        if self._line_offsets is None:
+            offsets = [0]
+            find = self.source.find
+            pos = find("\n")
+            while pos != -1:
+                offsets.append(pos + 1)
+                pos = find("\n", pos + 1)
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    @property
+    def line_count(self):
+        offsets = self.line_offsets
+        # A trailing newline does not start another line
+        if len(offsets) > 1 and offsets[-1] == len(self.source):
+            return len(offsets) - 1
+        return len(offsets)
+
+    def line(self, lineno):
+        """
+        Return 1-based line lineno without its line ending.
+        """
+        offsets = self.line_offsets
+        start = offsets[lineno - 1]
+        end = offsets[lineno] if lineno < len(offsets) else len(self.source)
+        return self.source[start:end].rstrip("\r\n")
+
+    def lineno_at(self, offset):
+        """
+        Return the 1-based line containing a character offset.
+        """
+        return bisect.bisect_right(self.line_offsets, offset)
+
+
+class ModuleCache:
+    """
+    LRU cache of ParsedModule objects bounded by their estimated memory.
+
+    A module is charged its footprint: source bytes, and the AST's
+    estimated size from the moment it is parsed.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_SOURCE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        # path -> (module, bytes charged)
+        self._modules = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._modules)
+
+    def get(self, path, version):
+        """
+        Return the cached module for path if its version still matches.
+        """
+        key = str(path)
+        with self._lock:
+            entry = self._modules.get(key)
+            if entry is None or entry[0].version != version:
+                return None
+            self._modules.move_to_end(key)
+            return entry[0]
+
+    def add(self, module):
+        """
+        Insert or replace a module, evicting the least recently used ones.
+        """
+        with self._lock:
+            self._pop(module.path)
+
+            charge = module.footprint
+            if charge > self.max_bytes:
+                return module
+
+            module._cache = self
+            self._modules[module.path] = (module, charge)
+            self.total_bytes += charge
+            self._evict()
+
+        return module
+
+    def resize(self, module):
+        """
+        Charge a cached module's current footprint, e.g. after its AST was
+        parsed, evicting others (or the module itself) to stay in budget.
+        """
+        with self._lock:
+            entry = self._modules.get(module.path)
+            if entry is None or entry[0] is not module:
+                return
+
+            charge = module.footprint
+            if charge > self.max_bytes:
+                self._pop(module.path)
+                return
+
+            self._modules[module.path] = (module, charge)
+            self._modules.move_to_end(module.path)
+            self.total_bytes += charge - entry[1]
+            self._evict()
+
+    def discard(self, path):
+        with self._lock:
+            self._pop(str(path))
+
+    def clear(self):
+        with self._lock:
+            for module, _ in self._modules.values():
+                module._cache = None
+            self._modules.clear()
+            self.total_bytes = 0
+
+    def _pop(self, key):
+        entry = self._modules.pop(key, None)
+        if entry is not None:
+            entry[0]._cache = None
+            self.total_bytes -= entry[1]
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes:
+            _, (evicted, charge) = self._modules.popitem(last=False)
+            evicted._cache = None
+            self.total_bytes -= charge
+
+    def load(self, path, data=None):
+        """
+        Return the ParsedModule for the current version of path.
+
+        Args:
+            path (str | Path): File to load.
+            data (bytes | None): File bytes if the caller already read them.
+        """
+        path = Path(path)
+        version = stat_version(os.stat(path))
+
+        module = self.get(path, version)
+        if module is not None:
+            return module
+
+        if data is None:
+            with open_source(path) as buffer:
+                return self.add(ParsedModule.from_bytes(path, buffer, version))
+
+        return self.add(ParsedModule.from_bytes(path, data, version))
+
+
+MODULE_CACHE = ModuleCache()
+
+
+def load_module(path, cache=None):
+    """
+    Return the shared ParsedModule for a file.
+    """
+    return (MODULE_CACHE if cache is None else cache).load(path)
+
+
+def as_module(file_or_module):
+    """
+    Accept either a ParsedModule or a path and return a ParsedModule.
+    """
+    if isinstance(file_or_module, ParsedModule):
+        return file_or_module
+    return load_module(file_or_module)
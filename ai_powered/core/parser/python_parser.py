@@ -28,57 +28,419 @@ class PythonParser:
 '''
 
 import ast
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from ai_powered.core.parser.guard import ParseGuard
+from ai_powered.core.parser.parse_cache import content_key
+from ai_powered.core.parser.parsed_module import (
+    MODULE_CACHE,
+    hash_bytes,
+    may_contain_definitions,
+    open_source,
+)
+from ai_powered.core.parser.records import ArgRecord, FunctionRecord
+from ai_powered.core.parser.walker import walk_python_files
+from ai_powered.core.tracing import span, traced
 
-class PythonParser:
-    def extract_functions(self, folder_path):
-        folder = Path(folder_path)
-        functions = {}
 
-        for py_file in folder.rglob("*.py"):
-            source = py_file.read_text()
-            tree = ast.parse(source, filename=str(py_file))
+# Bump whenever the shape of extracted records changes so stale cache
+# entries are never served.
+PARSER_VERSION = "4"
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    docstring = ast.get_docstring(node)
+# Below this many files a process pool costs more than it saves.
+PARALLEL_MIN_FILES = 64
 
-                    # ---- Extract arguments with type hints ----
-                    args = []
-                    for arg in node.args.args:
-                        arg_info = {
-                            "name": arg.arg,
-                            "type": ast.unparse(arg.annotation) if arg.annotation else None
-                        }
-                        args.append(arg_info)
+# Upper bound on files handed to a worker at once when streaming.
+MAX_BATCH_FILES = 32
 
-                    # ---- Extract return type hint ----
-                    return_type = ast.unparse(node.returns) if node.returns else None
 
-                    functions[node.name] = {
-                        "name": node.name,
-                        "args": args,                      # <-- list of dicts
-                        "returns": return_type,            # <-- NEW
-                        "docstring": docstring or "",
-                        "has_docstring": bool(docstring),
-                        "file": str(py_file),
-                        "lineno": node.lineno,
-                        "end_lineno": node.end_lineno or node.lineno
-                    }
+def _docstring_lines(node):
+    """
+    Return the (start, end) lines of a node's docstring, or (None, None).
+    """
+    if not ast.get_docstring(node, clean=False):
+        return None, None
+    doc_node = node.body[0]
+    return doc_node.lineno, doc_node.end_lineno
 
-        return functions
-    
 
+def _arg_record(arg, prefix=""):
+    annotation = ast.unparse(arg.annotation) if arg.annotation else None
+    return ArgRecord(prefix + arg.arg, annotation)
 
-def parse_path(folder_path):
+
+class DefinitionCollector(ast.NodeVisitor):
+    """
+    Collect functions, methods and classes in a single pass over a module.
+
+    Qualified names follow Python's __qualname__ rules, e.g.
+    ``Class.method`` or ``outer.<locals>.inner``. Cyclomatic complexity
+    is counted during the same traversal.
+    """
+
+    def __init__(self):
+        self.functions = []
+        self.classes = []
+        self._scope = []
+        self._in_class = []
+        self._open_functions = []
+
+    def _qualname(self, name):
+        return ".".join(self._scope + [name])
+
+    def visit_ClassDef(self, node):
+        docstring = ast.get_docstring(node)
+        doc_start, doc_end = _docstring_lines(node)
+
+        self.classes.append({
+            "name": node.name,
+            "qualname": self._qualname(node.name),
+            "kind": "class",
+            "docstring": docstring or "",
+            "has_docstring": bool(docstring),
+            "docstring_lineno": doc_start,
+            "docstring_end_lineno": doc_end,
+            "is_public": not node.name.startswith("_"),
+            "lineno": node.lineno,
+            "end_lineno": node.end_lineno or node.lineno
+        })
+
+        self._scope.append(node.name)
+        self._in_class.append(True)
+        self.generic_visit(node)
+        self._in_class.pop()
+        self._scope.pop()
+
+    def visit_FunctionDef(self, node):
+        self._visit_function(node, is_async=False)
+
+    def visit_AsyncFunctionDef(self, node):
+        self._visit_function(node, is_async=True)
+
+    def _visit_function(self, node, is_async):
+        docstring = ast.get_docstring(node)
+        doc_start, doc_end = _docstring_lines(node)
+
+        # ---- Extract arguments with type hints, in signature order ----
+        # *args and **kwargs keep their stars
+        arguments = node.args
+        args = [_arg_record(arg) for arg in arguments.posonlyargs + arguments.args]
+        if arguments.vararg is not None:
+            args.append(_arg_record(arguments.vararg, "*"))
+        args.extend(_arg_record(arg) for arg in arguments.kwonlyargs)
+        if arguments.kwarg is not None:
+            args.append(_arg_record(arguments.kwarg, "**"))
+
+        # ---- Extract return type hint ----
+        return_type = ast.unparse(node.returns) if node.returns else None
+
+        is_method = bool(self._in_class) and self._in_class[-1]
+
+        self.functions.append(FunctionRecord(
+            name=node.name,
+            qualname=self._qualname(node.name),
+            kind="method" if is_method else "function",
+            is_async=is_async,
+            args=args,
+            returns=return_type,
+            docstring=docstring or "",
+            has_docstring=bool(docstring),
+            docstring_lineno=doc_start,
+            docstring_end_lineno=doc_end,
+            is_public=not node.name.startswith("_"),
+            lineno=node.lineno,
+            end_lineno=node.end_lineno or node.lineno,
+            complexity=1
+        ))
+
+        self._scope.extend([node.name, "<locals>"])
+        self._in_class.append(False)
+        self._open_functions.append(self.functions[-1])
+        self.generic_visit(node)
+        self._open_functions.pop()
+        self._in_class.pop()
+        del self._scope[-2:]
+
+    # ---- McCabe complexity: +1 per decision point in the enclosing function ----
+    def _branch(self, node, weight=1):
+        if self._open_functions:
+            self._open_functions[-1].complexity += weight
+        self.generic_visit(node)
+
+    visit_If = visit_IfExp = visit_For = visit_AsyncFor = visit_While = _branch
+    visit_ExceptHandler = visit_Assert = visit_match_case = _branch
+
+    def visit_comprehension(self, node):
+        self._branch(node, 1 + len(node.ifs))
+
+    def visit_BoolOp(self, node):
+        self._branch(node, len(node.values) - 1)
+
+
+def _extract_records(tree):
+    """
+    Extract function and class metadata from a parsed module.
+
+    Records do not carry the file path so they can be cached by content.
+
+    Returns:
+        dict: { functions, classes }
+    """
+    collector = DefinitionCollector()
+    collector.visit(tree)
+
+    return {
+        "functions": collector.functions,
+        "classes": collector.classes
+    }
+
+
+def module_name(py_file, root=None):
+    """
+    Return the dotted module name of a file relative to the scan root.
+    """
+    py_file = Path(py_file)
+
+    try:
+        parts = list(py_file.relative_to(root).parts) if root else []
+    except ValueError:
+        parts = []
+
+    if not parts:
+        parts = [py_file.name]
+
+    parts[-1] = parts[-1][:-3] if parts[-1].endswith(".py") else parts[-1]
+    if parts[-1] == "__init__" and len(parts) > 1:
+        parts.pop()
+
+    return ".".join(parts)
+
+
+def function_key(record):
+    """
+    Return the stable key of a record: ``module:Class.method``.
+    """
+    return f"{record['module']}:{record['qualname']}"
+
+
+@traced("parser.file", "parser")
+def _file_functions(py_file, root=None, cache=None):
+    """
+    Return the definitions of one file, using the cache if given.
+
+    Returns:
+        dict: { functions, classes }
+    """
+    with open_source(py_file) as data:
+        if not may_contain_definitions(data):
+            # e.g. empty __init__.py or constants modules: nothing to parse
+            records = {"functions": [], "classes": []}
+        elif cache is None:
+            records = _extract_records(MODULE_CACHE.load(py_file, data).tree)
+        else:
+            records = _cached_records(py_file, data, cache)
+
+    file_path = str(py_file)
+    module = module_name(py_file, root)
+    for record in records["functions"]:
+        record.set_location(module, file_path)
+    for record in records["classes"]:
+        record["module"] = module
+        record["file"] = file_path
+
+    return records
+
+
+def _cached_records(py_file, data, cache):
+    key = content_key(hash_bytes(data), PARSER_VERSION)
+    cached = cache.get(key)
+
+    if cached is None:
+        records = _extract_records(MODULE_CACHE.load(py_file, data).tree)
+        cache.put(key, {
+            "functions": [r.to_dict(location=False) for r in records["functions"]],
+            "classes": records["classes"]
+        })
+        return records
+
+    return {
+        "functions": [FunctionRecord.from_dict(r) for r in cached["functions"]],
+        "classes": cached["classes"]
+    }
+
+
+def _resolve_jobs(jobs):
+    """
+    Turn a jobs option into a worker count (0 or None means all cores).
+    """
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, int(jobs))
+
+
+def _guarded_file_functions(py_file, root=None, cache=None, guard=None):
+    """
+    Return the definitions of one file, under the parse guard if given.
+
+    Returns:
+        dict: { functions, classes } plus "error" when guarded.
+    """
+    if guard is None:
+        return _file_functions(py_file, root, cache)
+    return guard.run(_file_functions, py_file, root, cache)
+
+
+def _file_batch(files, root=None, cache=None, guard=None):
+    try:
+        return [_guarded_file_functions(py_file, root, cache, guard) for py_file in files]
+    finally:
+        if guard is not None:
+            guard.close()
+
+
+def _iter_scan(files, root=None, cache=None, jobs=1, guard=None):
+    """
+    Parse files and yield (path, definitions) as each file finishes.
+
+    Results come back in the order of files. In parallel mode only a
+    bounded window of batches is in flight, so memory stays flat.
+    """
+    workers = _resolve_jobs(jobs)
+
+    if workers == 1 or len(files) < PARALLEL_MIN_FILES:
+        try:
+            for py_file in files:
+                yield py_file, _guarded_file_functions(py_file, root, cache, guard)
+        finally:
+            if guard is not None:
+                guard.close()
+        return
+
+    workers = min(workers, len(files))
+    batch_size = min(MAX_BATCH_FILES, max(1, len(files) // (workers * 4)))
+    window = workers * 2
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(files), batch_size):
+            batch = files[start:start + batch_size]
+            pending.append((batch, pool.submit(_file_batch, batch, root, cache, guard)))
+
+            if len(pending) >= window:
+                batch, future = pending.popleft()
+                yield from zip(batch, future.result())
+
+        while pending:
+            batch, future = pending.popleft()
+            yield from zip(batch, future.result())
+
+
+def _scan_files(files, root=None, cache=None, jobs=1, guard=None):
+    """
+    Parse files, serially or across a process pool.
+
+    Returns:
+        list[dict]: { functions, classes } per file, in the order of files.
+    """
+    return [records for _, records in _iter_scan(files, root, cache, jobs, guard)]
+
+
+def _python_files(path, walker=None):
+    """
+    Return the Python files under path in a stable order.
+
+    Sorted so results are identical however the work is split.
+    """
+    return walk_python_files(path, walker)
+
+
+class PythonParser:
+    def __init__(self, cache=None, jobs=1, walker=None, guard=None):
+        """
+        Create a parser.
+
+        Args:
+            cache (ParseCache | None): Optional on-disk cache of records.
+            jobs (int | None): Worker processes; 0 or None uses all cores.
+            walker (TreeWalker | None): Directory walker; the default prunes
+                vendored directories and honours .gitignore.
+            guard (ParseGuard | None): Size and time budgets per file; files
+                that fail are quarantined instead of aborting the scan.
+        """
+        self.cache = cache
+        self.jobs = jobs
+        self.walker = walker
+        self.guard = guard if guard is not None else ParseGuard()
+        self.quarantined = []
+
+    def extract_functions(self, folder_path):
+        functions = {}
+
+        with span("parser.scan", "parser", path=str(folder_path)) as scan:
+            for parsed in self.iter_files(folder_path):
+                for record in parsed["functions"]:
+                    functions[function_key(record)] = record
+            scan.set(functions=len(functions))
+
+        return functions
+
+    def iter_files(self, path):
+        """
+        Yield { file_path, functions, classes, error } for each file as it
+        is parsed. error is None unless the file was quarantined.
+        """
+        root = Path(path)
+        with span("parser.walk", "parser") as walk:
+            files = _python_files(root, self.walker)
+            walk.set(files=len(files))
+        if root.is_file():
+            root = root.parent
+
+        self.quarantined = []
+
+        for py_file, records in _iter_scan(files, root, self.cache, self.jobs, self.guard):
+            self.guard.record(py_file, records)
+
+            error = records["error"]
+            if error is not None:
+                self.quarantined.append({
+                    "file": str(py_file),
+                    "reason": error["reason"],
+                    "detail": error["detail"]
+                })
+
+            yield {
+                "file_path": str(py_file),
+                "functions": records["functions"],
+                "classes": records["classes"],
+                "error": error
+            }
+
+        self.guard.quarantine.save()
+
+        if self.cache is not None:
+            self.cache.prune()
+
+    def iter_functions(self, path):
+        """
+        Yield function records one at a time, file by file.
+        """
+        for parsed in self.iter_files(path):
+            yield from parsed["functions"]
+
+
+
+def parse_path(folder_path, cache=None, jobs=1, walker=None):
     """
     Parse all Python files in a folder.
 
     Returns:
         list[dict]: [{ file_path, functions }]
     """
-    parser = PythonParser()
+    parser = PythonParser(cache=cache, jobs=jobs, walker=walker)
     functions = parser.extract_functions(folder_path)
 
     return [{
@@ -87,45 +449,42 @@ def parse_path(folder_path):
     }]
 
 
-def parse_file(file_path):
+def iter_files(path, cache=None, jobs=1, walker=None):
     """
-    Parse a single Python file.
+    Stream parse results per file without building the whole tree in memory.
 
-    Returns:
-        dict: { file_path, functions }
+    Yields:
+        dict: { file_path, functions, classes }
     """
-    file_path = Path(file_path)
-    parser = PythonParser()
+    return PythonParser(cache=cache, jobs=jobs, walker=walker).iter_files(path)
 
-    source = file_path.read_text()
-    tree = ast.parse(source, filename=str(file_path))
 
-    functions = []
+def iter_functions(path, cache=None, jobs=1, walker=None):
+    """
+    Stream function records from every Python file under path.
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            docstring = ast.get_docstring(node)
+    Yields:
+        dict: One function record at a time.
+    """
+    return PythonParser(cache=cache, jobs=jobs, walker=walker).iter_functions(path)
 
-            args = [{
-                "name": arg.arg,
-                "type": ast.unparse(arg.annotation) if arg.annotation else None
-            } for arg in node.args.args]
 
-            functions.append({
-                "name": node.name,
-                "args": args,
-                "returns": ast.unparse(node.returns) if node.returns else None,
-                "docstring": docstring or "",
-                "has_docstring": bool(docstring),
-                "file": str(file_path),
-                "lineno": node.lineno,
-                "end_lineno": node.end_lineno or node.lineno
-            })
+def parse_file(file_path, cache=None):
+    """
+    Parse a single Python file.
+
+    Returns:
+        dict: { file_path, functions, classes }
+    """
+    file_path = Path(file_path)
+    records = _file_functions(file_path, file_path.parent, cache)
 
     return {
         "file_path": str(file_path),
-        "functions": functions
+        "functions": records["functions"],
+        "classes": records["classes"]
     }
+
 '''
 
 import ast
@@ -0,0 +1,166 @@
+"""
+Compact function records.
+
+FunctionRecord and ArgRecord use __slots__ instead of per-instance dicts and
+intern repeated strings (file paths, module names, argument names), which
+cuts memory per function several times over on large scans. Both implement
+the mapping protocol, so existing callers can keep using ``fn["name"]``,
+``fn.get("docstring")`` and ``"args" in fn``.
+"""
+
+import sys
+from collections.abc import MutableMapping
+
+
+def _intern(value):
+    return sys.intern(value) if value is not None else None
+
+
+class _SlotMapping(MutableMapping):
+    """
+    Mapping view over a fixed set of slots.
+    """
+
+    __slots__ = ()
+    FIELDS = ()
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self._field_set:
+            raise KeyError(f"{type(self).__name__} has no field {key!r}")
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        raise TypeError(f"{type(self).__name__} fields cannot be deleted")
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        return (type(self)._restore, tuple(getattr(self, name) for name in self.FIELDS))
+
+    @classmethod
+    def _restore(cls, *values):
+        return cls(**dict(zip(cls.FIELDS, values)))
+
+
+class ArgRecord(_SlotMapping):
+    """
+    One function parameter: name and optional type annotation.
+    """
+
+    FIELDS = ("name", "type")
+    __slots__ = FIELDS
+    _field_set = frozenset(FIELDS)
+
+    def __init__(self, name, type=None):
+        self.name = sys.intern(name)
+        self.type = _intern(type)
+
+    def to_dict(self):
+        return {"name": self.name, "type": self.type}
+
+
+class FunctionRecord(_SlotMapping):
+    """
+    Metadata for one function or method.
+    """
+
+    FIELDS = (
+        "name",
+        "qualname",
+        "kind",
+        "is_async",
+        "args",
+        "returns",
+        "docstring",
+        "has_docstring",
+        "docstring_lineno",
+        "docstring_end_lineno",
+        "is_public",
+        "lineno",
+        "end_lineno",
+        "complexity",
+        "module",
+        "file",
+    )
+    __slots__ = FIELDS
+    _field_set = frozenset(FIELDS)
+
+    # Fields that depend on where the file lives rather than its content
+    LOCATION_FIELDS = ("module", "file")
+
+    def __init__(
+        self,
+        name,
+        qualname=None,
+        kind="function",
+        is_async=False,
+        args=(),
+        returns=None,
+        docstring="",
+        has_docstring=None,
+        docstring_lineno=None,
+        docstring_end_lineno=None,
+        is_public=None,
+        lineno=None,
+        end_lineno=None,
+        complexity=1,
+        module=None,
+        file=None,
+    ):
+        self.name = sys.intern(name)
+        self.qualname = qualname or self.name
+        self.kind = sys.intern(kind)
+        self.is_async = is_async
+        self.args = [
+            arg if isinstance(arg, ArgRecord) else ArgRecord(arg["name"], arg.get("type"))
+            for arg in args
+        ]
+        self.returns = _intern(returns)
+        self.docstring = docstring or ""
+        self.has_docstring = bool(docstring) if has_docstring is None else has_docstring
+        self.docstring_lineno = docstring_lineno
+        self.docstring_end_lineno = docstring_end_lineno
+        self.is_public = not name.startswith("_") if is_public is None else is_public
+        self.lineno = lineno
+        self.end_lineno = end_lineno
+        self.complexity = complexity
+        self.module = _intern(module)
+        self.file = _intern(file)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{key: value for key, value in data.items() if key in cls._field_set})
+
+    def to_dict(self, location=True):
+        """
+        Return a plain dict copy, e.g. for JSON.
+
+        Args:
+            location (bool): Include module and file; the parse cache stores
+                records without them so entries can be shared by content.
+        """
+        data = {name: getattr(self, name) for name in self.FIELDS}
+        data["args"] = [arg.to_dict() for arg in self.args]
+
+        if not location:
+            for name in self.LOCATION_FIELDS:
+                del data[name]
+
+        return data
+
+    def set_location(self, module, file):
+        self.module = sys.intern(module)
+        self.file = sys.intern(file)
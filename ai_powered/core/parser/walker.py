@@ -0,0 +1,364 @@
+"""
+Pruned, ignore-aware directory walker shared by every scan entry point.
+
+Directories such as ``.git``, virtualenvs and ``node_modules`` are pruned
+before they are entered, ``.gitignore`` files are honoured as the walk
+descends, and symlinked directories are never visited twice.
+"""
+
+import os
+import re
+from pathlib import Path
+
+
+DEFAULT_EXCLUDE_DIRS = (
+    ".git",
+    ".hg",
+    ".svn",
+    ".tox",
+    ".nox",
+    ".venv",
+    "venv",
+    "env",
+    ".eggs",
+    "*.egg-info",
+    "node_modules",
+    "build",
+    "dist",
+    "site-packages",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+)
+
+DEFAULT_INCLUDE = ("*.py",)
+
+
+def glob_to_regex(pattern):
+    """
+    Translate a gitignore-style glob into a regex source string.
+
+    ``*`` and ``?`` never cross ``/``; ``**`` matches any number of
+    directories.
+    """
+    out = []
+    i = 0
+    n = len(pattern)
+
+    while i < n:
+        char = pattern[i]
+
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif char == "*":
+            out.append("[^/]*")
+            i += 1
+        elif char == "?":
+            out.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(char))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        else:
+            out.append(re.escape(char))
+            i += 1
+
+    return "".join(out)
+
+
+class _Rule:
+    __slots__ = ("regex", "negate", "dir_only")
+
+    def __init__(self, pattern):
+        self.negate = pattern.startswith("!")
+        if self.negate:
+            pattern = pattern[1:]
+
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+
+        # A slash anywhere but the end anchors the pattern to its base
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        prefix = "^" if anchored else "^(?:.*/)?"
+        self.regex = re.compile(prefix + glob_to_regex(pattern) + "$")
+
+    def matches(self, rel_path, is_dir):
+        if self.dir_only and not is_dir:
+            return False
+        return self.regex.match(rel_path) is not None
+
+
+class IgnoreRules:
+    """
+    Ordered ignore rules relative to a base directory (last match wins).
+
+    ``base`` is the directory of the rules relative to the scan root, in
+    posix form ("" for the root itself).
+    """
+
+    def __init__(self, base, patterns):
+        self.base = base
+        self._prefix = base + "/" if base else ""
+        self.rules = []
+        for line in patterns:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("\\"):
+                line = line[1:]
+            self.rules.append(_Rule(line))
+
+    @classmethod
+    def from_file(cls, base, path):
+        try:
+            with open(path, encoding="utf-8", errors="replace") as handle:
+                return cls(base, handle.readlines())
+        except OSError:
+            return None
+
+    def match(self, rel_path, is_dir):
+        """
+        Return True (ignored), False (re-included) or None (no rule matched).
+
+        rel_path is relative to the scan root, like ``base``.
+        """
+        if self._prefix:
+            if not rel_path.startswith(self._prefix):
+                return None
+            rel_path = rel_path[len(self._prefix):]
+
+        result = None
+        for rule in self.rules:
+            if rule.matches(rel_path, is_dir):
+                result = not rule.negate
+        return result
+
+
+class TreeWalker:
+    """
+    Walk a tree with os.scandir, pruning excluded directories early.
+
+    Args:
+        include (list[str] | None): File globs to keep (default ``*.py``).
+        exclude (list[str] | None): Extra globs for files or directories to
+            skip, matched against the path relative to the scan root.
+        exclude_dirs (list[str] | None): Directory-name globs pruned
+            everywhere (default DEFAULT_EXCLUDE_DIRS).
+        use_gitignore (bool): Honour ``.gitignore`` files found on the way.
+        follow_symlinks (bool): Descend into symlinked directories; each real
+            directory is still visited at most once.
+    """
+
+    def __init__(
+        self,
+        include=None,
+        exclude=None,
+        exclude_dirs=None,
+        use_gitignore=True,
+        follow_symlinks=False,
+    ):
+        self.include = tuple(include or DEFAULT_INCLUDE)
+        self.exclude = tuple(exclude or ())
+        self.exclude_dirs = tuple(
+            DEFAULT_EXCLUDE_DIRS if exclude_dirs is None else exclude_dirs
+        )
+        self.use_gitignore = use_gitignore
+        self.follow_symlinks = follow_symlinks
+
+        self._include = IgnoreRules("", self.include)
+        self._exclude = IgnoreRules("", self.exclude)
+        self._exclude_dirs = IgnoreRules("", self.exclude_dirs)
+
+    def walk(self, root):
+        """
+        Yield matching files under root in sorted, deterministic order.
+        """
+        root = Path(root)
+
+        if root.is_file():
+            if self._include.match(root.name, False):
+                yield root
+            return
+
+        if not root.is_dir():
+            return
+
+        yield from self._walk_dir(str(root), "", [], set())
+
+    def directories(self, root, start=None):
+        """
+        Yield every directory walk(root) would enter, root included.
+
+        With start, only the directories at or below start are yielded,
+        still pruned by the exclude rules and .gitignore files that apply
+        to start relative to root. Used to watch a directory that appears
+        after the walk.
+        """
+        root = Path(root)
+        start = root if start is None else Path(start)
+
+        try:
+            parts = start.relative_to(root).parts
+        except ValueError:
+            return
+        if not start.is_dir():
+            return
+
+        context = self._enter(root, parts)
+        if context is not None:
+            rel_dir, ignores = context
+            yield from self._walk_dir(str(start), rel_dir, ignores, set(), dirs=True)
+
+    def includes(self, root, path):
+        """
+        Return True if walk(root) would yield path.
+
+        Used to classify a single new file without walking the whole tree.
+        """
+        return self.matches(root, path) and Path(path).is_file()
+
+    def matches(self, root, path):
+        """
+        Return True if the rules of walk(root) keep path, whether or not it
+        exists. Used for files git reports, which may be deleted.
+        """
+        root = Path(root)
+        path = Path(path)
+
+        if root.is_file():
+            return path == root and bool(self._include.match(root.name, False))
+
+        try:
+            parts = path.relative_to(root).parts
+        except ValueError:
+            return False
+        if not parts:
+            return False
+
+        context = self._enter(root, parts[:-1])
+        if context is None:
+            return False
+
+        rel_dir, ignores = context
+        ignores = self._with_gitignore(rel_dir, os.path.join(str(root), *parts[:-1]), ignores)
+        rel_path = f"{rel_dir}/{parts[-1]}" if rel_dir else parts[-1]
+
+        if self._ignored(rel_path, False, ignores):
+            return False
+        return bool(self._include.match(rel_path, False))
+
+    def _enter(self, root, parts):
+        """
+        Follow the directory parts below root as the walk would.
+
+        Returns:
+            tuple | None: (rel_dir, ignores) on reaching the directory,
+            ignores not yet including its own .gitignore; None if any
+            directory on the way is pruned.
+        """
+        ignores = []
+        rel_dir = ""
+        current = str(root)
+
+        for part in parts:
+            ignores = self._with_gitignore(rel_dir, current, ignores)
+            rel_path = f"{rel_dir}/{part}" if rel_dir else part
+
+            if self._ignored(rel_path, True, ignores) or self._exclude_dirs.match(part, True):
+                return None
+
+            rel_dir = rel_path
+            current = os.path.join(current, part)
+
+        return rel_dir, ignores
+
+    def _with_gitignore(self, rel_dir, path, ignores):
+        if self.use_gitignore:
+            rules = IgnoreRules.from_file(rel_dir, os.path.join(path, ".gitignore"))
+            if rules is not None and rules.rules:
+                return ignores + [rules]
+        return ignores
+
+    def _walk_dir(self, path, rel_dir, ignores, visited, dirs=False):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+
+        # Guard against symlink loops and directories reached twice
+        key = (stat.st_dev, stat.st_ino)
+        if key in visited:
+            return
+        visited.add(key)
+
+        if dirs:
+            yield Path(path)
+
+        ignores = self._with_gitignore(rel_dir, path, ignores)
+
+        try:
+            with os.scandir(path) as scanner:
+                entries = sorted(scanner, key=lambda entry: entry.name)
+        except OSError:
+            return
+
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+
+            try:
+                is_dir = entry.is_dir(follow_symlinks=self.follow_symlinks)
+            except OSError:
+                continue
+
+            if self._ignored(rel_path, is_dir, ignores):
+                continue
+
+            if is_dir:
+                if self._exclude_dirs.match(entry.name, True):
+                    continue
+                yield from self._walk_dir(entry.path, rel_path, ignores, visited, dirs)
+            elif not dirs and self._include.match(rel_path, False):
+                try:
+                    if entry.is_file(follow_symlinks=self.follow_symlinks):
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+    def _ignored(self, rel_path, is_dir, ignores):
+        if self._exclude.match(rel_path, is_dir):
+            return True
+
+        # Deeper .gitignore files override their parents
+        ignored = None
+        for rules in ignores:
+            verdict = rules.match(rel_path, is_dir)
+            if verdict is not None:
+                ignored = verdict
+        return bool(ignored)
+
+
+DEFAULT_WALKER = TreeWalker()
+
+
+def walk_python_files(root, walker=None):
+    """
+    Return the Python files under root, pruned and in stable order.
+    """
+    return list((walker or DEFAULT_WALKER).walk(root))
@@ -0,0 +1,326 @@
+"""
+Filesystem watch mode that keeps a scanner's function map live.
+
+A background thread waits for change events (inotify on Linux, polling
+elsewhere), debounces bursts such as editor save sequences, and re-parses
+only the touched files through IncrementalScanner. Readers take a
+consistent copy of the state with FunctionWatcher.state().
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+from ai_powered.core.parser.incremental import diff_snapshots, take_snapshot
+from ai_powered.core.parser.walker import DEFAULT_WALKER
+
+
+# Returned by a backend when it cannot tell which files changed
+FULL_RESCAN = None
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class PollingBackend:
+    """
+    Detect changes by comparing stat snapshots every interval seconds.
+    """
+
+    def __init__(self, root, walker=None, interval=1.0):
+        self.root = Path(root)
+        self.walker = walker
+        self.interval = interval
+        self._snapshot = take_snapshot(self.root, walker)
+        self._next = time.monotonic() + interval
+
+    def wait(self, timeout):
+        """
+        Return the paths changed since the previous poll (empty between polls).
+        """
+        remaining = self._next - time.monotonic()
+        if remaining > timeout:
+            time.sleep(timeout)
+            return set()
+
+        time.sleep(max(0.0, remaining))
+        self._next = time.monotonic() + self.interval
+
+        snapshot = take_snapshot(self.root, self.walker)
+        changes = diff_snapshots(self._snapshot, snapshot)
+        self._snapshot = snapshot
+        return set(changes["added"] + changes["changed"] + changes["deleted"])
+
+    def close(self):
+        pass
+
+
+class InotifyBackend:
+    """
+    Report changed paths using Linux inotify, one watch per directory.
+    """
+
+    def __init__(self, root, walker=None):
+        self._libc = _load_libc()
+        if self._libc is None:
+            raise OSError("inotify is not available on this platform")
+
+        self.root = Path(root)
+        self.walker = walker or DEFAULT_WALKER
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._dirs = {}
+        self._watch_tree()
+
+    @classmethod
+    def available(cls):
+        return _load_libc() is not None
+
+    def _watch_tree(self, directory=None):
+        # New directories are judged relative to the watch root, so exclude
+        # rules and .gitignore files still apply to them. Returns True if
+        # the walk enters directory at all.
+        entered = False
+        for path in self.walker.directories(self.root, directory):
+            entered = True
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(path), _WATCH_MASK
+            )
+            if wd >= 0:
+                self._dirs[wd] = str(path)
+        return entered
+
+    def wait(self, timeout):
+        """
+        Block up to timeout seconds for events.
+
+        Returns:
+            set[Path] | None: Changed file paths, or FULL_RESCAN when a
+            directory the walk enters appeared, vanished or moved, or the
+            event queue overflowed.
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed = set()
+        full = False
+        offset = 0
+
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                full = True
+                continue
+
+            directory = self._dirs.get(wd)
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            if directory is None:
+                continue
+
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                full = True
+                continue
+
+            if mask & _IN_ISDIR:
+                # A directory appeared, vanished or moved: watch anything new
+                # and let the stat snapshot sort out which files changed.
+                # Directories the walk prunes, such as __pycache__, hold no
+                # scanned files and are ignored.
+                path = os.path.join(directory, os.fsdecode(name))
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    full |= self._watch_tree(path)
+                elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                    full |= path in self._dirs.values()
+                continue
+
+            if name:
+                changed.add(Path(os.path.join(directory, os.fsdecode(name))))
+
+        return FULL_RESCAN if full else changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_backend(root, walker=None, poll_interval=1.0, use_inotify=True):
+    """
+    Return an inotify backend where possible, otherwise a polling one.
+    """
+    if use_inotify and InotifyBackend.available():
+        try:
+            return InotifyBackend(root, walker)
+        except OSError:
+            pass
+    return PollingBackend(root, walker, poll_interval)
+
+
+class FunctionWatcher:
+    """
+    Keep an IncrementalScanner up to date from a background thread.
+
+    Args:
+        scanner (IncrementalScanner): Scanner whose state is kept live.
+        debounce (float): Quiet time in seconds before a burst is applied.
+        poll_interval (float): Rescan interval of the polling fallback.
+        use_inotify (bool): Prefer inotify when the platform has it.
+        on_change (callable | None): Called with the changes dict after
+            each update, from the watcher thread.
+    """
+
+    def __init__(self, scanner, debounce=0.25, poll_interval=1.0, use_inotify=True, on_change=None):
+        self.scanner = scanner
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.on_change = on_change
+
+        self.lock = threading.Lock()
+        self.version = 0
+        self.error = None
+        self.backend = None
+        self._metrics = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Scan once if needed, then start watching.
+        """
+        if self.running:
+            return self
+
+        # Start listening before the initial scan so no edit slips between
+        self.backend = make_backend(
+            self.scanner.root, self.scanner.walker, self.poll_interval, self.use_inotify
+        )
+
+        with self.lock:
+            if not self.scanner.snapshot:
+                self.scanner.scan()
+            self._publish()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="function-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+
+    def rescan(self):
+        """
+        Run a full rescan now, serialized with the watcher thread.
+        """
+        with self.lock:
+            changes = self.scanner.rescan()
+            self._publish()
+        return changes
+
+    def state(self):
+        """
+        Return a consistent copy of the watched state.
+
+        Returns:
+            tuple: (version, functions, metrics)
+        """
+        with self.lock:
+            return self.version, dict(self.scanner.functions), dict(self._metrics)
+
+    def _publish(self):
+        self.version += 1
+        self._metrics = self.scanner.metrics()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                events = self.backend.wait(0.5)
+                if events is not FULL_RESCAN and not events:
+                    continue
+
+                # Debounce: keep collecting until the tree is quiet
+                while not self._stop.is_set():
+                    more = self.backend.wait(self.debounce)
+                    if more is not FULL_RESCAN and not more:
+                        break
+                    if events is FULL_RESCAN or more is FULL_RESCAN:
+                        events = FULL_RESCAN
+                    else:
+                        events |= more
+
+                with self.lock:
+                    if events is FULL_RESCAN:
+                        changes = self.scanner.rescan()
+                    else:
+                        changes = self.scanner.update(events)
+                    if not any(changes.values()):
+                        continue
+                    self._publish()
+
+                if self.on_change is not None:
+                    self.on_change(changes)
+            except Exception as exc:
+                # Keep watching; the UI shows the last error
+                self.error = f"{type(exc).__name__}: {exc}"
@@ -14,15 +14,29 @@ class CoverageReporter:
             "coverage": coverage
         }
 '''
+from ai_powered.core.tracing import traced
+
+
 class CoverageReporter:
     def __init__(self, functions):
+        """
+        Args:
+            functions (dict | FunctionTable | FunctionIndex): Function map,
+                columnar table or persistent index.
+        """
         self.functions = functions
 
+    @traced("reporter.coverage", "reporter")
     def get_metrics(self):
         total = len(self.functions)
-        documented = sum(
-            1 for f in self.functions.values() if f.get("docstring")
-        )
+
+        # FunctionTable and FunctionIndex count documented rows themselves
+        if hasattr(self.functions, "documented_count"):
+            documented = self.functions.documented_count()
+        else:
+            documented = sum(
+                1 for f in self.functions.values() if f.get("docstring")
+            )
         coverage = round((documented / total) * 100, 2) if total else 0
 
         return {
@@ -0,0 +1,370 @@
+"""
+Persistent SQLite index of scanned functions.
+
+The scanner upserts one file at a time; the UI and reporter run bounded
+queries against the index instead of holding every record in session
+state. The database survives reloads and is shared by all sessions.
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from ai_powered.core.parser.records import ArgRecord, FunctionRecord
+from ai_powered.core.tracing import traced
+
+
+DEFAULT_INDEX_PATH = "storage/index.db"
+
+# Default page size for list queries
+DEFAULT_LIMIT = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    module TEXT,
+    scanned_at REAL,
+    UNIQUE (root, path)
+);
+
+CREATE TABLE IF NOT EXISTS functions (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    qualname TEXT NOT NULL,
+    kind TEXT,
+    is_async INTEGER,
+    returns TEXT,
+    docstring TEXT,
+    has_docstring INTEGER NOT NULL,
+    docstring_lineno INTEGER,
+    docstring_end_lineno INTEGER,
+    is_public INTEGER,
+    lineno INTEGER,
+    end_lineno INTEGER,
+    complexity INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS args (
+    function_id INTEGER NOT NULL REFERENCES functions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT,
+    PRIMARY KEY (function_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (file_id, name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_functions_name ON functions(name);
+CREATE INDEX IF NOT EXISTS idx_functions_file ON functions(file_id);
+CREATE INDEX IF NOT EXISTS idx_functions_docstring ON functions(has_docstring);
+CREATE INDEX IF NOT EXISTS idx_functions_key ON functions(key);
+
+-- Violations live in the ValidationCache; indexes built before that kept
+-- a copy here
+DROP TABLE IF EXISTS violations;
+"""
+
+_FUNCTION_COLUMNS = (
+    "key", "name", "qualname", "kind", "is_async", "returns", "docstring",
+    "has_docstring", "docstring_lineno", "docstring_end_lineno", "is_public",
+    "lineno", "end_lineno", "complexity",
+)
+
+_ROW_COLUMNS = (
+    "functions.key, functions.name, functions.qualname, files.path, "
+    "functions.lineno, functions.end_lineno, functions.has_docstring, "
+    "functions.complexity"
+)
+
+
+def _like_pattern(search):
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class FunctionIndex:
+    """
+    SQLite store of files, functions, args and metrics.
+
+    Args:
+        path (str | Path): Database file; ":memory:" for a private index.
+        root (str | Path | None): Scan root this view is bound to. Queries
+            only see files scanned under it.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH, root=None):
+        self.path = str(path)
+        self.root = str(root) if root is not None else ""
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by the UI and watcher threads, serialized
+        # by the lock below
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        self._depth = 0
+
+        with self._lock:
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode = WAL")
+                self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into one transaction; nested uses join the outer one.
+        """
+        with self._lock:
+            if self._depth == 0:
+                self._conn.execute("BEGIN")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.execute("COMMIT")
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # ---- writes ----
+
+    def upsert_file(self, file_path, functions, module=None):
+        """
+        Replace everything stored for one file with fresh records.
+
+        Metrics of the file are dropped as they may be stale.
+        """
+        file_path = str(file_path)
+
+        with self.transaction():
+            self._conn.execute(
+                "INSERT INTO files (root, path, module, scanned_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (root, path) DO UPDATE SET "
+                "module = excluded.module, scanned_at = excluded.scanned_at",
+                (self.root, file_path, module, time.time()),
+            )
+            file_id = self._file_id(file_path)
+
+            self._conn.execute("DELETE FROM functions WHERE file_id = ?", (file_id,))
+            self._conn.execute("DELETE FROM metrics WHERE file_id = ?", (file_id,))
+
+            for key, record in functions.items():
+                cursor = self._conn.execute(
+                    "INSERT INTO functions (file_id, "
+                    + ", ".join(_FUNCTION_COLUMNS)
+                    + ") VALUES (?, " + ", ".join("?" * len(_FUNCTION_COLUMNS)) + ")",
+                    (file_id, key) + tuple(record.get(name) for name in _FUNCTION_COLUMNS[1:]),
+                )
+                self._conn.executemany(
+                    "INSERT INTO args (function_id, position, name, type) VALUES (?, ?, ?, ?)",
+                    [
+                        (cursor.lastrowid, position, arg["name"], arg.get("type"))
+                        for position, arg in enumerate(record.get("args") or ())
+                    ],
+                )
+
+    def remove_file(self, file_path):
+        with self.transaction():
+            self._conn.execute(
+                "DELETE FROM files WHERE root = ? AND path = ?", (self.root, str(file_path))
+            )
+
+    def retain_files(self, file_paths):
+        """
+        Drop files of this root that are not in file_paths.
+        """
+        keep = {str(path) for path in file_paths}
+        with self.transaction():
+            for path in self.files():
+                if path not in keep:
+                    self.remove_file(path)
+
+    def clear(self):
+        with self.transaction():
+            self._conn.execute("DELETE FROM files WHERE root = ?", (self.root,))
+
+    def set_metrics(self, file_path, values):
+        with self.transaction():
+            file_id = self._file_id(str(file_path))
+            if file_id is None:
+                return
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO metrics (file_id, name, value) VALUES (?, ?, ?)",
+                [(file_id, name, value) for name, value in values.items()],
+            )
+
+    def _file_id(self, file_path):
+        row = self._conn.execute(
+            "SELECT id FROM files WHERE root = ? AND path = ?", (self.root, file_path)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    # ---- reads ----
+
+    def __len__(self):
+        return self.count()
+
+    def count(self, search=None, status=None, file_path=None):
+        where, params = self._where(search, status, file_path)
+        return self._query(
+            "SELECT COUNT(*) FROM functions JOIN files ON files.id = functions.file_id " + where,
+            params,
+        )[0][0]
+
+    def documented_count(self):
+        return self.count(status="OK")
+
+    @traced("index.metrics", "reporter")
+    def metrics(self):
+        """
+        Return coverage metrics in the CoverageReporter shape.
+
+        Returns:
+            dict: { total_functions, documented, coverage_percent }
+        """
+        total, documented = self._query(
+            "SELECT COUNT(*), COALESCE(SUM(has_docstring), 0) "
+            "FROM functions JOIN files ON files.id = functions.file_id WHERE files.root = ?",
+            (self.root,),
+        )[0]
+        return {
+            "total_functions": total,
+            "documented": documented,
+            "coverage_percent": round((documented / total) * 100, 2) if total else 0
+        }
+
+    @traced("index.query", "reporter")
+    def query(self, search=None, status=None, file_path=None, limit=DEFAULT_LIMIT, offset=0):
+        """
+        Return one page of matching functions, ordered by file and line.
+
+        Args:
+            search (str | None): Case-insensitive substring of the name.
+            status (str | None): "OK" (documented) or "Fix" (undocumented).
+            file_path (str | None): Only functions of this file.
+            limit (int): Maximum rows returned.
+            offset (int): Rows to skip, for paging.
+
+        Returns:
+            list[dict]: { key, name, qualname, file, lineno, end_lineno,
+            has_docstring, complexity }
+        """
+        where, params = self._where(search, status, file_path)
+        rows = self._query(
+            f"SELECT {_ROW_COLUMNS} FROM functions JOIN files ON files.id = functions.file_id "
+            f"{where} ORDER BY files.path, functions.lineno LIMIT ? OFFSET ?",
+            params + (limit, offset),
+        )
+        return [self._row(row) for row in rows]
+
+    def iter_rows(self, batch_size=1000):
+        """
+        Yield every row of this root in pages, e.g. for exports.
+        """
+        offset = 0
+        while True:
+            rows = self.query(limit=batch_size, offset=offset)
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            offset += batch_size
+
+    def get(self, key):
+        """
+        Return the full FunctionRecord stored under key, or None.
+        """
+        rows = self._query(
+            "SELECT functions.*, files.path, files.module FROM functions "
+            "JOIN files ON files.id = functions.file_id "
+            "WHERE files.root = ? AND functions.key = ? "
+            "ORDER BY files.path DESC LIMIT 1",
+            (self.root, key),
+        )
+        if not rows:
+            return None
+
+        row = rows[0]
+        args = self._query(
+            "SELECT name, type FROM args WHERE function_id = ? ORDER BY position",
+            (row["id"],),
+        )
+        values = {name: row[name] for name in _FUNCTION_COLUMNS[1:]}
+        for flag in ("is_async", "has_docstring", "is_public"):
+            values[flag] = bool(values[flag]) if values[flag] is not None else None
+
+        return FunctionRecord(
+            args=[ArgRecord(arg["name"], arg["type"]) for arg in args],
+            module=row["module"],
+            file=row["path"],
+            **values,
+        )
+
+    def files(self):
+        return [
+            row[0] for row in self._query(
+                "SELECT path FROM files WHERE root = ? ORDER BY path", (self.root,)
+            )
+        ]
+
+    def file_metrics(self, file_path):
+        return dict(self._query(
+            "SELECT name, value FROM metrics JOIN files ON files.id = metrics.file_id "
+            "WHERE files.root = ? AND files.path = ?",
+            (self.root, str(file_path)),
+        ))
+
+    def _where(self, search, status, file_path):
+        clauses = ["files.root = ?"]
+        params = [self.root]
+
+        if search:
+            clauses.append("functions.name LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(search))
+        if status == "OK":
+            clauses.append("functions.has_docstring = 1")
+        elif status == "Fix":
+            clauses.append("functions.has_docstring = 0")
+        if file_path is not None:
+            clauses.append("files.path = ?")
+            params.append(str(file_path))
+
+        return "WHERE " + " AND ".join(clauses), tuple(params)
+
+    def _row(self, row):
+        return {
+            "key": row[0],
+            "name": row[1],
+            "qualname": row[2],
+            "file": row[3],
+            "lineno": row[4],
+            "end_lineno": row[5],
+            "has_docstring": bool(row[6]),
+            "complexity": row[7],
+        }
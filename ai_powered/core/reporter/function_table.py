@@ -0,0 +1,87 @@
+"""
+Columnar view of scanned functions for in-memory reports.
+
+The table is built once per scan and counts run as vectorized pandas
+operations instead of per-record Python loops. The dashboard queries the
+persistent FunctionIndex instead; the memory profiler still builds this
+table to measure its cost.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class FunctionTable:
+    """
+    One row per function, with file paths stored once and referenced by id.
+    """
+
+    COLUMNS = [
+        "key",
+        "name",
+        "qualname",
+        "file_id",
+        "lineno",
+        "end_lineno",
+        "has_docstring",
+        "arg_count",
+        "complexity",
+    ]
+
+    def __init__(self, frame, files):
+        self.frame = frame
+        self.files = files
+
+    @classmethod
+    def from_records(cls, functions):
+        """
+        Build the table from a function map or an iterable of records.
+        """
+        if hasattr(functions, "items"):
+            items = functions.items()
+        else:
+            items = ((fn.get("qualname", fn["name"]), fn) for fn in functions)
+
+        file_ids = {}
+        columns = {name: [] for name in cls.COLUMNS}
+
+        for key, fn in items:
+            file_path = fn.get("file", "")
+            columns["key"].append(key)
+            columns["name"].append(fn["name"])
+            columns["qualname"].append(fn.get("qualname", fn["name"]))
+            columns["file_id"].append(file_ids.setdefault(file_path, len(file_ids)))
+            columns["lineno"].append(fn.get("lineno") or 0)
+            columns["end_lineno"].append(fn.get("end_lineno") or 0)
+            columns["has_docstring"].append(bool(fn.get("has_docstring")))
+            columns["arg_count"].append(len(fn.get("args", ())))
+            columns["complexity"].append(fn.get("complexity") or 1)
+
+        frame = pd.DataFrame({
+            "key": pd.Series(columns["key"], dtype=object),
+            "name": pd.Series(columns["name"], dtype=object),
+            "qualname": pd.Series(columns["qualname"], dtype=object),
+            "file_id": np.asarray(columns["file_id"], dtype=np.int32),
+            "lineno": np.asarray(columns["lineno"], dtype=np.int32),
+            "end_lineno": np.asarray(columns["end_lineno"], dtype=np.int32),
+            "has_docstring": np.asarray(columns["has_docstring"], dtype=bool),
+            "arg_count": np.asarray(columns["arg_count"], dtype=np.int16),
+            "complexity": np.asarray(columns["complexity"], dtype=np.int32),
+        })
+
+        return cls(frame, list(file_ids))
+
+    def __len__(self):
+        return len(self.frame)
+
+    def documented_count(self):
+        return int(self.frame["has_docstring"].sum())
+
+    def file_column(self, frame=None):
+        """
+        Return the file path of every row as a categorical column.
+        """
+        frame = self.frame if frame is None else frame
+        return pd.Categorical.from_codes(
+            frame["file_id"].to_numpy(), categories=self.files
+        )
@@ -0,0 +1,233 @@
+"""
+tracemalloc-based memory profile of a full scan.
+
+Runs the pipeline stage by stage (walk, parse, extract, coverage,
+validation, dataframe build), snapshots the heap between stages and
+reports what each stage allocated, the peak, bytes per file and per
+function, and the top allocation sites.
+"""
+
+import json
+import linecache
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ai_powered.core.parser.parsed_module import ParsedModule, open_source
+from ai_powered.core.parser.python_parser import (
+    _extract_records,
+    _python_files,
+    function_key,
+    module_name,
+)
+from ai_powered.core.reporter.coverage_reporter import compute_coverage
+from ai_powered.core.validator.validator import CodeValidator
+
+
+DEFAULT_REPORT_DIR = "storage/reports"
+
+_IGNORED_FILES = (tracemalloc.__file__, linecache.__file__, "<frozen importlib._bootstrap>")
+
+
+def _filtered(snapshot):
+    return snapshot.filter_traces([
+        tracemalloc.Filter(False, pattern) for pattern in _IGNORED_FILES
+    ])
+
+
+def _site(stat):
+    frame = stat.traceback[0]
+    return {
+        "file": frame.filename,
+        "line": frame.lineno,
+        "code": linecache.getline(frame.filename, frame.lineno).strip(),
+        "size_bytes": stat.size if not hasattr(stat, "size_diff") else stat.size_diff,
+        "count": stat.count if not hasattr(stat, "count_diff") else stat.count_diff,
+    }
+
+
+class MemoryProfiler:
+    """
+    Record heap usage per named stage with tracemalloc.
+
+    Args:
+        frames (int): Traceback depth kept per allocation.
+        top (int): Allocation sites kept per stage and overall.
+    """
+
+    def __init__(self, frames=1, top=10):
+        self.frames = frames
+        self.top = top
+        self.stages = []
+        self._baseline = None
+        self._previous = None
+        self._started_here = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_here = True
+        self._baseline = self._previous = _filtered(tracemalloc.take_snapshot())
+        return self
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Measure one stage: bytes it left allocated and its peak.
+        """
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+
+        yield
+
+        elapsed = time.perf_counter() - started
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = _filtered(tracemalloc.take_snapshot())
+        growth = snapshot.compare_to(self._previous, "lineno")
+        self._previous = snapshot
+
+        self.stages.append({
+            "stage": name,
+            "seconds": round(elapsed, 4),
+            "retained_bytes": current - before,
+            "peak_bytes": peak,
+            "current_bytes": current,
+            "top_sites": [_site(stat) for stat in growth[:self.top] if stat.size_diff > 0],
+        })
+
+    def stop(self):
+        """
+        Stop tracing and return the overall top sites since start().
+        """
+        final = _filtered(tracemalloc.take_snapshot())
+        if self._started_here:
+            tracemalloc.stop()
+        growth = final.compare_to(self._baseline, "lineno")
+        return [_site(stat) for stat in growth[:self.top] if stat.size_diff > 0]
+
+
+def profile_scan(path, walker=None, validate=True, build_table=True, top=10):
+    """
+    Run a full scan under tracemalloc, one stage at a time.
+
+    Stages hold on to their outputs until the end, so retained bytes show
+    what each intermediate costs when kept alive.
+
+    Returns:
+        dict: { path, files, skipped_files, functions, peak_bytes, bytes_per_file,
+        bytes_per_function, stages, top_sites }
+    """
+    profiler = MemoryProfiler(top=top).start()
+    root = Path(path)
+
+    with profiler.stage("walk"):
+        files = _python_files(root, walker)
+    module_root = root.parent if root.is_file() else root
+
+    with profiler.stage("parse"):
+        modules = []
+        skipped = 0
+        for py_file in files:
+            # Unreadable, undecodable or invalid files are skipped, as the
+            # parser quarantines them
+            try:
+                with open_source(py_file) as data:
+                    module = ParsedModule.from_bytes(py_file, data)
+                module.tree
+            except (OSError, SyntaxError, ValueError):
+                skipped += 1
+                continue
+            modules.append(module)
+
+    with profiler.stage("extract"):
+        functions = {}
+        for module in modules:
+            name = module_name(module.path, module_root)
+            for record in _extract_records(module.tree)["functions"]:
+                record.set_location(name, module.path)
+                functions[function_key(record)] = record
+
+    with profiler.stage("coverage"):
+        coverage = compute_coverage(functions)["aggregate"]
+
+    if validate:
+        with profiler.stage("validation"):
+            validator = CodeValidator()
+            violations = [validator.validate_file(module) for module in modules]
+
+    if build_table:
+        try:
+            from ai_powered.core.reporter.function_table import FunctionTable
+        except ImportError:
+            table = None
+        else:
+            with profiler.stage("dataframe"):
+                table = FunctionTable.from_records(functions)
+
+    top_sites = profiler.stop()
+    peak = max((stage["peak_bytes"] for stage in profiler.stages), default=0)
+    retained = profiler.stages[-1]["current_bytes"] if profiler.stages else 0
+
+    report = {
+        "path": str(path),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "files": len(files),
+        "skipped_files": skipped,
+        "functions": len(functions),
+        "coverage": coverage,
+        "peak_bytes": peak,
+        "retained_bytes": retained,
+        "bytes_per_file": round(retained / len(files), 1) if files else None,
+        "bytes_per_function": round(retained / len(functions), 1) if functions else None,
+        "stages": profiler.stages,
+        "top_sites": top_sites,
+    }
+
+    # Keep stage outputs alive until every snapshot has been taken
+    del modules, functions
+    if validate:
+        del violations
+    if build_table:
+        del table
+
+    return report
+
+
+def write_report(report, report_dir=DEFAULT_REPORT_DIR):
+    """
+    Save a memory profile as JSON in report_dir.
+
+    Returns:
+        Path: The written file.
+    """
+    report_dir = Path(report_dir)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out_path = report_dir / f"memory_profile_{stamp}.json"
+    out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return out_path
+
+
+def format_summary(report):
+    """
+    Return a plain-text table of the per-stage figures.
+    """
+    mib = 1024 * 1024
+    lines = [
+        f"{'stage':<12} {'seconds':>8} {'retained MiB':>13} {'peak MiB':>9}",
+    ]
+    for stage in report["stages"]:
+        lines.append(
+            f"{stage['stage']:<12} {stage['seconds']:>8.3f} "
+            f"{stage['retained_bytes'] / mib:>13.2f} {stage['peak_bytes'] / mib:>9.2f}"
+        )
+    lines.append(
+        f"files: {report['files']} ({report['skipped_files']} skipped)  functions: {report['functions']}  "
+        f"peak: {report['peak_bytes'] / mib:.2f} MiB  "
+        f"bytes/file: {report['bytes_per_file']}  "
+        f"bytes/function: {report['bytes_per_function']}"
+    )
+    return "\n".join(lines)
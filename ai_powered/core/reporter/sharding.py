@@ -0,0 +1,250 @@
+"""
+Sharded scans with mergeable partial results.
+
+Each CI runner scans the files of one shard (chosen by a stable hash of
+the path relative to the scan root) and writes a compact partial file.
+merge_partials() combines all partials into the same report a single
+node would produce with scan_report().
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from ai_powered.core.parser.guard import ParseGuard
+from ai_powered.core.parser.parsed_module import load_module
+from ai_powered.core.parser.python_parser import (
+    PARSER_VERSION,
+    _iter_scan,
+    _python_files,
+    function_key,
+)
+from ai_powered.core.parser.records import FunctionRecord
+from ai_powered.core.reporter.coverage_reporter import compute_coverage
+from ai_powered.core.validator.validator import CodeValidator
+
+
+PARTIAL_FORMAT = 2
+
+# Stored per function row; file is replaced by an index into "files"
+_COLUMNS = tuple(name for name in FunctionRecord.FIELDS if name != "file")
+
+
+def parse_shard(spec):
+    """
+    Parse an "i/N" shard spec (1-based).
+
+    Returns:
+        tuple: (index, count)
+    """
+    try:
+        index, count = (int(part) for part in str(spec).split("/"))
+    except ValueError:
+        raise ValueError(f"shard must look like i/N, got {spec!r}") from None
+
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"shard index must be between 1 and N, got {spec!r}")
+
+    return index, count
+
+
+def shard_of(rel_path, count):
+    """
+    Return the 1-based shard that owns a root-relative posix path.
+
+    Uses a content hash of the path, so every runner agrees regardless of
+    where the repository is checked out or of PYTHONHASHSEED.
+    """
+    digest = hashlib.blake2b(rel_path.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count + 1
+
+
+def _relative(py_file, root):
+    try:
+        return Path(py_file).relative_to(root).as_posix()
+    except ValueError:
+        return Path(py_file).name
+
+
+def _walk_order(rel_path):
+    # The walker sorts entry names per directory, which orders paths by
+    # their components rather than as flat strings
+    return tuple(rel_path.split("/"))
+
+
+def scan_shard(
+    path, index=1, count=1, cache=None, jobs=1, walker=None, guard=None, validate=True,
+    validator=None,
+):
+    """
+    Parse and validate the files of one shard.
+
+    validator is a CodeValidator carrying the rule selection; the default
+    runs every registered rule.
+
+    Returns:
+        dict: Partial result, see write_partial().
+    """
+    root = Path(path)
+    files = _python_files(root, walker)
+    if root.is_file():
+        root = root.parent
+
+    files = [f for f in files if shard_of(_relative(f, root), count) == index]
+    guard = guard if guard is not None else ParseGuard()
+    validator = validator if validator is not None else CodeValidator()
+
+    partial = {
+        "format": PARTIAL_FORMAT,
+        "parser_version": PARSER_VERSION,
+        # Shards validated with different rules must not be merged
+        "validator": validator.fingerprint if validate else None,
+        "shard": [index, count],
+        "columns": list(_COLUMNS),
+        "files": [],
+        "functions": [],
+        "violations": [],
+        "quarantined": [],
+    }
+
+    for py_file, records in _iter_scan(files, root, cache, jobs, guard):
+        guard.record(py_file, records)
+        file_id = len(partial["files"])
+        partial["files"].append(_relative(py_file, root))
+
+        error = records["error"]
+        if error is not None:
+            partial["quarantined"].append([file_id, error["reason"], error["detail"]])
+            continue
+
+        for record in records["functions"]:
+            row = record.to_dict()
+            row["args"] = [[arg["name"], arg["type"]] for arg in row["args"]]
+            partial["functions"].append([file_id] + [row[name] for name in _COLUMNS])
+
+        if validate:
+            for violation in validator.validate_file(load_module(py_file)):
+                partial["violations"].append(
+                    [file_id, violation["code"], violation["line"], violation["message"]]
+                )
+
+    guard.quarantine.save()
+    return partial
+
+
+def write_partial(partial, out_path):
+    """
+    Write a partial result as gzip-compressed, compact JSON.
+
+    Functions, violations and quarantined files are stored as rows that
+    reference "files" by index, so each path is written once.
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(partial, separators=(",", ":")).encode("utf-8")
+
+    with gzip.open(out_path, "wb") as handle:
+        handle.write(data)
+
+    return out_path
+
+
+def read_partial(in_path):
+    with gzip.open(in_path, "rb") as handle:
+        return json.loads(handle.read().decode("utf-8"))
+
+
+def merge_partials(partials):
+    """
+    Combine the partial results of every shard into one report.
+
+    Raises:
+        ValueError: Shards are missing, duplicated, from different runs or
+            validated with different rules.
+
+    Returns:
+        dict: { files, functions, violations, violation_counts,
+        quarantined, coverage } as produced by scan_report().
+    """
+    partials = [read_partial(p) if isinstance(p, (str, Path)) else p for p in partials]
+    if not partials:
+        raise ValueError("no partial results to merge")
+
+    counts = {p["shard"][1] for p in partials}
+    versions = {(p["format"], p["parser_version"]) for p in partials}
+    if len(counts) != 1 or len(versions) != 1:
+        raise ValueError("partial results come from different shard counts or versions")
+
+    fingerprints = {p.get("validator") for p in partials}
+    if len(fingerprints) != 1:
+        raise ValueError("partial results were validated with different rule sets")
+
+    count = counts.pop()
+    seen = sorted(p["shard"][0] for p in partials)
+    if seen != list(range(1, count + 1)):
+        missing = sorted(set(range(1, count + 1)) - set(seen))
+        raise ValueError(f"expected shards 1..{count} once each; missing {missing}, got {seen}")
+
+    # Gather per-file results, then replay them in single-node walk order
+    by_file = {}
+    for partial in partials:
+        columns = partial["columns"]
+        entries = [
+            {"functions": [], "violations": [], "error": None}
+            for _ in partial["files"]
+        ]
+        for row in partial["functions"]:
+            record = dict(zip(columns, row[1:]))
+            record["args"] = [{"name": name, "type": type_} for name, type_ in record["args"]]
+            entries[row[0]]["functions"].append(record)
+        for file_id, code, line, message in partial["violations"]:
+            entries[file_id]["violations"].append({"code": code, "line": line, "message": message})
+        for file_id, reason, detail in partial["quarantined"]:
+            entries[file_id]["error"] = {"reason": reason, "detail": detail}
+        by_file.update(zip(partial["files"], entries))
+
+    return _build_report(by_file)
+
+
+def _build_report(by_file):
+    functions = {}
+    violations = {}
+    quarantined = []
+
+    for rel_path in sorted(by_file, key=_walk_order):
+        entry = by_file[rel_path]
+
+        if entry["error"] is not None:
+            quarantined.append({"file": rel_path, **entry["error"]})
+            continue
+
+        for record in entry["functions"]:
+            record["file"] = rel_path
+            functions[function_key(record)] = record
+        if entry["violations"]:
+            violations[rel_path] = entry["violations"]
+
+    violation_counts = {}
+    for file_violations in violations.values():
+        for violation in file_violations:
+            violation_counts[violation["code"]] = violation_counts.get(violation["code"], 0) + 1
+
+    return {
+        "files": len(by_file),
+        "functions": dict(sorted(functions.items())),
+        "violations": violations,
+        "violation_counts": dict(sorted(violation_counts.items())),
+        "quarantined": quarantined,
+        "coverage": compute_coverage(functions)["aggregate"],
+    }
+
+
+def scan_report(path, cache=None, jobs=1, walker=None, guard=None, validate=True, validator=None):
+    """
+    Build the full report on a single node.
+
+    Returns:
+        dict: Same shape and content as merging every shard of the tree.
+    """
+    return merge_partials([scan_shard(path, 1, 1, cache, jobs, walker, guard, validate, validator)])
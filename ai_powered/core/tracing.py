@@ -0,0 +1,264 @@
+"""
+Lightweight timing spans for the scan → validate → generate → apply path.
+
+Tracing is off by default. While disabled, span() returns a shared no-op
+context manager and traced() functions only pay one flag check, so the
+instrumentation can stay in hot paths. Enable it with enable() or by
+setting AI_REVIEWER_TRACE=1.
+
+Finished spans are kept in a bounded in-memory buffer and can be exported
+as Chrome trace-event JSON (chrome://tracing, Perfetto) or summarized per
+stage. Spans recorded inside parser worker processes are not collected.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+
+TRACE_ENV = "AI_REVIEWER_TRACE"
+
+# Oldest spans are dropped once the buffer is full
+MAX_SPANS = 100_000
+
+_enabled = os.environ.get(TRACE_ENV, "") not in ("", "0")
+_spans = deque(maxlen=MAX_SPANS)
+_origin = time.perf_counter_ns()
+
+
+# ------------------------------------------------------------
+# Switches
+# ------------------------------------------------------------
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def clear():
+    _spans.clear()
+
+
+def spans():
+    """
+    Return the finished spans, oldest first.
+
+    Returns:
+        list[dict]: { name, category, start_us, duration_us, pid, tid, args }
+    """
+    return [
+        {
+            "name": name,
+            "category": category,
+            "start_us": (start - _origin) / 1000,
+            "duration_us": duration / 1000,
+            "pid": pid,
+            "tid": tid,
+            "args": args,
+        }
+        for name, category, start, duration, pid, tid, args in list(_spans)
+    ]
+
+
+# ------------------------------------------------------------
+# Spans
+# ------------------------------------------------------------
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def start(self):
+        return self
+
+    def finish(self):
+        pass
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """
+    One timed region; recorded when the with-block exits.
+    """
+
+    __slots__ = ("name", "category", "args", "_start")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter_ns() - self._start
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        _spans.append((
+            self.name,
+            self.category,
+            self._start,
+            duration,
+            os.getpid(),
+            threading.get_ident(),
+            self.args,
+        ))
+        return False
+
+    def start(self):
+        """
+        Start the span outside a with-block; pair with finish().
+        """
+        return self.__enter__()
+
+    def finish(self):
+        self.__exit__(None, None, None)
+
+    def set(self, **args):
+        """
+        Attach extra arguments, e.g. counts known only at the end.
+        """
+        self.args.update(args)
+
+
+def span(name, category="app", **args):
+    """
+    Time a with-block under name.
+
+    Usage:
+        with span("parser.scan", "parser", path=str(path)) as s:
+            ...
+            s.set(files=len(files))
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, category, args)
+
+
+def traced(name=None, category="app"):
+    """
+    Decorator that wraps every call of a function in a span.
+    """
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with Span(label, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+# ------------------------------------------------------------
+# Export
+# ------------------------------------------------------------
+
+def chrome_trace(records=None):
+    """
+    Return spans as a Chrome trace-event document.
+
+    Returns:
+        dict: { traceEvents, displayTimeUnit }
+    """
+    records = spans() if records is None else records
+    events = [
+        {
+            "name": record["name"],
+            "cat": record["category"],
+            "ph": "X",
+            "ts": round(record["start_us"], 3),
+            "dur": round(record["duration_us"], 3),
+            "pid": record["pid"],
+            "tid": record["tid"],
+            "args": {key: _jsonable(value) for key, value in record["args"].items()},
+        }
+        for record in records
+    ]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _jsonable(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def export_chrome_trace(out_path, records=None):
+    """
+    Write spans as Chrome trace-event JSON.
+
+    Returns:
+        Path: The written file.
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(chrome_trace(records)), encoding="utf-8")
+    return out_path
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(records=None):
+    """
+    Return per-stage latency figures, slowest total first.
+
+    Returns:
+        list[dict]: { stage, category, count, total_ms, mean_ms, p50_ms,
+        p95_ms, max_ms }
+    """
+    records = spans() if records is None else records
+    by_stage = {}
+    for record in records:
+        key = (record["name"], record["category"])
+        by_stage.setdefault(key, []).append(record["duration_us"] / 1000)
+
+    rows = []
+    for (name, category), durations in by_stage.items():
+        durations.sort()
+        total = sum(durations)
+        rows.append({
+            "stage": name,
+            "category": category,
+            "count": len(durations),
+            "total_ms": round(total, 3),
+            "mean_ms": round(total / len(durations), 3),
+            "p50_ms": round(_percentile(durations, 0.5), 3),
+            "p95_ms": round(_percentile(durations, 0.95), 3),
+            "max_ms": round(durations[-1], 3),
+        })
+
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
@@ -0,0 +1,321 @@
+"""
+Repository-wide validation across a process pool.
+
+validate_files() streams one result per file as batches complete, and
+ValidationSummary folds them into the totals the Validation view shows,
+so nothing needs a second pass over the results.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from ai_powered.core.parser.parsed_module import as_module
+from ai_powered.core.parser.python_parser import _resolve_jobs
+from ai_powered.core.validator.rules import RuleDispatcher, ruleset_fingerprint
+from ai_powered.core.validator.validator import CodeValidator
+
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Upper bound on files handed to a worker at once
+MAX_BATCH_FILES = 32
+
+# Expected failures for a single file; anything else is a bug
+FILE_ERRORS = (OSError, SyntaxError, ValueError)
+
+# Worker-side dispatchers, built once per ruleset
+_DISPATCHERS = {}
+
+
+def _error(exc):
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _path(item):
+    return item.path if hasattr(item, "path") else str(item)
+
+
+def _result(item, violations, error=None):
+    return {"file_path": _path(item), "violations": violations, "error": error}
+
+
+def _parse_module(py_file, item):
+    # Run by ParseGuard, in a killable child process when it has a timeout
+    as_module(item).tree
+    return {"functions": [], "classes": []}
+
+
+def _guard_message(error):
+    return f"{error['reason']}: {error['detail']}"
+
+
+def _guarded_parse(item, guard):
+    """
+    Parse a file under the guard.
+
+    Returns:
+        dict | None: The guard's error, None if the file parsed.
+    """
+    return guard.run(_parse_module, _path(item), item)["error"]
+
+
+def _validate_batch(items, rules, budget=None, guard=None):
+    fingerprint = ruleset_fingerprint(rules)
+    dispatcher = _DISPATCHERS.get(fingerprint)
+    if dispatcher is None:
+        dispatcher = _DISPATCHERS[fingerprint] = RuleDispatcher(rules)
+
+    # (violations, error, guard error) per file; the caller records the
+    # guard outcome, so workers never write the quarantine
+    results = []
+    try:
+        for item in items:
+            # The rest of the batch would only be discarded by the caller
+            if budget is not None and budget.exceeded:
+                break
+            guard_error = _guarded_parse(item, guard) if guard is not None else None
+            if guard_error is not None:
+                results.append((None, _guard_message(guard_error), guard_error))
+                continue
+            try:
+                results.append((dispatcher.run(as_module(item), budget), None, None))
+            except FILE_ERRORS as exc:
+                results.append((None, _error(exc), None))
+    finally:
+        if guard is not None:
+            guard.close()
+    return results
+
+
+def _precheck(item, guard):
+    """
+    Return the error message of a file the guard refuses before reading
+    it, or None.
+    """
+    if guard is None:
+        return None
+    error = guard.precheck(_path(item))
+    guard.record(_path(item), {"error": error})
+    return _guard_message(error) if error is not None else None
+
+
+def _validate_one(item, validator, budget, guard):
+    """
+    Validate one file in this process.
+
+    Returns:
+        tuple: (violations, error message)
+    """
+    if guard is None:
+        return validator.validate_file(item, budget), None
+
+    error = _precheck(item, guard)
+    if error is not None:
+        return None, error
+
+    cache = validator.cache
+    entry = None
+    if cache is not None:
+        violations, entry = cache.lookup(item, validator.fingerprint)
+        if violations is not None:
+            return (violations if budget is None else budget.charge_all(violations)), None
+        item = entry["module"]
+
+    guard_error = _guarded_parse(item, guard)
+    guard.record(_path(item), {"error": guard_error})
+    if guard_error is not None:
+        return None, _guard_message(guard_error)
+
+    violations = validator.dispatcher.run(as_module(item), budget)
+    if entry is not None and (budget is None or not budget.exceeded):
+        cache.store_result(entry, violations)
+    return violations, None
+
+
+def _validate_serial(items, validator, budget, guard):
+    for item in items:
+        try:
+            violations, error = _validate_one(item, validator, budget, guard)
+        except FILE_ERRORS as exc:
+            violations, error = None, _error(exc)
+        yield _result(item, violations, error)
+        if budget is not None and budget.exceeded:
+            return
+
+
+def validate_files(files, jobs=1, validator=None, budget=None, guard=None):
+    """
+    Validate files (paths or ParsedModules), across a process pool when
+    jobs allows it.
+
+    Cache hits are answered in this process and yielded at once; misses
+    are validated by workers in batches, with a bounded number of batches
+    in flight, and collected in the order the batches were submitted. So
+    a miss comes after the hits met while its batch was in flight, and
+    results are not in input order.
+
+    With a budget, results stop after the file whose violations exceed
+    it: batches not yet started are cancelled, and each worker gets a copy
+    of the budget so a batch already running stops early as well.
+
+    Args:
+        files (iterable): Paths or ParsedModules.
+        jobs (int | None): Worker processes; 0 or None uses all cores.
+        validator (CodeValidator | None): Rule selection and cache.
+        budget (ValidationBudget | None): Limits that end the run early.
+        guard (ParseGuard | None): Size and time budgets per file; files it
+            refuses are reported as failed and recorded in its quarantine
+            (saving the quarantine is left to the caller).
+
+    Yields:
+        dict: { file_path, violations, error }; violations is None when
+        the file could not be read or parsed.
+    """
+    validator = validator if validator is not None else CodeValidator()
+    files = list(files)
+    workers = _resolve_jobs(jobs)
+
+    if workers == 1 or len(files) < PARALLEL_MIN_FILES:
+        yield from _validate_serial(files, validator, budget, guard)
+        return
+
+    cache = validator.cache
+    rules = validator.dispatcher.rules
+    workers = min(workers, len(files))
+    batch_size = min(MAX_BATCH_FILES, max(1, len(files) // (workers * 4)))
+    window = workers * 2
+    pending = deque()
+    batch = []
+
+    def exceeded():
+        return budget is not None and budget.exceeded
+
+    def submit(batch):
+        # A miss already read and hashed the file: send those bytes, so the
+        # worker neither reads it again nor sees a newer version than the
+        # one its result is cached under
+        items = [entry["module"] if entry is not None else item for item, entry in batch]
+        worker_budget = budget.copy() if budget is not None else None
+        pending.append((batch, pool.submit(_validate_batch, items, rules, worker_budget, guard)))
+
+    def collect(entry):
+        done, future = entry
+        for (item, cache_entry), (violations, error, guard_error) in zip(done, future.result()):
+            if guard is not None:
+                guard.record(_path(item), {"error": guard_error})
+            if violations is not None and budget is not None:
+                # Worker budgets started from an earlier count, so this one
+                # is exceeded no later than theirs: anything that stayed
+                # under it was validated in full
+                violations = budget.charge_all(violations)
+            if cache_entry is not None and violations is not None and not exceeded():
+                cache.store_result(cache_entry, violations)
+            yield _result(item, violations, error)
+            if exceeded():
+                return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for item in files:
+            error = _precheck(item, guard)
+            if error is not None:
+                yield _result(item, None, error)
+                continue
+
+            cache_entry = None
+            if cache is not None:
+                try:
+                    violations, cache_entry = cache.lookup(item, validator.fingerprint)
+                except FILE_ERRORS as exc:
+                    yield _result(item, None, _error(exc))
+                    continue
+                if violations is not None:
+                    if budget is not None:
+                        violations = budget.charge_all(violations)
+                    yield _result(item, violations)
+                    if exceeded():
+                        return
+                    continue
+
+            batch.append((item, cache_entry))
+            if len(batch) < batch_size:
+                continue
+
+            submit(batch)
+            batch = []
+
+            while len(pending) >= window:
+                yield from collect(pending.popleft())
+                if exceeded():
+                    return
+
+        if batch:
+            submit(batch)
+
+        while pending:
+            yield from collect(pending.popleft())
+            if exceeded():
+                return
+    finally:
+        # Drop batches that have not started once the budget is spent
+        pool.shutdown(wait=not exceeded(), cancel_futures=True)
+
+
+class ValidationSummary:
+    """
+    Running totals of a validation run, updated as results stream in.
+
+    Args:
+        keep_violations (bool): Also keep { file: violations } for files
+            with issues, for views that list them.
+    """
+
+    def __init__(self, keep_violations=True):
+        self.keep_violations = keep_violations
+        self.files = 0
+        self.files_with_issues = 0
+        self.issues = 0
+        self.by_code = {}
+        self.violations = {}
+        self.failed = {}
+
+    @property
+    def valid_files(self):
+        return self.files - self.files_with_issues - len(self.failed)
+
+    def add(self, result):
+        """
+        Fold one validate_files() result into the totals.
+        """
+        self.files += 1
+        violations = result["violations"]
+
+        if violations is None:
+            self.failed[result["file_path"]] = result["error"]
+            return result
+
+        if violations:
+            self.files_with_issues += 1
+            self.issues += len(violations)
+            for violation in violations:
+                self.by_code[violation["code"]] = self.by_code.get(violation["code"], 0) + 1
+            if self.keep_violations:
+                self.violations[result["file_path"]] = violations
+
+        return result
+
+    def update(self, results):
+        for result in results:
+            self.add(result)
+        return self
+
+    def to_dict(self):
+        return {
+            "files": self.files,
+            "valid_files": self.valid_files,
+            "files_with_issues": self.files_with_issues,
+            "failed_files": len(self.failed),
+            "issues": self.issues,
+            "by_code": dict(sorted(self.by_code.items())),
+        }
@@ -0,0 +1,115 @@
+"""
+Violation budgets for validation runs that may stop early.
+
+A ValidationBudget is charged for every violation as rules report it.
+Once a limit is exceeded the current traversal stops, no further file is
+validated and validate_files() stops feeding the process pool. This is
+what CI gates want: a yes/no answer, not the full list.
+"""
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised by RuleContext.report() to end a traversal early.
+    """
+
+
+class ValidationBudget:
+    """
+    Limits on how many violations a run may find before it stops.
+
+    Args:
+        max_violations (int | None): Violations allowed in total; 0 stops
+            at the first one.
+        per_code (dict | None): { code or prefix: allowed }, e.g.
+            { "D1": 0, "D202": 10 }. A violation counts against every
+            entry its code starts with.
+    """
+
+    def __init__(self, max_violations=None, per_code=None):
+        self.max_violations = max_violations
+        self.per_code = {code.upper(): limit for code, limit in (per_code or {}).items()}
+        self.total = 0
+        self.counts = dict.fromkeys(self.per_code, 0)
+        # "total" or the code prefix whose limit was exceeded
+        self.exceeded_by = None
+
+    @classmethod
+    def fail_fast(cls):
+        return cls(max_violations=0)
+
+    @property
+    def exceeded(self):
+        return self.exceeded_by is not None
+
+    def charge(self, violation):
+        """
+        Count one violation.
+
+        Returns:
+            bool: True once any limit is exceeded.
+        """
+        self.total += 1
+        if self.max_violations is not None and self.total > self.max_violations:
+            self.exceeded_by = self.exceeded_by or "total"
+
+        code = violation["code"]
+        for prefix, limit in self.per_code.items():
+            if code.startswith(prefix):
+                self.counts[prefix] += 1
+                if self.counts[prefix] > limit:
+                    self.exceeded_by = self.exceeded_by or prefix
+
+        return self.exceeded
+
+    def charge_all(self, violations):
+        """
+        Charge a file's violations in order.
+
+        Returns:
+            list: The violations up to and including the one that exceeded
+            a limit (all of them if none did).
+        """
+        for index, violation in enumerate(violations):
+            if self.charge(violation):
+                return violations[:index + 1]
+        return violations
+
+    def copy(self):
+        """
+        Return a budget with the same limits and the counts so far, for a
+        worker process to charge on its own.
+        """
+        budget = ValidationBudget(self.max_violations, self.per_code)
+        budget.total = self.total
+        budget.counts = dict(self.counts)
+        budget.exceeded_by = self.exceeded_by
+        return budget
+
+    def to_dict(self):
+        return {
+            "max_violations": self.max_violations,
+            "per_code": dict(self.per_code),
+            "total": self.total,
+            "counts": dict(self.counts),
+            "exceeded_by": self.exceeded_by,
+        }
+
+
+def parse_budgets(text):
+    """
+    Parse "D1=0,D202=10" into { "D1": 0, "D202": 10 }.
+
+    Raises:
+        ValueError: An entry is not CODE=N with N >= 0.
+    """
+    budgets = {}
+    for entry in text.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        code, sep, limit = entry.partition("=")
+        if not sep or not code.strip() or not limit.strip().isdigit():
+            raise ValueError(f"Invalid budget {entry!r}, expected CODE=N")
+        budgets[code.strip().upper()] = int(limit)
+    return budgets
@@ -0,0 +1,146 @@
+"""
+Read the parameter names a docstring documents.
+
+Understands the three styles the generator writes:
+
+- Google: ``Args:`` with indented ``name (type): description`` entries
+- NumPy: ``Parameters`` (underlined or with a colon) and ``name : type``
+  entries
+- reST: ``:param name:`` or ``:param type name:`` fields
+
+Docstrings are expected to be cleaned (``ast.get_docstring``), so
+indentation is relative to the docstring itself.
+"""
+
+import re
+from functools import lru_cache
+
+
+PARAM_SECTIONS = frozenset({
+    "args",
+    "arguments",
+    "parameters",
+    "params",
+    "keyword args",
+    "keyword arguments",
+    "other parameters",
+})
+
+# Headers that end a parameter section when met at entry indentation
+OTHER_SECTIONS = frozenset({
+    "attributes",
+    "example",
+    "examples",
+    "methods",
+    "note",
+    "notes",
+    "raises",
+    "references",
+    "return",
+    "returns",
+    "see also",
+    "todo",
+    "warning",
+    "warnings",
+    "warns",
+    "yield",
+    "yields",
+})
+
+_REST_PARAM = re.compile(r":(?:param|parameter|arg|argument|key|keyword)\s+(?:[^:]*\s)?\*{0,2}(\w+)\s*:")
+_UNDERLINE = re.compile(r"^\s*-{3,}\s*$")
+_IDENTIFIER = re.compile(r"^[A-Za-z_]\w*$")
+
+# Distinct docstrings seen per process; most scans repeat a few templates
+CACHE_SIZE = 65536
+
+
+def _indent(line):
+    return len(line) - len(line.lstrip())
+
+
+def _header(line):
+    """
+    Return the lower-cased section name of a header line, or None.
+    """
+    text = line.strip().rstrip(":").strip().lower()
+    if text in PARAM_SECTIONS or text in OTHER_SECTIONS:
+        return text
+    return None
+
+
+def _entry_names(text):
+    """
+    Return the names of a Google or NumPy parameter entry line.
+
+    ``x (int): ...``, ``x : int``, ``x, y : int``, ``*args: ...`` and a
+    bare ``x`` are all accepted.
+    """
+    head = text.split(":", 1)[0]
+    head = head.split("(", 1)[0]
+
+    names = []
+    for part in head.split(","):
+        name = part.strip().lstrip("*")
+        if not _IDENTIFIER.match(name):
+            return ()
+        names.append(name)
+    return names
+
+
+def _section_params(lines, start, header_indent):
+    if start < len(lines) and _UNDERLINE.match(lines[start]):
+        start += 1
+
+    entry_indent = None
+    names = []
+
+    for index in range(start, len(lines)):
+        line = lines[index]
+        if not line.strip():
+            continue
+
+        indent = _indent(line)
+        if entry_indent is None:
+            # Google nests entries below the header, NumPy aligns them
+            if indent < header_indent:
+                break
+            entry_indent = indent
+
+        if indent < entry_indent:
+            break
+        if indent > entry_indent:
+            continue
+
+        next_line = lines[index + 1] if index + 1 < len(lines) else ""
+        if _header(line) or _UNDERLINE.match(next_line):
+            break
+
+        names.extend(_entry_names(line.strip()))
+
+    return names
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def documented_params(docstring):
+    """
+    Return the parameter names documented in a docstring.
+
+    Returns:
+        frozenset[str]: Names without leading ``*``.
+    """
+    if not docstring or (":" not in docstring and "--" not in docstring):
+        return frozenset()
+
+    names = set(_REST_PARAM.findall(docstring))
+
+    lines = docstring.splitlines()
+    for index, line in enumerate(lines):
+        if _header(line) not in PARAM_SECTIONS:
+            continue
+        # "Args:" or an underlined "Parameters"; a bare word is just prose
+        underlined = index + 1 < len(lines) and _UNDERLINE.match(lines[index + 1])
+        if line.rstrip().endswith(":") or underlined:
+            names.update(_section_params(lines, index + 1, _indent(line)))
+
+    return frozenset(names)
@@ -0,0 +1,253 @@
+"""
+PEP 257 layout rules (D200-D213, D300, D400) read from the token stream.
+
+Quote style, raw docstring text and blank lines around a docstring come
+from the module's TokenIndex (one tokenize pass per file, shared by all
+of these rules) rather than from splitting the source into lines.
+"""
+
+import ast
+
+from ai_powered.core.validator.rules import Rule, register
+
+
+DEFINITIONS = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+def _name(node):
+    return getattr(node, "name", "module")
+
+
+def _leading(line):
+    return line[:len(line) - len(line.lstrip(" \t"))]
+
+
+class LayoutRule(Rule):
+    """
+    Base for rules that inspect a non-empty docstring's token.
+    """
+
+    node_types = DEFINITIONS
+
+    def check(self, node, context):
+        info = context.docstring(node)
+        if info is not None:
+            self.check_docstring(node, info[0], info[1], context)
+
+    def check_docstring(self, node, token, text, context):
+        raise NotImplementedError
+
+    def report(self, context, line, node, **values):
+        context.report(self.code, line, self.message.format(name=_name(node), **values))
+
+
+# ------------------------------------------------------------
+# D20x: whitespace around and inside the docstring
+# ------------------------------------------------------------
+
+@register
+class OneLineDocstringOnOneLine(LayoutRule):
+    code = "D200"
+    message = "One-line docstring should fit on one line with quotes in {name}"
+
+    def check_docstring(self, node, token, text, context):
+        if token.is_multiline and "\n" not in token.body.strip():
+            self.report(context, token.start[0], node)
+
+
+@register
+class NoBlankLineBeforeFunctionDocstring(LayoutRule):
+    code = "D201"
+    node_types = FUNCTIONS
+    message = "No blank lines allowed before function docstring in {name} (found {count})"
+
+    def check_docstring(self, node, token, text, context):
+        count = context.tokens.blank_before(token.start[0])
+        if count:
+            self.report(context, token.start[0] - 1, node, count=count)
+
+
+@register
+class NoBlankLineAfterFunctionDocstring(LayoutRule):
+    code = "D202"
+    # Matches D103, which also only covers plain functions
+    node_types = (ast.FunctionDef,)
+    message = "No blank lines allowed after function docstring in {name}"
+    version = 2
+
+    def check_docstring(self, node, token, text, context):
+        end_row = token.end[0]
+        if end_row + 1 in context.tokens.blank_rows:
+            self.report(context, end_row + 1, node)
+
+
+@register
+class OneBlankLineBeforeClassDocstring(LayoutRule):
+    code = "D203"
+    node_types = (ast.ClassDef,)
+    message = "1 blank line required before class docstring in {name} (found {count})"
+    # Conflicts with D211, which PEP 257 prefers
+    default = False
+
+    def check_docstring(self, node, token, text, context):
+        count = context.tokens.blank_before(token.start[0])
+        if count != 1:
+            self.report(context, token.start[0], node, count=count)
+
+
+@register
+class OneBlankLineAfterClassDocstring(LayoutRule):
+    code = "D204"
+    node_types = (ast.ClassDef,)
+    message = "1 blank line required after class docstring in {name} (found {count})"
+
+    def check_docstring(self, node, token, text, context):
+        if len(node.body) < 2:
+            return
+        count = context.tokens.blank_after(token.end[0])
+        if count != 1:
+            self.report(context, token.end[0], node, count=count)
+
+
+@register
+class BlankLineAfterSummary(LayoutRule):
+    code = "D205"
+    message = "1 blank line required between summary line and description in {name}"
+
+    def check_docstring(self, node, token, text, context):
+        lines = text.split("\n", 2)
+        if len(lines) > 1 and lines[1].strip():
+            self.report(context, token.start[0], node)
+
+
+def _body_indents(token):
+    """
+    Return the indentation of every non-blank line after the first,
+    including the closing-quotes line.
+    """
+    lines = token.body.split("\n")[1:]
+    indents = [_leading(line) for line in lines if line.strip()]
+    # The closing quotes line is blank in the body but still indented
+    if lines and not lines[-1].strip():
+        indents.append(lines[-1])
+    return indents
+
+
+@register
+class IndentWithSpaces(LayoutRule):
+    code = "D206"
+    message = "Docstring should be indented with spaces, not tabs in {name}"
+
+    def check_docstring(self, node, token, text, context):
+        if token.is_multiline and any("\t" in indent for indent in _body_indents(token)):
+            self.report(context, token.start[0], node)
+
+
+@register
+class UnderIndented(LayoutRule):
+    code = "D207"
+    message = "Docstring is under-indented in {name}"
+
+    def check_docstring(self, node, token, text, context):
+        indents = _body_indents(token)
+        if indents and min(len(indent) for indent in indents) < len(token.indent):
+            self.report(context, token.start[0], node)
+
+
+@register
+class OverIndented(LayoutRule):
+    code = "D208"
+    message = "Docstring is over-indented in {name}"
+
+    def check_docstring(self, node, token, text, context):
+        indents = [len(indent) for indent in _body_indents(token)]
+        expected = len(token.indent)
+        if not indents:
+            return
+        if (len(indents) > 1 and min(indents[:-1]) > expected) or indents[-1] > expected:
+            self.report(context, token.start[0], node)
+
+
+@register
+class ClosingQuotesOnSeparateLine(LayoutRule):
+    code = "D209"
+    message = "Multi-line docstring closing quotes should be on a separate line in {name}"
+
+    def check_docstring(self, node, token, text, context):
+        if "\n" in text and token.body.rsplit("\n", 1)[-1].strip():
+            self.report(context, token.end[0], node)
+
+
+@register
+class NoSurroundingWhitespace(LayoutRule):
+    code = "D210"
+    message = "No whitespaces allowed surrounding docstring text in {name}"
+
+    def check_docstring(self, node, token, text, context):
+        lines = token.body.split("\n")
+        first = lines[0]
+        if first.strip() and first[0] in " \t":
+            self.report(context, token.start[0], node)
+        elif len(lines) == 1 and first[-1:] in (" ", "\t"):
+            self.report(context, token.start[0], node)
+
+
+@register
+class NoBlankLineBeforeClassDocstring(LayoutRule):
+    code = "D211"
+    node_types = (ast.ClassDef,)
+    message = "No blank lines allowed before class docstring in {name} (found {count})"
+
+    def check_docstring(self, node, token, text, context):
+        count = context.tokens.blank_before(token.start[0])
+        if count:
+            self.report(context, token.start[0] - 1, node, count=count)
+
+
+@register
+class SummaryOnFirstLine(LayoutRule):
+    code = "D212"
+    message = "Multi-line docstring summary should start at the first line in {name}"
+    # D212 and D213 conflict; both are opt-in, as in pydocstyle's pep257 convention
+    default = False
+
+    def check_docstring(self, node, token, text, context):
+        if token.is_multiline and not token.body.split("\n", 1)[0].strip():
+            self.report(context, token.start[0], node)
+
+
+@register
+class SummaryOnSecondLine(LayoutRule):
+    code = "D213"
+    message = "Multi-line docstring summary should start at the second line in {name}"
+    default = False
+
+    def check_docstring(self, node, token, text, context):
+        if token.is_multiline and token.body.split("\n", 1)[0].strip():
+            self.report(context, token.start[0], node)
+
+
+# ------------------------------------------------------------
+# D300 / D400: quotes and summary punctuation
+# ------------------------------------------------------------
+
+@register
+class TripleDoubleQuotes(LayoutRule):
+    code = "D300"
+    message = 'Use """triple double quotes""" in {name} (found {quotes})'
+
+    def check_docstring(self, node, token, text, context):
+        # ''' is the only way to write a docstring that contains """
+        if token.quotes != '"""' and '"""' not in token.body:
+            self.report(context, token.start[0], node, quotes=token.quotes)
+
+
+@register
+class SummaryEndsWithPeriod(LayoutRule):
+    code = "D400"
+    message = "First line should end with a period in {name}"
+
+    def check_docstring(self, node, token, text, context):
+        if not text.split("\n", 1)[0].rstrip().endswith("."):
+            self.report(context, token.start[0], node)
@@ -0,0 +1,255 @@
+"""
+Pluggable validation rules and the single-pass dispatcher that runs them.
+
+Each rule subscribes to AST node types. RuleDispatcher builds a
+{node type: [checks]} table once, then walks every module a single time
+and only calls the checks subscribed to each node's type, so adding a
+rule costs work on its own node types instead of another tree walk.
+"""
+
+import ast
+import hashlib
+
+from ai_powered.core.validator.budget import BudgetExceeded
+from ai_powered.core.validator.tokens import TokenIndex
+
+
+# code -> Rule subclass, in registration order
+RULES = {}
+
+
+def register(rule_class):
+    """
+    Class decorator that adds a rule to the registry.
+    """
+    if not rule_class.code:
+        raise ValueError(f"{rule_class.__name__} has no code")
+    if rule_class.code in RULES and RULES[rule_class.code] is not rule_class:
+        raise ValueError(f"rule {rule_class.code} is already registered")
+
+    RULES[rule_class.code] = rule_class
+    return rule_class
+
+
+def unregister(code):
+    RULES.pop(code, None)
+
+
+class Rule:
+    """
+    Base class for a validation rule.
+
+    Subclasses set code, node_types and message, and implement check(),
+    which calls context.report() for every violation it finds. Bump
+    version whenever a rule's behaviour changes so cached results made
+    with the old behaviour are not reused. Rules with default = False
+    (e.g. one of a conflicting pair) only run when selected explicitly.
+    """
+
+    code = None
+    node_types = ()
+    message = ""
+    version = 1
+    default = True
+
+    def check(self, node, context):
+        raise NotImplementedError
+
+
+class RuleContext:
+    """
+    Per-file state shared by the rules during one traversal.
+
+    With a budget, report() raises BudgetExceeded as soon as a limit is
+    exceeded, which ends the traversal.
+    """
+
+    __slots__ = ("module", "violations", "budget", "_tokens", "_docstrings")
+
+    def __init__(self, module, budget=None):
+        self.module = module
+        self.violations = []
+        self.budget = budget
+        self._tokens = None
+        self._docstrings = {}
+
+    @property
+    def tokens(self):
+        """
+        The module's TokenIndex, built by one tokenize pass on first use.
+        """
+        if self._tokens is None:
+            self._tokens = TokenIndex(self.module.source)
+        return self._tokens
+
+    def docstring(self, node):
+        """
+        Return (token, cleaned text) of a node's non-empty docstring, or
+        None. Shared by every layout rule that looks at the same node.
+        """
+        key = id(node)
+        if key not in self._docstrings:
+            info = None
+            doc_node = _docstring_node(node)
+            if doc_node is not None:
+                text = ast.get_docstring(node)
+                token = self.tokens.string_at(doc_node.lineno, doc_node.col_offset)
+                if text and token is not None:
+                    info = (token, text)
+            self._docstrings[key] = info
+        return self._docstrings[key]
+
+    def report(self, code, line, message):
+        violation = {
+            "code": code,
+            "line": line,
+            "message": message
+        }
+        self.violations.append(violation)
+        if self.budget is not None and self.budget.charge(violation):
+            raise BudgetExceeded(code)
+
+
+def _matches(code, patterns):
+    # "D1" selects D101 and D103, like pydocstyle/ruff prefixes
+    return any(code.startswith(pattern) for pattern in patterns)
+
+
+def _patterns(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(part.strip().upper() for part in value if part.strip())
+
+
+def ruleset_fingerprint(rules):
+    """
+    Return a stable digest of the enabled rules and their versions.
+
+    Returns:
+        str: Hex digest; equal for the same set of rules in any order.
+    """
+    parts = sorted(
+        f"{rule.code}:{rule.version}:{type(rule).__module__}.{type(rule).__qualname__}"
+        for rule in rules
+    )
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def select_rules(select=None, ignore=None, registry=None):
+    """
+    Instantiate the enabled rules.
+
+    Args:
+        select (str | list | None): Codes or code prefixes to enable;
+            None enables every registered rule marked default.
+        ignore (str | list | None): Codes or prefixes to disable.
+        registry (dict | None): Rules to choose from, default RULES.
+
+    Raises:
+        ValueError: A code or prefix matches no registered rule.
+
+    Returns:
+        list[Rule]: Enabled rules, in registration order.
+    """
+    registry = RULES if registry is None else registry
+    select = _patterns(select)
+    ignore = _patterns(ignore) or ()
+
+    for pattern in (select or ()) + ignore:
+        if not any(code.startswith(pattern) for code in registry):
+            raise ValueError(f"unknown rule code {pattern!r}")
+
+    return [
+        rule_class()
+        for code, rule_class in registry.items()
+        if (rule_class.default if select is None else _matches(code, select))
+        and not _matches(code, ignore)
+    ]
+
+
+class RuleDispatcher:
+    """
+    Run a set of rules over a module in one traversal.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.codes = tuple(rule.code for rule in self.rules)
+        self.fingerprint = ruleset_fingerprint(self.rules)
+        self._table = {}
+
+        for rule in self.rules:
+            for node_type in rule.node_types:
+                self._table.setdefault(node_type, []).append(rule.check)
+
+    def run(self, module, budget=None):
+        """
+        Return the violations of every rule for a ParsedModule.
+
+        With a ValidationBudget, the traversal stops at the violation that
+        exceeds it; the result then ends with that violation.
+        """
+        context = RuleContext(module, budget)
+        table = self._table
+
+        if not table or (budget is not None and budget.exceeded):
+            return context.violations
+
+        try:
+            for node in ast.walk(module.tree):
+                checks = table.get(type(node))
+                if checks is not None:
+                    for check in checks:
+                        check(node, context)
+        except BudgetExceeded:
+            pass
+
+        return context.violations
+
+
+# ------------------------------------------------------------
+# Built-in rules
+# ------------------------------------------------------------
+
+def _docstring_node(node):
+    """
+    Return the docstring expression of a module or definition, or None.
+    """
+    if not node.body:
+        return None
+    first = node.body[0]
+    if (
+        isinstance(first, ast.Expr)
+        and isinstance(first.value, ast.Constant)
+        and isinstance(first.value.value, str)
+    ):
+        return first
+    return None
+
+
+@register
+class MissingClassDocstring(Rule):
+    code = "D101"
+    node_types = (ast.ClassDef,)
+    message = "Missing docstring in public class {name}"
+
+    def check(self, node, context):
+        if not ast.get_docstring(node):
+            context.report(self.code, node.lineno, self.message.format(name=node.name))
+
+
+@register
+class MissingFunctionDocstring(Rule):
+    code = "D103"
+    node_types = (ast.FunctionDef,)
+    message = "Missing docstring in public function {name}"
+
+    def check(self, node, context):
+        if not ast.get_docstring(node):
+            context.report(self.code, node.lineno, self.message.format(name=node.name))
+
+
+# Layout rules register themselves after the AST-only ones
+from ai_powered.core.validator import layout_rules  # noqa: E402,F401
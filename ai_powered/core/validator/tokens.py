@@ -0,0 +1,105 @@
+"""
+Token-stream index used by the docstring layout rules.
+
+One tokenize pass per file records every STRING token and every blank
+physical line (NL tokens on empty lines). Layout rules then read quote
+style, raw docstring text and blank lines around a docstring from this
+index instead of re-splitting the source.
+"""
+
+import io
+import tokenize
+
+
+class DocstringToken:
+    """
+    A STRING token that may be a docstring.
+
+    Attributes:
+        text (str): Raw token text, prefix and quotes included.
+        start (tuple): (row, col) of the opening quote's prefix.
+        end (tuple): (row, col) just past the closing quotes.
+        indent (str): Leading whitespace of the token's first line.
+    """
+
+    __slots__ = ("text", "start", "end", "indent")
+
+    def __init__(self, text, start, end, indent):
+        self.text = text
+        self.start = start
+        self.end = end
+        self.indent = indent
+
+    @property
+    def prefix(self):
+        return self.text[:len(self.text) - len(self.text.lstrip("rRuUbBfF"))]
+
+    @property
+    def quotes(self):
+        body = self.text[len(self.prefix):]
+        return body[:3] if body[:3] in ('"""', "'''") else body[:1]
+
+    @property
+    def body(self):
+        """
+        The raw text between the quotes, indentation untouched.
+        """
+        start = len(self.prefix) + len(self.quotes)
+        return self.text[start:len(self.text) - len(self.quotes)]
+
+    @property
+    def is_multiline(self):
+        return self.end[0] > self.start[0]
+
+
+class TokenIndex:
+    """
+    STRING tokens by position and blank rows of one module.
+    """
+
+    def __init__(self, source):
+        self._strings = {}
+        self.blank_rows = set()
+
+        readline = io.StringIO(source).readline
+        try:
+            for token in tokenize.generate_tokens(readline):
+                if token.type == tokenize.STRING:
+                    self._add_string(token)
+                elif token.type == tokenize.NL and not token.line.strip():
+                    self.blank_rows.add(token.start[0])
+        except (tokenize.TokenError, SyntaxError):
+            # Callers only index modules ast already parsed; keep what we have
+            pass
+
+    def _add_string(self, token):
+        row, col = token.start
+        line = token.line
+        # ast reports UTF-8 byte offsets, tokenize reports characters
+        byte_col = col if line.isascii() else len(line[:col].encode("utf-8"))
+        indent = line[:len(line) - len(line.lstrip(" \t"))]
+        self._strings[(row, byte_col)] = DocstringToken(token.string, token.start, token.end, indent)
+
+    def string_at(self, lineno, col_offset):
+        """
+        Return the STRING token an AST node starts at, or None.
+        """
+        return self._strings.get((lineno, col_offset))
+
+    def blank_before(self, row):
+        """
+        Count blank lines directly above row.
+        """
+        count = 0
+        while row - count - 1 in self.blank_rows:
+            count += 1
+        return count
+
+    def blank_after(self, row):
+        """
+        Count blank lines directly below row.
+        """
+        count = 0
+        while row + count + 1 in self.blank_rows:
+            count += 1
+        return count
@@ -0,0 +1,160 @@
+"""
+Cache of validator output keyed by file content and ruleset.
+
+Entries are keyed by (content hash, ruleset fingerprint), so a file is
+only validated again when its bytes or the enabled rules change. Hits are
+served from memory first, then from a content-addressed store on disk.
+Within a process, a file whose stat version is unchanged is answered
+without reading it at all.
+"""
+
+import os
+from collections import OrderedDict
+
+from ai_powered.core.parser.parse_cache import ParseCache, content_key
+from ai_powered.core.parser.parsed_module import ParsedModule, load_module, stat_version
+
+
+DEFAULT_VALIDATION_CACHE_DIR = "storage/cache/validation"
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_MEMORY_ENTRIES = 50_000
+
+
+class ValidationCache:
+    """
+    Two-level (memory, disk) store of violations per file version.
+
+    Args:
+        cache_dir (str | Path | None): Directory of the disk store; None
+            keeps results in memory only.
+        max_bytes (int): Size budget of the disk store.
+        memory_entries (int): Results kept in memory, least recently used
+            dropped first.
+    """
+
+    def __init__(
+        self,
+        cache_dir=DEFAULT_VALIDATION_CACHE_DIR,
+        max_bytes=DEFAULT_MAX_BYTES,
+        memory_entries=DEFAULT_MEMORY_ENTRIES,
+    ):
+        self.store = None if cache_dir is None else ParseCache(cache_dir, max_bytes)
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        # (path, fingerprint) -> (stat version, content key), bounded like
+        # _memory
+        self._versions = OrderedDict()
+
+    def validate(self, file_or_module, dispatcher, budget=None):
+        """
+        Return the violations of a file for dispatcher's rules, running the
+        rules only on a miss.
+
+        A budget is charged for cached results too. Results cut short by
+        the budget are partial and never stored.
+
+        Returns:
+            list[dict]: { code, line, message } per violation.
+        """
+        violations, entry = self.lookup(file_or_module, dispatcher.fingerprint)
+        if violations is not None:
+            return violations if budget is None else budget.charge_all(violations)
+
+        violations = dispatcher.run(entry["module"], budget)
+        if budget is None or not budget.exceeded:
+            self.store_result(entry, violations)
+        return _copy(violations)
+
+    def lookup(self, file_or_module, fingerprint):
+        """
+        Look a file up without running any rule.
+
+        Returns:
+            tuple: (violations, None) on a hit; on a miss (None, entry),
+            where entry carries the loaded module and is passed back to
+            store_result() once the rules have run.
+        """
+        if isinstance(file_or_module, ParsedModule):
+            module = file_or_module
+            path, version = module.path, module.version
+        else:
+            module = None
+            path = str(file_or_module)
+            version = stat_version(os.stat(path))
+
+        known = self._versions.get((path, fingerprint))
+        if known is not None:
+            self._versions.move_to_end((path, fingerprint))
+        if known is not None and version is not None and known[0] == version:
+            violations = self._get_memory(known[1])
+            if violations is not None:
+                self.hits += 1
+                return _copy(violations), None
+
+        if module is None:
+            module = load_module(path)
+
+        key = content_key(module.content_hash, fingerprint)
+        violations = self._get_memory(key)
+
+        if violations is None and self.store is not None:
+            violations = self.store.get(key)
+            if violations is not None:
+                self._put_memory(key, violations)
+
+        if version is not None:
+            self._put_version((path, fingerprint), (version, key))
+
+        if violations is not None:
+            self.hits += 1
+            return _copy(violations), None
+
+        self.misses += 1
+        return None, {"key": key, "module": module}
+
+    def store_result(self, entry, violations):
+        """
+        Save the violations computed for a lookup() miss.
+        """
+        self._put_memory(entry["key"], violations)
+        if self.store is not None:
+            self.store.put(entry["key"], violations)
+
+    def _get_memory(self, key):
+        violations = self._memory.get(key)
+        if violations is not None:
+            self._memory.move_to_end(key)
+        return violations
+
+    def _put_memory(self, key, violations):
+        self._memory[key] = violations
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _put_version(self, key, known):
+        self._versions[key] = known
+        self._versions.move_to_end(key)
+        while len(self._versions) > self.memory_entries:
+            self._versions.popitem(last=False)
+
+    def clear(self):
+        """
+        Drop every cached result.
+
+        Returns:
+            int: Number of disk entries removed.
+        """
+        self._memory.clear()
+        self._versions.clear()
+        return self.store.clear() if self.store is not None else 0
+
+    def prune(self):
+        return self.store.prune() if self.store is not None else 0
+
+
+def _copy(violations):
+    # Callers may annotate or filter results; keep the cached ones intact
+    return [dict(violation) for violation in violations]
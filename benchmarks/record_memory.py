@@ -0,0 +1,74 @@
+"""
+Compare memory per function for dict records and FunctionRecord.
+
+Run with: python -m benchmarks.record_memory [N]
+"""
+
+import sys
+import tracemalloc
+
+from ai_powered.core.parser.records import ArgRecord, FunctionRecord
+
+
+def _dict_record(i, file_path):
+    return {
+        "name": f"func_{i % 1000}",
+        "qualname": f"Class{i % 50}.func_{i % 1000}",
+        "kind": "method",
+        "is_async": False,
+        "args": [
+            {"name": "self", "type": None},
+            {"name": "value", "type": "int"},
+        ],
+        "returns": "int",
+        "docstring": "",
+        "has_docstring": False,
+        "docstring_lineno": None,
+        "docstring_end_lineno": None,
+        "is_public": True,
+        "lineno": i,
+        "end_lineno": i + 3,
+        "module": file_path[:-3].replace("/", "."),
+        # Paths are rebuilt per record, as the dict-based parser did
+        "file": "".join(file_path),
+    }
+
+
+def _slotted_record(i, file_path):
+    data = _dict_record(i, file_path)
+    data["args"] = [ArgRecord(a["name"], a["type"]) for a in data["args"]]
+    return FunctionRecord(**data)
+
+
+def measure(factory, count, files=100):
+    """
+    Return the bytes allocated per record when building count records.
+    """
+    paths = [f"src/pkg/module_{n}.py" for n in range(files)]
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    records = [factory(i, paths[i % files]) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del records
+    return allocated / count
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 100_000
+
+    dict_bytes = measure(_dict_record, count)
+    slotted_bytes = measure(_slotted_record, count)
+
+    print(f"records:          {count}")
+    print(f"dict records:     {dict_bytes:8.1f} bytes/function")
+    print(f"FunctionRecord:   {slotted_bytes:8.1f} bytes/function")
+    print(f"saving:           {1 - slotted_bytes / dict_bytes:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
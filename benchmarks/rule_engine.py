@@ -0,0 +1,123 @@
+"""
+Show that the rule dispatcher scales with node count, not rules × nodes.
+
+Run with: python -m benchmarks.rule_engine [--sizes 25 50 100] [--rules 0 10 40]
+
+For every tree size and number of extra rules, validation is timed with
+the single-pass RuleDispatcher and with a naive engine that walks the
+tree once per rule.
+"""
+
+import argparse
+import ast
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from ai_powered.core.parser.parsed_module import ParsedModule
+from ai_powered.core.validator.rules import RULES, Rule, RuleContext, RuleDispatcher, select_rules
+from benchmarks.synthetic import TreeSpec, generate_tree
+
+
+def _extra_rule(number):
+    # Cheap checks on class definitions, standing in for user rules
+    class ExtraRule(Rule):
+        code = f"X{number:03d}"
+        node_types = (ast.ClassDef,)
+        message = "Class {name} is too long"
+
+        def check(self, node, context):
+            if len(node.body) > 1000:
+                context.report(self.code, node.lineno, self.message.format(name=node.name))
+
+    return ExtraRule
+
+
+def make_rules(extra):
+    registry = dict(RULES)
+    for number in range(extra):
+        rule_class = _extra_rule(number)
+        registry[rule_class.code] = rule_class
+    return select_rules(registry=registry)
+
+
+def naive_run(rules, module):
+    """
+    Reference engine: one full tree walk per rule.
+    """
+    context = RuleContext(module)
+    for rule in rules:
+        for node in ast.walk(module.tree):
+            if isinstance(node, rule.node_types):
+                rule.check(node, context)
+    return context.violations
+
+
+def _best(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def run_benchmark(sizes=(25, 50, 100), extra_rules=(0, 10, 40), repeat=3, workdir=None):
+    """
+    Time both engines for every (tree size, extra rules) pair.
+
+    Returns:
+        list[dict]: { files, nodes, rules, dispatcher_s, naive_s,
+        dispatcher_ns_per_node }
+    """
+    owned = workdir is None
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="ai-reviewer-rules-"))
+
+    try:
+        results = []
+        for files in sizes:
+            paths = generate_tree(workdir / f"tree_{files}", TreeSpec(files=files))
+            modules = [ParsedModule.from_source(p.read_text(encoding="utf-8"), p) for p in paths]
+            nodes = sum(sum(1 for _ in ast.walk(m.tree)) for m in modules)
+
+            for extra in extra_rules:
+                rules = make_rules(extra)
+                dispatcher = RuleDispatcher(rules)
+
+                dispatched = _best(lambda: [dispatcher.run(m) for m in modules], repeat)
+                naive = _best(lambda: [naive_run(rules, m) for m in modules], repeat)
+
+                results.append({
+                    "files": files,
+                    "nodes": nodes,
+                    "rules": len(rules),
+                    "dispatcher_s": round(dispatched, 6),
+                    "naive_s": round(naive, 6),
+                    "dispatcher_ns_per_node": round(dispatched / nodes * 1e9, 1),
+                })
+
+        return results
+    finally:
+        if owned:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the validation rule dispatcher")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 50, 100], help="Files per tree")
+    parser.add_argument("--rules", type=int, nargs="+", default=[0, 10, 40], help="Extra rules")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'files':>6} {'nodes':>8} {'rules':>6} {'dispatch (s)':>13} {'naive (s)':>10} {'ns/node':>8}")
+    for row in run_benchmark(args.sizes, args.rules, args.repeat):
+        print(
+            f"{row['files']:>6} {row['nodes']:>8} {row['rules']:>6} "
+            f"{row['dispatcher_s']:>13.4f} {row['naive_s']:>10.4f} "
+            f"{row['dispatcher_ns_per_node']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
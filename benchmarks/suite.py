@@ -0,0 +1,288 @@
+"""
+Time the main pipeline stages on a synthetic tree and keep a history.
+
+Run with: python -m benchmarks.suite [--files N] [--functions M] ...
+
+Each run is appended to storage/reports/benchmark_history.json together
+with the commit and tree spec, and compared with the previous run that
+used the same spec.
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ai_powered.core.docstring_engine.docstring_writer import apply_docstring
+from ai_powered.core.docstring_engine.fix_planner import apply_fixes
+from ai_powered.core.parser.parsed_module import MODULE_CACHE
+from ai_powered.core.parser.python_parser import PythonParser, parse_path
+from ai_powered.core.reporter.coverage_reporter import compute_coverage
+from ai_powered.core.validator.docstring_sections import documented_params
+from ai_powered.core.validator.validator import CodeValidator
+from benchmarks.synthetic import TreeSpec, documented_records, generate_tree
+
+
+DEFAULT_HISTORY_PATH = "storage/reports/benchmark_history.json"
+
+# Files rewritten per apply_docstring repeat
+APPLY_FILES = 20
+
+
+def _time(func, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(state)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _result(samples, items):
+    best = min(samples)
+    return {
+        "min_s": round(best, 6),
+        "median_s": round(statistics.median(samples), 6),
+        "repeat": len(samples),
+        "items": items,
+        "per_item_us": round(best / items * 1e6, 3) if items else None,
+    }
+
+
+def _cold(_=None):
+    # Every timed parse starts from disk, not from the shared module cache
+    MODULE_CACHE.clear()
+
+
+def _formatter_benchmarks(functions, repeat):
+    try:
+        from ai_powered.core.docstring_engine.generator import DocstringGenerator
+    except ImportError as exc:
+        return {"formatters": {"skipped": f"generator unavailable: {exc}"}}
+
+    results = {}
+    records = list(functions.values())
+    for style in ("numpy", "google", "rest"):
+        generator = DocstringGenerator(style=style, use_llm=False)
+        samples = _time(
+            lambda _: [generator.generate_docstring(fn) for fn in records], repeat
+        )
+        results[f"format_{style}"] = _result(samples, len(records))
+    return results
+
+
+def _apply_benchmark(tree, functions, repeat, workdir):
+    files = sorted({fn["file"] for fn in functions.values()})[:APPLY_FILES]
+    targets = {}
+    for fn in functions.values():
+        if fn["file"] in targets or fn["file"] not in files or fn["has_docstring"]:
+            continue
+        targets[fn["file"]] = fn["qualname"]
+
+    copy_root = Path(workdir) / "apply"
+
+    def setup():
+        if copy_root.exists():
+            shutil.rmtree(copy_root)
+        jobs = []
+        for file_path, qualname in targets.items():
+            target = copy_root / Path(file_path).relative_to(tree)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(file_path, target)
+            jobs.append((target, qualname))
+        _cold()
+        return jobs
+
+    def run(jobs):
+        for target, qualname in jobs:
+            apply_docstring(target, qualname, '"""\nBenchmark docstring.\n"""')
+
+    # Every undocumented function of the same files, one plan per file
+    pending = [
+        (fn["file"], fn["qualname"]) for fn in functions.values()
+        if fn["file"] in files and not fn["has_docstring"]
+    ]
+
+    def setup_all():
+        setup()
+        return [
+            (copy_root / Path(file_path).relative_to(tree), qualname, '"""\nBenchmark docstring.\n"""')
+            for file_path, qualname in pending
+        ]
+
+    return {
+        "apply_docstring": _result(_time(run, repeat, setup), len(targets)),
+        "apply_fixes": _result(_time(apply_fixes, repeat, setup_all), len(pending)),
+    }
+
+
+def run_suite(spec=None, repeat=5, workdir=None):
+    """
+    Generate a tree for spec and time every stage on it.
+
+    Returns:
+        dict: { name: { min_s, median_s, repeat, items, per_item_us } }
+    """
+    spec = spec or TreeSpec()
+    owned = workdir is None
+    workdir = Path(workdir or tempfile.mkdtemp(prefix="ai-reviewer-bench-"))
+
+    try:
+        tree = workdir / "tree"
+        files = generate_tree(tree, spec)
+
+        functions = PythonParser().extract_functions(tree)
+        validator = CodeValidator()
+        results = {}
+
+        samples = _time(lambda _: PythonParser().extract_functions(tree), repeat, _cold)
+        results["extract_functions"] = _result(samples, len(files))
+
+        samples = _time(lambda _: parse_path(tree), repeat, _cold)
+        results["parse_path"] = _result(samples, len(files))
+
+        samples = _time(
+            lambda _: [validator.validate_file(path) for path in files], repeat, _cold
+        )
+        results["validate_file"] = _result(samples, len(files))
+
+        samples = _time(lambda _: validator.validate_functions(functions), repeat)
+        results["validate_functions"] = _result(samples, len(functions))
+
+        # Unique sectioned docstrings, parsed from scratch every repeat
+        records = documented_records(functions, spec.seed)
+        samples = _time(
+            lambda _: validator.validate_functions(records), repeat,
+            documented_params.cache_clear,
+        )
+        results["validate_functions_unique"] = _result(samples, len(records))
+
+        samples = _time(lambda _: compute_coverage(functions), repeat)
+        results["compute_coverage"] = _result(samples, len(functions))
+
+        results.update(_formatter_benchmarks(functions, repeat))
+        results.update(_apply_benchmark(tree, functions, repeat, workdir))
+
+        return results
+    finally:
+        if owned:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _commit():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def load_history(path=DEFAULT_HISTORY_PATH):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+
+
+def record_run(results, spec, path=DEFAULT_HISTORY_PATH):
+    """
+    Append a run to the JSON history.
+
+    Returns:
+        dict: The stored run.
+    """
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "spec": spec.to_dict(),
+        "results": results,
+    }
+
+    history = load_history(path)
+    history.append(run)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2), encoding="utf-8")
+    return run
+
+
+def previous_run(history, spec):
+    """
+    Return the latest run in history with the same tree spec, or None.
+    """
+    for run in reversed(history):
+        if run.get("spec") == spec.to_dict():
+            return run
+    return None
+
+
+def compare(results, baseline):
+    """
+    Return { name: ratio } of min times against a baseline run (>1 is slower).
+    """
+    ratios = {}
+    for name, result in results.items():
+        before = (baseline or {}).get("results", {}).get(name, {})
+        if "min_s" in result and before.get("min_s"):
+            ratios[name] = round(result["min_s"] / before["min_s"], 3)
+    return ratios
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scan pipeline")
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--functions", type=int, default=20, help="Functions per file")
+    parser.add_argument("--docstring-ratio", type=float, default=0.5)
+    parser.add_argument("--nesting", type=int, default=2, help="Package depth")
+    parser.add_argument("--class-ratio", type=float, default=0.3)
+    parser.add_argument("--body-lines", type=int, default=4, help="Statements per function")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH)
+    parser.add_argument("--no-save", action="store_true", help="Do not append to the history")
+    args = parser.parse_args(argv)
+
+    spec = TreeSpec(
+        files=args.files,
+        functions=args.functions,
+        docstring_ratio=args.docstring_ratio,
+        nesting=args.nesting,
+        class_ratio=args.class_ratio,
+        body_lines=args.body_lines,
+        seed=args.seed,
+    )
+
+    baseline = previous_run(load_history(args.history), spec)
+    results = run_suite(spec, repeat=args.repeat)
+    ratios = compare(results, baseline)
+
+    print(f"{'benchmark':<20} {'min (s)':>10} {'median (s)':>11} {'us/item':>10} {'vs prev':>8}")
+    for name, result in results.items():
+        if "skipped" in result:
+            print(f"{name:<20} skipped: {result['skipped']}")
+            continue
+        ratio = f"{ratios[name]:.2f}x" if name in ratios else "-"
+        print(
+            f"{name:<20} {result['min_s']:>10.4f} {result['median_s']:>11.4f} "
+            f"{result['per_item_us'] or 0:>10.1f} {ratio:>8}"
+        )
+
+    if not args.no_save:
+        record_run(results, spec, args.history)
+        print("History updated:", args.history)
+
+
+if __name__ == "__main__":
+    main()
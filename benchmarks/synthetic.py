@@ -0,0 +1,181 @@
+"""
+Deterministic generator for synthetic Python source trees.
+
+The same parameters and seed always produce byte-identical trees, so
+benchmark numbers from different commits measure the same input.
+"""
+
+import random
+import shutil
+from pathlib import Path
+
+from ai_powered.core.parser.records import FunctionRecord
+
+
+TYPES = ("int", "str", "float", "bool", "list[int]", "dict[str, int]", None)
+
+
+class TreeSpec:
+    """
+    Shape of a synthetic tree.
+
+    Args:
+        files (int): Number of Python files.
+        functions (int): Functions per file (methods included).
+        docstring_ratio (float): Share of functions that get a docstring.
+        nesting (int): Package depth files are spread across.
+        class_ratio (float): Share of functions emitted as methods.
+        body_lines (int): Statements per function body, drives file size.
+        seed (int): Random seed.
+    """
+
+    def __init__(
+        self,
+        files=100,
+        functions=20,
+        docstring_ratio=0.5,
+        nesting=2,
+        class_ratio=0.3,
+        body_lines=4,
+        seed=0,
+    ):
+        self.files = files
+        self.functions = functions
+        self.docstring_ratio = docstring_ratio
+        self.nesting = nesting
+        self.class_ratio = class_ratio
+        self.body_lines = body_lines
+        self.seed = seed
+
+    def to_dict(self):
+        return dict(vars(self))
+
+
+def _function_source(rng, name, indent, spec, is_method):
+    pad = " " * indent
+    params = ["self"] if is_method else []
+    for i in range(rng.randint(0, 4)):
+        arg_type = rng.choice(TYPES)
+        params.append(f"arg{i}: {arg_type}" if arg_type else f"arg{i}")
+
+    returns = rng.choice(TYPES)
+    signature = f"{pad}def {name}({', '.join(params)})"
+    lines = [signature + (f" -> {returns}:" if returns else ":")]
+
+    if rng.random() < spec.docstring_ratio:
+        lines.append(f'{pad}    """')
+        lines.append(f"{pad}    Compute {name.replace('_', ' ')}.")
+        lines.append(f'{pad}    """')
+
+    for i in range(spec.body_lines):
+        kind = rng.randrange(4)
+        if kind == 0:
+            lines.append(f"{pad}    value_{i} = {rng.randint(0, 999)} * {i + 1}")
+        elif kind == 1:
+            lines.append(f"{pad}    if value_{max(i - 1, 0)} if {i} else {i}:")
+            lines.append(f"{pad}        value_{i} = {i}")
+            lines.append(f"{pad}    else:")
+            lines.append(f"{pad}        value_{i} = -{i}")
+        elif kind == 2:
+            lines.append(f"{pad}    value_{i} = [x for x in range({i + 3}) if x % 2]")
+        else:
+            lines.append(f"{pad}    for value_{i} in range({i + 2}):")
+            lines.append(f"{pad}        pass")
+
+    lines.append(f"{pad}    return None")
+    return lines
+
+
+def module_source(rng, spec, file_no):
+    """
+    Return the source of one synthetic module.
+    """
+    lines = [f'"""Synthetic module {file_no}."""', "", "import os", ""]
+    remaining = spec.functions
+    fn_no = 0
+
+    while remaining:
+        if rng.random() < spec.class_ratio:
+            methods = min(remaining, rng.randint(1, 5))
+            lines += ["", f"class Model{file_no}_{fn_no}:"]
+            for _ in range(methods):
+                lines.append("")
+                lines += _function_source(rng, f"method_{fn_no}", 4, spec, True)
+                fn_no += 1
+            remaining -= methods
+        else:
+            lines += [""]
+            lines += _function_source(rng, f"function_{fn_no}", 0, spec, False)
+            fn_no += 1
+            remaining -= 1
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
+
+
+def _sectioned_docstring(rng, fn_no, names):
+    summary = f"Compute value {fn_no} within {rng.random():.6f}."
+    style = fn_no % 3
+    if style == 0:
+        entries = "".join(
+            f"    {name} (int): Weight of {name}, {rng.random():.4f}.\n" for name in names
+        )
+        return f"{summary}\n\nArgs:\n{entries}\nReturns:\n    int: Result."
+    if style == 1:
+        entries = "".join(
+            f"{name} : int\n    Weight of {name}, {rng.random():.4f}.\n" for name in names
+        )
+        return f"{summary}\n\nParameters\n----------\n{entries}\nReturns\n-------\nint\n    Result."
+    entries = "".join(f":param int {name}: Weight, {rng.random():.4f}.\n" for name in names)
+    return f"{summary}\n\n{entries}:returns: Result."
+
+
+def documented_records(functions, seed=0):
+    """
+    Return copies of functions whose docstrings document their parameters.
+
+    Every documented function gets a unique docstring in Google, NumPy or
+    reST style, so docstring parsing cannot be served from a cache.
+    Undocumented functions stay undocumented.
+
+    Returns:
+        list[FunctionRecord]: One record per function, in map order.
+    """
+    rng = random.Random(seed)
+    records = []
+    for fn_no, fn in enumerate(functions.values()):
+        docstring = ""
+        if fn["has_docstring"]:
+            names = [arg["name"] for arg in fn["args"] if arg["name"] not in ("self", "cls")]
+            docstring = _sectioned_docstring(rng, fn_no, names)
+        records.append(FunctionRecord(
+            fn["name"], fn["qualname"], fn["kind"], args=fn["args"], docstring=docstring,
+        ))
+    return records
+
+
+def generate_tree(root, spec=None, clean=True):
+    """
+    Write a synthetic tree under root.
+
+    Returns:
+        list[Path]: The generated files, in generation order.
+    """
+    spec = spec or TreeSpec()
+    root = Path(root)
+    rng = random.Random(spec.seed)
+
+    if clean and root.exists():
+        shutil.rmtree(root)
+
+    files = []
+    for file_no in range(spec.files):
+        parts = [f"pkg{(file_no >> (2 * level)) % 4}" for level in range(spec.nesting)]
+        directory = root.joinpath(*parts)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        path = directory / f"module_{file_no}.py"
+        path.write_text(module_source(rng, spec, file_no), encoding="utf-8")
+        files.append(path)
+
+    return files
@@ -61,6 +61,9 @@ from pathlib import Path
 import streamlit as st
 import pandas as pd
 
+from ai_powered.core import tracing
+from ai_powered.core.reporter.function_index import DEFAULT_LIMIT
+
 
 # -------------------------------------------------
 # Data helpers
@@ -107,6 +110,50 @@ def filter_functions(functions, search=None, status=None):
 
 
 
+def get_function_index():
+    """
+    Return the function index of the current scan, or None before a scan.
+
+    Tabs query it with bounded result sets instead of loading every
+    function into session state.
+    """
+    index = st.session_state.get("function_index")
+    if index is None or not len(index):
+        return None
+    return index
+
+
+def display_frame(rows):
+    """
+    Return the File / Function / Docstring view of index rows.
+    """
+    return pd.DataFrame({
+        "File": [row["file"] for row in rows],
+        "Function": [row["name"] for row in rows],
+        "Docstring": ["Yes" if row["has_docstring"] else "No" for row in rows],
+    })
+
+
+def export_frame(index):
+    """
+    Return the columns written by the JSON and CSV exports.
+    """
+    return pd.DataFrame(
+        [
+            {
+                "file": row["file"],
+                "function": row["name"],
+                "has_docstring": row["has_docstring"],
+                "line_start": row["lineno"],
+                "line_end": row["end_lineno"],
+            }
+            for row in index.iter_rows()
+        ],
+        columns=["file", "function", "has_docstring", "line_start", "line_end"],
+    )
+
+
+@tracing.traced("dashboard.render", "dashboard")
 def render_dashboard():
     import streamlit as st
     import json
@@ -135,7 +182,7 @@ def render_dashboard():
     # ---------------------------
     # Top navigation buttons
     # ---------------------------
-    cols = st.columns(5)
+    cols = st.columns(6)
 
     if cols[0].button("🛠 Advanced Filters"):
         st.session_state.active_tab = "Filters"
@@ -149,7 +196,10 @@ def render_dashboard():
     if cols[3].button("🧪 Tests"):
         st.session_state.active_tab = "Tests"
 
-    if cols[4].button("💡 Help & Tips"):
+    if cols[4].button("⏱ Timings"):
+        st.session_state.active_tab = "Timings"
+
+    if cols[5].button("💡 Help & Tips"):
         st.session_state.active_tab = "Help"
 
     st.markdown("---")
@@ -259,17 +309,13 @@ def render_dashboard():
     # -------------------------------------------------
         # functions = st.session_state.get("functions", [])
 
-        functions = st.session_state.get("functions", {})
-
-        if isinstance(functions, dict):
-            functions = list(functions.values())
+        index = get_function_index()
 
-
-        if not functions:
+        if index is None:
             st.info("No functions found. Scan a folder first.")
             return
 
-        total_count = len(functions)
+        total_count = len(index)
 
     # -------------------------------------------------
     # Filter selector
@@ -282,13 +328,8 @@ def render_dashboard():
     # -------------------------------------------------
     # Apply filter logic
     # -------------------------------------------------
-        if status == "OK":
-            filtered = [f for f in functions if f.get("has_docstring")]
-        elif status == "Fix":
-            filtered = [f for f in functions if not f.get("has_docstring")]
-        else:
-            filtered = functions
-        showing_count = len(filtered)
+        showing_count = index.count(status=status)
+        filtered = index.query(status=status, limit=DEFAULT_LIMIT)
 
     # -------------------------------------------------
     # Summary cards
@@ -347,19 +388,10 @@ def render_dashboard():
         #     </tbody>
         # </table>
         # """, unsafe_allow_html=True)
-        rows = []
-
-        for fn in filtered:
-            if not isinstance(fn, dict):
-                continue
-
-            rows.append({
-                "File": fn.get("file") or fn.get("file_path", ""),
-                "Function": fn.get("name", ""),
-                "Docstring": "Yes" if fn.get("has_docstring") else "No"
-            })
+        if showing_count > len(filtered):
+            st.caption(f"Showing the first {len(filtered)} of {showing_count} functions.")
 
-        df = pd.DataFrame(rows)
+        df = display_frame(filtered)
         def docstring_style(val):
             if val == "Yes":
                 return (
@@ -415,12 +447,9 @@ def render_dashboard():
     # ---------------------------------
     # Load parsed functions
     # ---------------------------------
-        functions = st.session_state.get("functions", {})
+        index = get_function_index()
 
-        if isinstance(functions, dict):
-            functions = list(functions.values())
-
-        if not functions:
+        if index is None:
             st.info("No functions available. Scan a folder first.")
             return
 
@@ -433,12 +462,8 @@ def render_dashboard():
             st.info("Start typing to search for a function.")
             return
 
-        query_lower = query.lower()
-
-        results = [
-            fn for fn in functions
-            if query_lower in fn.get("name", "").lower()
-        ]
+        match_count = index.count(search=query)
+        results = index.query(search=query, limit=DEFAULT_LIMIT)
 
     # ---------------------------------
     # Result banner
@@ -446,7 +471,7 @@ def render_dashboard():
         st.markdown(f"""
         <div style="background:#0284c7;color:white;padding:10px;border-radius:8px;
                 text-align:center;margin-top:10px">
-            {len(results)} result(s) found for "{query}"
+            {match_count} result(s) found for "{query}"
         </div>
         """, unsafe_allow_html=True)
 
@@ -456,15 +481,7 @@ def render_dashboard():
     # ---------------------------------
     # Build table data
     # ---------------------------------
-        rows = []
-        for fn in results:
-            rows.append({
-                "File": fn.get("file", fn.get("file_path", "")),
-                "Function": fn.get("name", ""),
-                "Docstring": "Yes" if fn.get("has_docstring") else "No"
-            })
-
-        df = pd.DataFrame(rows).reset_index(drop=True)
+        df = display_frame(results)
 
     # ---------------------------------
     # Style docstring column
@@ -515,17 +532,14 @@ def render_dashboard():
     # ---------------------------------
     # Load parsed functions
     # ---------------------------------
-        functions = st.session_state.get("functions", {})
-
-        if isinstance(functions, dict):
-            functions = list(functions.values())
+        index = get_function_index()
 
-        if not functions:
+        if index is None:
             st.info("No data available. Scan a folder first.")
             return
 
-        total = len(functions)
-        documented = sum(1 for f in functions if f.get("has_docstring"))
+        total = len(index)
+        documented = index.documented_count()
         missing = total - documented
 
     # ---------------------------------
@@ -551,17 +565,7 @@ def render_dashboard():
     # ---------------------------------
     # Prepare export data
     # ---------------------------------
-        export_rows = []
-        for fn in functions:
-            export_rows.append({
-                "file": fn.get("file", fn.get("file_path", "")),
-                "function": fn.get("name"),
-                "has_docstring": fn.get("has_docstring"),
-                "line_start": fn.get("lineno"),
-                "line_end": fn.get("end_lineno"),
-            })
-
-        df = pd.DataFrame(export_rows)
+        df = export_frame(index)
 
     # ---------------------------------
     # Export buttons
@@ -571,7 +575,7 @@ def render_dashboard():
         with col1:
             st.download_button(
                 "📄 Export as JSON",
-                data=json.dumps(export_rows, indent=2),
+                data=df.to_json(orient="records", indent=2),
                 file_name="analysis.json",
                 mime="application/json",
                 use_container_width=True
@@ -588,6 +592,48 @@ def render_dashboard():
             )
             st.caption("📁 CSV format for Excel / spreadsheets")
 
+    # =========================================================
+    # ⏱ TIMINGS
+    # =========================================================
+    elif st.session_state.active_tab == "Timings":
+
+        st.markdown("""
+        <div style="background:#0ea5e9;padding:18px;border-radius:12px;color:white">
+            <h3>⏱ Timings</h3>
+            <p>Latency per stage: parser, validator, generator, writer, reporter, dashboard</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        if not tracing.is_enabled():
+            st.info("Timing is off. Tick **Record timings** in the sidebar, then scan or generate.")
+
+        rows = tracing.summarize()
+        if not rows:
+            st.info("No timings recorded yet.")
+            return
+
+        st.dataframe(
+            pd.DataFrame(rows).set_index("stage"),
+            use_container_width=True
+        )
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.download_button(
+                "📥 Download Chrome trace",
+                data=json.dumps(tracing.chrome_trace()),
+                file_name="trace.json",
+                mime="application/json",
+                use_container_width=True
+            )
+            st.caption("📁 Open in chrome://tracing or ui.perfetto.dev")
+
+        with col2:
+            if st.button("🗑 Clear timings", use_container_width=True):
+                tracing.clear()
+                st.rerun()
+
     # =========================================================
     # 💡 HELP & TIPS
     # =========================================================
@@ -3,18 +3,26 @@ from pathlib import Path
 import json
 import pandas as pd
 
-from radon.complexity import cc_visit
+from radon.complexity import cc_visit_ast
 from radon.metrics import mi_visit
 from pathlib import Path
 
 
 
 # ---- Import Core Modules (Update paths as per your.logic) ---- #
-from ai_powered.core.parser.python_parser import PythonParser
+from ai_powered.core.parser.parse_cache import ParseCache
+from ai_powered.core.parser.guard import DEFAULT_QUARANTINE_PATH, ParseGuard, Quarantine
+from ai_powered.core.parser.incremental import IncrementalScanner
+from ai_powered.core.parser.watcher import FunctionWatcher
+from ai_powered.core.parser.parsed_module import load_module
 from ai_powered.core.docstring_engine.generator import DocstringGenerator
 from ai_powered.core.validator.validator import CodeValidator
+from ai_powered.core.validator.validation_cache import ValidationCache
+from ai_powered.core.validator.batch import ValidationSummary, validate_files
 from ai_powered.core.reporter.coverage_reporter import CoverageReporter
+from ai_powered.core.reporter.function_index import DEFAULT_INDEX_PATH, DEFAULT_LIMIT, FunctionIndex
 from ai_powered.core.docstring_engine.docstring_writer import apply_docstring
+from ai_powered.core import tracing
 from dashboard_ui.dashboard import render_dashboard
 
 # Global storage path (User editable in UI)
@@ -182,11 +190,117 @@ st.markdown("""
 # Helper Functions
 # ============================================================
 
-def scan_code(path_to_scan):
-    parser = PythonParser()
-    functions = parser.extract_functions(path_to_scan)
-    coverage = CoverageReporter(functions)
-    return functions, coverage.get_metrics()
+def get_function_index(path_to_scan):
+    """
+    Return the persistent function index bound to the scanned path.
+    """
+    index = st.session_state.get("function_index")
+
+    if index is None or index.root != str(path_to_scan):
+        index = FunctionIndex(DEFAULT_INDEX_PATH, root=path_to_scan)
+        st.session_state["function_index"] = index
+
+    return index
+
+
+def get_validator(ignore=None):
+    """
+    Return a validator for the ignore list, sharing one result cache across
+    reruns so unchanged files are never validated twice.
+    """
+    cache = st.session_state.get("validation_cache")
+    if cache is None:
+        cache = ValidationCache()
+        st.session_state["validation_cache"] = cache
+
+    return CodeValidator(ignore=ignore, cache=cache)
+
+
+def get_scanner(path_to_scan, jobs=1, max_mb=10, timeout=None):
+    """
+    Return the incremental scanner kept in session state for this path.
+    """
+    scanner = st.session_state.get("scanner")
+
+    if scanner is None or scanner.root != Path(path_to_scan):
+        stop_watcher()
+        guard = ParseGuard(quarantine=Quarantine(DEFAULT_QUARANTINE_PATH))
+        scanner = IncrementalScanner(
+            path_to_scan,
+            cache=ParseCache(),
+            jobs=jobs,
+            guard=guard,
+            index=get_function_index(path_to_scan),
+        )
+        st.session_state["scanner"] = scanner
+
+    scanner.jobs = jobs
+    scanner.guard.max_bytes = int(max_mb * 1024 * 1024)
+    scanner.guard.timeout = timeout or None
+    return scanner
+
+
+def rescan_code(path_to_scan, jobs=1, max_mb=10, timeout=None):
+    """
+    Rescan incrementally, reusing the scanner kept in session state.
+    """
+    scanner = get_scanner(path_to_scan, jobs, max_mb, timeout)
+    watcher = st.session_state.get("watcher")
+
+    if watcher is not None and watcher.running:
+        # The watcher thread owns the scanner; go through its lock
+        watcher.rescan()
+    else:
+        scanner.rescan()
+
+    # Counted by the index, nothing is materialized in session state
+    return CoverageReporter(scanner.index).get_metrics()
+
+
+def refresh_files(paths, path_to_scan, jobs=1, max_mb=10, timeout=None):
+    """
+    Re-index files the app itself just rewrote.
+
+    After a page reload the index is still populated but the session has
+    no scanner yet; a fresh scanner has no snapshot to update against, so
+    it rescans the tree once (mostly parse cache hits) instead.
+    """
+    scanner = get_scanner(path_to_scan, jobs, max_mb, timeout)
+
+    def refresh():
+        if scanner.snapshot:
+            scanner.update(paths)
+        else:
+            scanner.rescan()
+
+    watcher = st.session_state.get("watcher")
+    if watcher is not None and watcher.running:
+        with watcher.lock:
+            refresh()
+    else:
+        refresh()
+
+
+def start_watcher(path_to_scan, jobs=1, max_mb=10, timeout=None):
+    """
+    Start (or keep) a background watcher for the scanned path.
+    """
+    scanner = get_scanner(path_to_scan, jobs, max_mb, timeout)
+    watcher = st.session_state.get("watcher")
+
+    if watcher is None or watcher.scanner is not scanner:
+        stop_watcher()
+        watcher = FunctionWatcher(scanner).start()
+        st.session_state["watcher"] = watcher
+
+    return watcher
+
+
+def stop_watcher():
+    watcher = st.session_state.pop("watcher", None)
+    if watcher is not None:
+        watcher.stop()
+    st.session_state.pop("watch_version", None)
 
 
 def generate_docstring(selected_function, style="numpy"):
@@ -215,319 +329,385 @@ view = st.sidebar.selectbox("Select View", ["Home", "Docstrings", "Validation",
 
 path_to_scan = st.sidebar.text_input("Path to scan", value="examples")
 output_json_path = st.sidebar.text_input("Output JSON path", value=DEFAULT_JSON_PATH)
+scan_jobs = st.sidebar.number_input("Parser workers (0 = all cores)", min_value=0, value=1)
+max_file_mb = st.sidebar.number_input("Max file size (MB)", min_value=1, value=10)
+parse_timeout = st.sidebar.number_input("Parse timeout per file (s, 0 = none)", min_value=0, value=0)
+
+function_index = get_function_index(path_to_scan)
 
 if st.sidebar.button("Scan"):
-    st.session_state["functions"], st.session_state["metrics"] = scan_code(path_to_scan)
+    rescan_code(path_to_scan, scan_jobs, max_file_mb, parse_timeout)
     st.sidebar.success("Scan completed")
 
+    quarantined = st.session_state["scanner"].quarantined
+    if quarantined:
+        st.sidebar.warning(f"Skipped {len(quarantined)} file(s) that could not be parsed")
+        for item in quarantined:
+            st.sidebar.caption(f"{item['file']}: {item['reason']} ({item['detail']})")
+
+if st.sidebar.checkbox("Watch for changes"):
+    watcher = start_watcher(path_to_scan, scan_jobs, max_file_mb, parse_timeout)
+
+    # The watcher thread writes straight to the index; reruns just query it
+    st.sidebar.caption(f"Watching {path_to_scan} (update #{watcher.version})")
+    if watcher.error:
+        st.sidebar.warning(f"Watcher error: {watcher.error}")
+else:
+    stop_watcher()
+
+# Tracing is process-wide: the setting applies to every open session
+if st.sidebar.checkbox(
+    "Record timings",
+    value=tracing.is_enabled(),
+    help="Applies to every session served by this Streamlit process.",
+):
+    tracing.enable()
+else:
+    tracing.disable()
+
+if st.sidebar.button("Clear parse cache"):
+    removed = ParseCache().clear()
+    st.session_state.get("validation_cache", ValidationCache()).clear()
+    Quarantine(DEFAULT_QUARANTINE_PATH).clear()
+    stop_watcher()
+    st.session_state.pop("scanner", None)
+    st.sidebar.info(f"Removed {removed} cached file(s)")
+
+
+# Times the rest of this rerun: index queries plus rendering of the view.
+# finish() sits in a finally block, so views that end in st.stop() are
+# timed as well.
+view_span = tracing.span("dashboard.view", "dashboard", view=view).start()
+try:
+    # Metrics come from the persistent index, so they survive reloads
+    metrics = function_index.metrics()
+    st.session_state["metrics"] = metrics if metrics["total_functions"] else {}
+
+
+    # ============================================================
+    # HOME VIEW
+    # ============================================================
+
+    if view == "Home":
+        # Styled header
+        st.markdown("""
+        <div class="home-header">
+            <h1>📊 AI-Powered Code Reviewer</h1>
+        </div>
+        """, unsafe_allow_html=True)
 
-# Initialize session state
-if "functions" not in st.session_state:
-    st.session_state["functions"] = {}
-if "metrics" not in st.session_state:
-    st.session_state["metrics"] = {}
-
+        if st.session_state["metrics"]:
+            total = st.session_state["metrics"]["total_functions"]
+            documented = st.session_state["metrics"]["documented"]
+            coverage = st.session_state["metrics"]["coverage_percent"]
 
-# ============================================================
-# HOME VIEW
-# ============================================================
-
-if view == "Home":
-    # Styled header
-    st.markdown("""
-    <div class="home-header">
-        <h1>📊 AI-Powered Code Reviewer</h1>
-    </div>
-    """, unsafe_allow_html=True)
-
-    if st.session_state["metrics"]:
-        total = st.session_state["metrics"]["total_functions"]
-        documented = st.session_state["metrics"]["documented"]
-        coverage = st.session_state["metrics"]["coverage_percent"]
-
-        # Styled metrics display
-        col1, col2, col3 = st.columns(3)
+            # Styled metrics display
+            col1, col2, col3 = st.columns(3)
         
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-label">📊 Coverage</div>
-                <div class="metric-value">{coverage}%</div>
-            </div>
-            """, unsafe_allow_html=True)
+            with col1:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-label">📊 Coverage</div>
+                    <div class="metric-value">{coverage}%</div>
+                </div>
+                """, unsafe_allow_html=True)
         
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-label">📁 Total Functions</div>
-                <div class="metric-value">{total}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            with col2:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-label">📁 Total Functions</div>
+                    <div class="metric-value">{total}</div>
+                </div>
+                """, unsafe_allow_html=True)
         
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-label">📝 Documented</div>
-                <div class="metric-value">{documented}</div>
-            </div>
-            """, unsafe_allow_html=True)
+            with col3:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="metric-label">📝 Documented</div>
+                    <div class="metric-value">{documented}</div>
+                </div>
+                """, unsafe_allow_html=True)
 
-        st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+            st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
-        # Info section with styled box
-        st.markdown("""
-        <div class="info-box">
-            <h3>ℹ️ Documentation Status</h3>
-            <ul>
-                <li>Coverage shows existing documentation only</li>
-                <li>Previewed fixes do <strong>not</strong> update coverage</li>
-                <li>Coverage updates only after real fixes are saved</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+            # Info section with styled box
+            st.markdown("""
+            <div class="info-box">
+                <h3>ℹ️ Documentation Status</h3>
+                <ul>
+                    <li>Coverage shows existing documentation only</li>
+                    <li>Previewed fixes do <strong>not</strong> update coverage</li>
+                    <li>Coverage updates only after real fixes are saved</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
 
-        st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+            st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
-        if st.button("⬇️ Download Coverage Report JSON"):
-            save_logs(st.session_state["metrics"], output_json_path)
-            st.success("✅ Report saved successfully!")
+            if st.button("⬇️ Download Coverage Report JSON"):
+                save_logs(st.session_state["metrics"], output_json_path)
+                st.success("✅ Report saved successfully!")
     
-    else:
-        st.markdown("""
-        <div class="info-box">
-            <h3>👋 Welcome to AI Code Reviewer!</h3>
-            <p>Start by scanning a folder in the sidebar to analyze your Python code quality and generate documentation.</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-
-
-
-# ============================================================
-# VALIDATION VIEW
-# ============================================================
-
-elif view == "Validation":
-    st.markdown("""
-    <div class="page-header">
-        <h2>🔍 Code Validation & Quality Analysis</h2>
-    </div>
-    """, unsafe_allow_html=True)
-
-    if st.session_state.get("functions"):
-        functions = st.session_state["functions"]
-
-        # -----------------------------
-        # Group functions by file
-        # -----------------------------
-        files = {}
-        for func in functions.values():
-            file_path = func["file"]
-            files.setdefault(file_path, []).append(func)
-
-        validator = CodeValidator()
-
-        all_violations = {}
-
-        for file_path in files:
-            violations = validator.validate_file(file_path)
-            if violations:
-                all_violations[file_path] = violations
-
-        total_functions = len(functions)
-        files_with_issues = len(all_violations)
+        else:
+            st.markdown("""
+            <div class="info-box">
+                <h3>👋 Welcome to AI Code Reviewer!</h3>
+                <p>Start by scanning a folder in the sidebar to analyze your Python code quality and generate documentation.</p>
+            </div>
+            """, unsafe_allow_html=True)
 
-        # -----------------------------
-        # Summary metrics
-        # -----------------------------
-        col1, col2, col3 = st.columns(3)
-        col1.metric("Total Functions", total_functions)
-        col2.metric("Valid Files", len(files) - files_with_issues)
-        col3.metric("Issues", sum(len(v) for v in all_violations.values()))
 
 
-                # -----------------------------
-        # Compliance bar chart
-        # -----------------------------
-        total_files = len(files)
-        violating_files = len(all_violations)
-        compliant_files = total_files - violating_files
-
-        chart_df = pd.DataFrame({
-            "Status": ["Compliant", "Violations"],
-            "Count": [compliant_files, violating_files]
-        })
-
-        st.bar_chart(
-            chart_df.set_index("Status"),
-            height=300
-        )
 
-        st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+    # ============================================================
+    # VALIDATION VIEW
+    # ============================================================
 
-        st.markdown("### 📋 Detailed Results")
+    elif view == "Validation":
+        st.markdown("""
+        <div class="page-header">
+            <h2>🔍 Code Validation & Quality Analysis</h2>
+        </div>
+        """, unsafe_allow_html=True)
 
-        search_term = st.text_input(
-            "🔎 Search files or functions...",
-            placeholder="Type name..."
-        ).lower()
+        ignore_rules = st.text_input("Ignore rules", placeholder="e.g. D202 or D1")
+        try:
+            validator = get_validator(ignore_rules)
+        except ValueError as exc:
+            st.error(str(exc))
+            validator = get_validator()
+
+        if len(function_index):
+            files = function_index.files()
+
+            # Cached per (content hash, enabled rules): reruns such as typing
+            # in the search box only stat the files; misses fan out to workers.
+            # The scanner's guard refuses quarantined and oversized files
+            guard = get_scanner(path_to_scan, scan_jobs, max_file_mb, parse_timeout).guard
+            summary = ValidationSummary().update(
+                validate_files(files, jobs=scan_jobs, validator=validator, guard=guard)
+            )
+            guard.quarantine.save()
+            all_violations = summary.violations
+
+            total_functions = len(function_index)
+
+            # -----------------------------
+            # Summary metrics
+            # -----------------------------
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Total Functions", total_functions)
+            col2.metric("Valid Files", summary.valid_files)
+            col3.metric("Issues", summary.issues)
+
+
+                    # -----------------------------
+            # Compliance bar chart
+            # -----------------------------
+            violating_files = summary.files_with_issues
+            compliant_files = summary.valid_files
+
+            chart_df = pd.DataFrame({
+                "Status": ["Compliant", "Violations"],
+                "Count": [compliant_files, violating_files]
+            })
+
+            st.bar_chart(
+                chart_df.set_index("Status"),
+                height=300
+            )
+
+            st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+
+            st.markdown("### 📋 Detailed Results")
+
+            search_term = st.text_input(
+                "🔎 Search files or functions...",
+                placeholder="Type name..."
+            ).lower()
+
+            # -----------------------------
+            # Render violations
+            # -----------------------------
+            if all_violations:
+                for file_path, violations in all_violations.items():
+                    file_name = file_path.split("\\")[-1]
+
+                    if search_term and search_term not in file_name.lower():
+                        continue
+
+                    with st.expander(f"📁 {file_name} ({len(violations)} violations)"):
+                        for v in violations:
+                            code = v["code"]
+                            msg = v["message"]
+                            line = v["line"]
+
+                            if code.startswith("D1"):
+                                st.error(f"🔴 {code} (line {line}): {msg}")
+                            else:
+                                st.warning(f"🟡 {code} (line {line}): {msg}")
+            else:
+                st.success("✅ No PEP 257 violations found!")
 
-        # -----------------------------
-        # Render violations
-        # -----------------------------
-        if all_violations:
-            for file_path, violations in all_violations.items():
-                file_name = file_path.split("\\")[-1]
-
-                if search_term and search_term not in file_name.lower():
-                    continue
-
-                with st.expander(f"📁 {file_name} ({len(violations)} violations)"):
-                    for v in violations:
-                        code = v["code"]
-                        msg = v["message"]
-                        line = v["line"]
-
-                        if code.startswith("D1"):
-                            st.error(f"🔴 {code} (line {line}): {msg}")
-                        else:
-                            st.warning(f"🟡 {code} (line {line}): {msg}")
         else:
-            st.success("✅ No PEP 257 violations found!")
-
-    else:
-        st.info("👈 Please scan a folder first to run validation.")
+            st.info("👈 Please scan a folder first to run validation.")
 
-# ============================================================
-# DOCSTRING VIEW
-# ============================================================
+    # ============================================================
+    # DOCSTRING VIEW
+    # ============================================================
 
-elif view == "Docstrings":
-    st.markdown("""
-    <div class="page-header">
-        <h2>📝 Docstring Review & Enhancement</h2>
-    </div>
-    """, unsafe_allow_html=True)
-
-    if st.session_state["functions"]:
-        func_names = list(st.session_state["functions"].keys())
-        selected_func_name = st.selectbox("Select Function to Review", func_names)
-
-        selected_func = st.session_state["functions"][selected_func_name]
-        before_doc = selected_func.get("docstring") or ""
+    elif view == "Docstrings":
+        st.markdown("""
+        <div class="page-header">
+            <h2>📝 Docstring Review & Enhancement</h2>
+        </div>
+        """, unsafe_allow_html=True)
 
-        # Function metadata
-        with st.expander("📋 Function Details", expanded=True):
-            col1, col2, col3, col4 = st.columns(4)
-            col1.metric("File", selected_func.get("file", "N/A").split("\\")[-1])
+        if len(function_index):
+            func_search = st.text_input("Filter functions", placeholder="Type part of a name...")
+            rows = function_index.query(search=func_search, limit=DEFAULT_LIMIT)
+            if not rows:
+                st.info("No function matches that filter.")
+                st.stop()
+            if len(rows) == DEFAULT_LIMIT:
+                st.caption(f"Showing the first {DEFAULT_LIMIT} matches; refine the filter to narrow down.")
+
+            selected_func_name = st.selectbox(
+                "Select Function to Review", [row["key"] for row in rows]
+            )
+
+            selected_func = function_index.get(selected_func_name)
+            before_doc = selected_func.get("docstring") or ""
+
+            # Function metadata
+            with st.expander("📋 Function Details", expanded=True):
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("File", selected_func.get("file", "N/A").split("\\")[-1])
             
-            start_line = selected_func.get("lineno", "N/A")
-            end_line = selected_func.get("end_lineno", "N/A")
-            col2.metric("Start Line", start_line)
-            col3.metric("End Line", end_line)
+                start_line = selected_func.get("lineno", "N/A")
+                end_line = selected_func.get("end_lineno", "N/A")
+                col2.metric("Start Line", start_line)
+                col3.metric("End Line", end_line)
             
-            col4.metric("Has Docstring", "✅ Yes" if before_doc.strip() else "❌ No")
+                col4.metric("Has Docstring", "✅ Yes" if before_doc.strip() else "❌ No")
 
-        # Style selection
-        st.markdown("### ⚙️ Configuration")
-        style = st.selectbox("Choose Docstring Style", ["NumPy", "Google", "reST"])
+            # Style selection
+            st.markdown("### ⚙️ Configuration")
+            style = st.selectbox("Choose Docstring Style", ["NumPy", "Google", "reST"])
         
 
-        st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+            st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
-        # Before/After comparison
-        st.markdown("### 📊 Comparison View")
-        col_before, col_after = st.columns(2)
+            # Before/After comparison
+            st.markdown("### 📊 Comparison View")
+            col_before, col_after = st.columns(2)
         
-        with col_before:
-            st.markdown("""
-            <div class="code-section">
-                <div class="code-section-title">❌ Before</div>
-            </div>
-            """, unsafe_allow_html=True)
-            if before_doc.strip():
-                st.success("Existing docstring found")
-                st.code(before_doc, language='python')
-            else:
-                st.error("No existing docstring")
-                st.code(f"def {selected_func_name}():\n    pass", language='python')
+            with col_before:
+                st.markdown("""
+                <div class="code-section">
+                    <div class="code-section-title">❌ Before</div>
+                </div>
+                """, unsafe_allow_html=True)
+                if before_doc.strip():
+                    st.success("Existing docstring found")
+                    st.code(before_doc, language='python')
+                else:
+                    st.error("No existing docstring")
+                    st.code(f"def {selected_func['name']}():\n    pass", language='python')
+
+            with col_after:
+                st.markdown("""
+                <div class="code-section">
+                    <div class="code-section-title">✅ After (Preview)</div>
+                </div>
+                """, unsafe_allow_html=True)
+                preview = generate_docstring(selected_func, style)
+                st.success("Generated docstring")
+                st.code(preview, language='python')
+            
+                # Accept button directly below generated docstring
+                if st.button("✅ Accept & Apply", use_container_width=True, key="apply_docstring"):
+                    file_path = selected_func["file"]
+                    func_name = selected_func.get("qualname", selected_func["name"])
+                    success = apply_docstring(file_path, func_name, preview)
+
+                    if success:
+                        st.success("✔️ Docstring successfully applied!")
+                        refresh_files(
+                            [Path(file_path)], path_to_scan, scan_jobs, max_file_mb, parse_timeout
+                        )
+                    else:
+                        st.error("Failed to apply docstring.")
+
+            st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
-        with col_after:
+        else:
             st.markdown("""
-            <div class="code-section">
-                <div class="code-section-title">✅ After (Preview)</div>
+            <div class="info-box">
+                <h3>👈 No functions found</h3>
+                <p>Please scan a folder first in the sidebar to get started!</p>
             </div>
             """, unsafe_allow_html=True)
-            preview = generate_docstring(selected_func, style)
-            st.success("Generated docstring")
-            st.code(preview, language='python')
-            
-            # Accept button directly below generated docstring
-            if st.button("✅ Accept & Apply", use_container_width=True, key="apply_docstring"):
-                file_path = selected_func["file"]
-                func_name = selected_func["name"]
-                success = apply_docstring(file_path, func_name, preview)
-
-                if success:
-                    st.success("✔️ Docstring successfully applied!")
-                    selected_func["docstring"] = preview
-                    st.session_state["functions"][selected_func_name] = selected_func
-                else:
-                    st.error("Failed to apply docstring.")
-
-        st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
 
-    else:
+    elif view == "Metrics":
         st.markdown("""
-        <div class="info-box">
-            <h3>👈 No functions found</h3>
-            <p>Please scan a folder first in the sidebar to get started!</p>
+        <div class="page-header">
+            <h2>📐 Code Metrics</h2>
         </div>
         """, unsafe_allow_html=True)
 
-elif view == "Metrics":
-    st.markdown("""
-    <div class="page-header">
-        <h2>📐 Code Metrics</h2>
-    </div>
-    """, unsafe_allow_html=True)
-
-    if not st.session_state.get("functions"):
-        st.info("👈 Scan a folder first to view metrics.")
-        st.stop()
-
-    # -----------------------------
-    # File selector
-    # -----------------------------
-    files = sorted({f["file"] for f in st.session_state["functions"].values()})
-    selected_file = st.selectbox("Select File", files)
-
-    source = Path(selected_file).read_text()
-
-    # -----------------------------
-    # Maintainability Index
-    # -----------------------------
-    mi = round(mi_visit(source, False), 2)
-    st.markdown("### Maintainability Index")
-    st.metric("MI", mi)
-
-    # -----------------------------
-    # Cyclomatic Complexity
-    # -----------------------------
-    st.markdown("### Function Complexity")
-
-    complexities = []
-    for block in cc_visit(source):
-        complexities.append({
-            "name": block.name,
-            "complexity": block.complexity,
-            "line": block.lineno
-        })
-
-    st.json(complexities)
-
-elif view == "Dashboard":
-    render_dashboard()
+        if not len(function_index):
+            st.info("👈 Scan a folder first to view metrics.")
+            st.stop()
+
+        # -----------------------------
+        # File selector
+        # -----------------------------
+        # Quarantined files are indexed without functions; they cannot be
+        # parsed for metrics
+        quarantine = get_scanner(path_to_scan, scan_jobs, max_file_mb, parse_timeout).guard.quarantine
+        files = [file_path for file_path in function_index.files() if quarantine.check(file_path) is None]
+        if not files:
+            st.info("No parseable files to show metrics for.")
+            st.stop()
+        selected_file = st.selectbox("Select File", files)
+
+        try:
+            module = load_module(selected_file)
+            module.tree
+        except (OSError, SyntaxError, ValueError) as exc:
+            st.warning(f"Cannot compute metrics for {selected_file}: {exc}")
+            st.stop()
+
+        # -----------------------------
+        # Maintainability Index
+        # -----------------------------
+        mi = function_index.file_metrics(selected_file).get("mi")
+        if mi is None:
+            mi = round(mi_visit(module.source, False), 2)
+            function_index.set_metrics(selected_file, {"mi": mi})
+        st.markdown("### Maintainability Index")
+        st.metric("MI", mi)
+
+        # -----------------------------
+        # Cyclomatic Complexity
+        # -----------------------------
+        st.markdown("### Function Complexity")
+
+        complexities = []
+        for block in cc_visit_ast(module.tree):
+            complexities.append({
+                "name": block.name,
+                "complexity": block.complexity,
+                "line": block.lineno
+            })
+
+        st.json(complexities)
+
+    elif view == "Dashboard":
+        render_dashboard()
+finally:
+    view_span.finish()
 
 
 
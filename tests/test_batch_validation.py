@@ -0,0 +1,126 @@
+"""Tests for pooled repository-wide validation."""
+
+from ai_powered.core.parser.parsed_module import ParsedModule
+from ai_powered.core.validator.batch import ValidationSummary, validate_files
+from ai_powered.core.validator.validation_cache import ValidationCache
+from ai_powered.core.validator.validator import CodeValidator
+from benchmarks.synthetic import TreeSpec, generate_tree
+
+
+def _by_file(results):
+    return {r["file_path"]: r for r in results}
+
+
+def test_pool_matches_serial_validation(tmp_path):
+    files = generate_tree(tmp_path / "tree", TreeSpec(files=40, functions=4))
+
+    serial = _by_file(validate_files(files, jobs=1))
+    pooled = _by_file(validate_files(files, jobs=2))
+
+    assert serial == pooled
+    assert len(pooled) == 40
+    assert all(r["error"] is None for r in pooled.values())
+
+
+def test_pool_fills_and_uses_the_cache(tmp_path):
+    files = generate_tree(tmp_path / "tree", TreeSpec(files=40, functions=3))
+    cache = ValidationCache(None)
+    validator = CodeValidator(cache=cache)
+
+    first = _by_file(validate_files(files, jobs=2, validator=validator))
+    assert cache.misses == 40
+
+    second = _by_file(validate_files(files, jobs=2, validator=validator))
+    assert cache.hits == 40
+    assert first == second
+
+
+def test_errors_are_reported_per_file(tmp_path):
+    good = tmp_path / "good.py"
+    good.write_text("def f():\n    return 1\n", encoding="utf-8")
+    bad = tmp_path / "bad.py"
+    bad.write_text("def f(:\n", encoding="utf-8")
+    module = ParsedModule.from_source("class A:\n    pass\n", "mem.py")
+
+    results = _by_file(validate_files([good, bad, tmp_path / "missing.py", module]))
+
+    assert [v["code"] for v in results[str(good)]["violations"]] == ["D103"]
+    assert results[str(bad)]["violations"] is None
+    assert results[str(bad)]["error"].startswith("SyntaxError")
+    assert results[str(tmp_path / "missing.py")]["error"].startswith("FileNotFoundError")
+    assert [v["code"] for v in results["mem.py"]["violations"]] == ["D101"]
+
+
+def test_summary_aggregates_while_streaming(tmp_path):
+    results = [
+        {"file_path": "a.py", "violations": [], "error": None},
+        {"file_path": "b.py", "violations": [
+            {"code": "D103", "line": 1, "message": "m"},
+            {"code": "D101", "line": 4, "message": "m"},
+            {"code": "D103", "line": 9, "message": "m"},
+        ], "error": None},
+        {"file_path": "c.py", "violations": None, "error": "SyntaxError: x"},
+    ]
+
+    summary = ValidationSummary().update(iter(results))
+
+    assert summary.to_dict() == {
+        "files": 3,
+        "valid_files": 1,
+        "files_with_issues": 1,
+        "failed_files": 1,
+        "issues": 3,
+        "by_code": {"D101": 1, "D103": 2},
+    }
+    assert list(summary.violations) == ["b.py"]
+    assert summary.failed == {"c.py": "SyntaxError: x"}
+
+
+def test_budget_stops_serial_and_pooled_runs_early(tmp_path):
+    from ai_powered.core.validator.budget import ValidationBudget
+
+    files = generate_tree(tmp_path / "tree", TreeSpec(files=40, functions=4))
+
+    for jobs in (1, 2):
+        budget = ValidationBudget.fail_fast()
+        results = list(validate_files(files, jobs=jobs, budget=budget))
+        assert budget.exceeded_by == "total"
+        assert len(results) < len(files)
+        assert sum(len(r["violations"]) for r in results) == 1
+
+
+def test_partial_results_are_not_cached(tmp_path):
+    from ai_powered.core.validator.budget import ValidationBudget
+
+    path = tmp_path / "mod.py"
+    path.write_text("def a():\n    pass\n\n\ndef b():\n    pass\n", encoding="utf-8")
+    cache = ValidationCache(None)
+    validator = CodeValidator(cache=cache)
+
+    assert len(validator.validate_file(path, ValidationBudget.fail_fast())) == 1
+    assert len(validator.validate_file(path)) == 2
+
+    # A budget is charged for cached results too
+    budget = ValidationBudget(per_code={"d103": 0})
+    assert len(validator.validate_file(path, budget)) == 1
+    assert budget.exceeded_by == "D103"
+    assert cache.hits == 1
+
+
+def test_guard_refusals_are_failed_results(tmp_path):
+    from ai_powered.core.parser.guard import ParseGuard
+
+    files = generate_tree(tmp_path / "tree", TreeSpec(files=40, functions=2))
+    files[0].write_text("def broken(:\n", encoding="utf-8")
+    limit = max(path.stat().st_size for path in files)
+    files[1].write_text("X = 1\n" * limit, encoding="utf-8")
+
+    for jobs in (1, 2):
+        guard = ParseGuard(max_bytes=limit)
+        results = _by_file(validate_files(files, jobs=jobs, guard=guard))
+        guard.close()
+
+        assert results[str(files[0])]["error"].startswith("syntax_error")
+        assert results[str(files[1])]["error"].startswith("too_large")
+        assert sum(r["error"] is not None for r in results.values()) == 2
+        assert set(guard.quarantine.entries) == {str(files[0]), str(files[1])}
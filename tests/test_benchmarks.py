@@ -0,0 +1,72 @@
+# tests/test_benchmarks.py
+"""Smoke tests for the benchmark suite and synthetic tree generator."""
+
+from ai_powered.core.parser.python_parser import PythonParser
+from benchmarks.suite import compare, load_history, previous_run, record_run, run_suite
+from benchmarks.synthetic import TreeSpec, generate_tree
+
+
+def test_generator_is_deterministic(tmp_path):
+    """Same spec and seed give byte-identical trees with the requested shape."""
+    spec = TreeSpec(files=6, functions=7, docstring_ratio=0.5, nesting=2, seed=3)
+    first = generate_tree(tmp_path / "a", spec)
+    second = generate_tree(tmp_path / "b", spec)
+
+    assert [p.read_bytes() for p in first] == [p.read_bytes() for p in second]
+    assert all(len(p.relative_to(tmp_path / "a").parts) == 3 for p in first)
+
+    functions = PythonParser().extract_functions(tmp_path / "a")
+    assert len(functions) == 6 * 7
+    assert 0 < sum(fn["has_docstring"] for fn in functions.values()) < len(functions)
+
+
+def test_documented_records_pass_validation(tmp_path):
+    """Generated docstrings are unique and document exactly their parameters."""
+    from ai_powered.core.validator.validator import STATUS_MISSING_DOCSTRING, STATUS_OK, CodeValidator
+    from benchmarks.synthetic import documented_records
+
+    generate_tree(tmp_path, TreeSpec(files=4, functions=9, seed=1))
+    records = documented_records(PythonParser().extract_functions(tmp_path))
+    documented = [fn.docstring for fn in records if fn.docstring]
+
+    assert len(set(documented)) == len(documented) > 0
+    assert set(CodeValidator().validate_functions(records)) == {STATUS_OK, STATUS_MISSING_DOCSTRING}
+
+
+def test_suite_records_history(tmp_path):
+    """A run times every stage and is comparable with the previous run."""
+    spec = TreeSpec(files=3, functions=4)
+    results = run_suite(spec, repeat=1)
+
+    for name in ("extract_functions", "parse_path", "validate_file", "validate_functions",
+                 "validate_functions_unique", "compute_coverage", "apply_docstring",
+                 "apply_fixes"):
+        assert results[name]["min_s"] >= 0
+
+    history = tmp_path / "history.json"
+    record_run(results, spec, history)
+    run = record_run(results, spec, history)
+
+    baseline = previous_run(load_history(history)[:-1], spec)
+    assert baseline["spec"] == run["spec"]
+    assert set(compare(results, baseline).values()) <= {1.0}
+
+
+def test_rule_engine_benchmark_matches_naive(tmp_path):
+    """The dispatcher finds the same violations as one walk per rule."""
+    from ai_powered.core.parser.parsed_module import load_module
+    from ai_powered.core.validator.rules import RuleDispatcher, select_rules
+    from benchmarks.rule_engine import make_rules, naive_run, run_benchmark
+
+    builtin = len(select_rules())
+    rows = run_benchmark(sizes=(2,), extra_rules=(0, 5), repeat=1, workdir=tmp_path)
+    assert [row["rules"] for row in rows] == [builtin, builtin + 5]
+    assert rows[0]["nodes"] == rows[1]["nodes"] > 0
+
+    rules = make_rules(5)
+    for path in generate_tree(tmp_path / "check", TreeSpec(files=2)):
+        module = load_module(path)
+        dispatched = RuleDispatcher(rules).run(module)
+        naive = naive_run(rules, module)
+        assert dispatched
+        assert sorted(dispatched, key=str) == sorted(naive, key=str)
@@ -0,0 +1,188 @@
+# tests/test_docstring_writer.py
+"""Tests for writing docstrings back to source files."""
+
+import ast
+
+from ai_powered.core.docstring_engine.docstring_writer import apply_docstring
+
+
+SOURCE = '''class A:
+    def run(self):
+        return 1
+
+
+class B:
+    def run(self):
+        return 2
+'''
+
+
+def test_apply_docstring_targets_qualified_method(tmp_path):
+    """A qualified name picks the method in the right class."""
+    file_path = tmp_path / "mod.py"
+    file_path.write_text(SOURCE)
+
+    assert apply_docstring(file_path, "B.run", '"""Run B."""') is True
+
+    tree = ast.parse(file_path.read_text())
+    a_run, b_run = tree.body[0].body[0], tree.body[1].body[0]
+
+    assert ast.get_docstring(a_run) is None
+    assert ast.get_docstring(b_run) == "Run B."
+
+
+def test_apply_docstring_unknown_function(tmp_path):
+    """Unknown names leave the file untouched."""
+    file_path = tmp_path / "mod.py"
+    file_path.write_text(SOURCE)
+
+    assert apply_docstring(file_path, "C.run", '"""Nope."""') is False
+    assert file_path.read_text() == SOURCE
+
+
+def test_fix_plan_applies_every_edit_in_one_write(tmp_path):
+    """Inserts, replaces and removes land together and keep the file valid."""
+    from ai_powered.core.docstring_engine.fix_planner import FixPlan
+
+    file_path = tmp_path / "mod.py"
+    file_path.write_text(
+        'def a():\n    return 1\n\n\n'
+        'def b():\n    """Old."""\n    return 2\n\n\n'
+        'def c():\n    """Gone."""\n\n\n'
+        'class A:\n    @staticmethod\n    def run(\n        x,\n    ):\n        return x\n'
+    )
+
+    plan = FixPlan(file_path)
+    assert plan.set_docstring("a", '"""\nDo a.\n"""')
+    assert plan.set_docstring("b", '"""New."""')
+    assert plan.remove_docstring("c")
+    assert plan.set_docstring("A.run", '"""Run."""')
+    assert not plan.set_docstring("missing", '"""Nope."""')
+    assert file_path.read_text().count('"""') == 4
+
+    assert plan.apply() == 4
+
+    tree = ast.parse(file_path.read_text())
+    a, b, c, cls = tree.body
+    assert ast.get_docstring(a) == "Do a."
+    assert ast.get_docstring(b) == "New."
+    assert ast.get_docstring(c) is None and isinstance(c.body[0], ast.Pass)
+    assert ast.get_docstring(cls.body[0]) == "Run."
+
+
+def test_fix_plan_refuses_stale_or_broken_results(tmp_path):
+    """Nothing is written when the file changed or the result won't parse."""
+    import pytest
+
+    from ai_powered.core.docstring_engine.fix_planner import FixPlan
+
+    file_path = tmp_path / "mod.py"
+    file_path.write_text(SOURCE)
+
+    plan = FixPlan(file_path)
+    plan.set_docstring("A.run", '"""Unclosed.')
+    with pytest.raises(SyntaxError):
+        plan.apply()
+    assert file_path.read_text() == SOURCE
+
+    plan = FixPlan(file_path)
+    plan.set_docstring("A.run", '"""Run A."""')
+    file_path.write_text(SOURCE + "\nX = 1\n")
+    with pytest.raises(ValueError):
+        plan.apply()
+    assert file_path.read_text() == SOURCE + "\nX = 1\n"
+
+
+def test_apply_fixes_groups_by_file(tmp_path):
+    """Fixes for many files and functions are applied per file."""
+    from ai_powered.core.docstring_engine.fix_planner import apply_fixes
+
+    first, second = tmp_path / "one.py", tmp_path / "two.py"
+    first.write_text(SOURCE)
+    second.write_text("def f():\n    return 1\n")
+
+    applied = apply_fixes([
+        (first, "A.run", '"""Run A."""'),
+        (first, "B.run", '"""Run B."""'),
+        (second, "f", '"""F."""'),
+        (second, "g", '"""G."""'),
+    ])
+
+    assert applied == {str(first): ["A.run", "B.run"], str(second): ["f"]}
+    tree = ast.parse(first.read_text())
+    assert [ast.get_docstring(cls.body[0]) for cls in tree.body] == ["Run A.", "Run B."]
+    assert ast.get_docstring(ast.parse(second.read_text()).body[0]) == "F."
+
+
+def test_apply_fixes_writes_nothing_if_any_file_fails(tmp_path):
+    """A fix that would break one file leaves every file untouched."""
+    import pytest
+
+    from ai_powered.core.docstring_engine.fix_planner import apply_fixes
+
+    first, second = tmp_path / "one.py", tmp_path / "two.py"
+    first.write_text(SOURCE)
+    second.write_text("def f():\n    return 1\n")
+
+    with pytest.raises(SyntaxError):
+        apply_fixes([
+            (first, "A.run", '"""Run A."""'),
+            (second, "f", '"""Unclosed.'),
+        ])
+
+    assert first.read_text() == SOURCE
+    assert second.read_text() == "def f():\n    return 1\n"
+
+
+def test_fix_plan_resolves_parser_qualnames(tmp_path):
+    """Names nested in if/try blocks resolve as the parser records them."""
+    from ai_powered.core.docstring_engine.fix_planner import apply_fixes
+    from ai_powered.core.parser.python_parser import PythonParser
+
+    file_path = tmp_path / "mod.py"
+    file_path.write_text(
+        "import sys\n\n\n"
+        "class A:\n"
+        "    if sys.platform:\n"
+        "        def m(self):\n"
+        "            return 1\n"
+        "    try:\n"
+        "        def n(self):\n"
+        "            def inner():\n"
+        "                return 2\n"
+        "            return inner\n"
+        "    except ImportError:\n"
+        "        pass\n"
+    )
+    qualnames = sorted(fn["qualname"] for fn in PythonParser().extract_functions(file_path).values())
+    assert qualnames == ["A.m", "A.n", "A.n.<locals>.inner"]
+
+    applied = apply_fixes([(file_path, name, '"""Doc."""') for name in qualnames])
+
+    assert applied == {str(file_path): qualnames}
+    functions = PythonParser().extract_functions(file_path).values()
+    assert all(fn["has_docstring"] for fn in functions)
+
+
+def test_fix_plan_prefers_top_level_name_over_method(tmp_path):
+    """A top-level name resolves to that function, not a method found first."""
+    from ai_powered.core.docstring_engine.fix_planner import apply_fixes
+    from ai_powered.core.parser.python_parser import PythonParser
+
+    file_path = tmp_path / "mod.py"
+    file_path.write_text(
+        "class A:\n"
+        "    def f(self):\n"
+        "        return 1\n\n\n"
+        "if True:\n"
+        "    def f():\n"
+        "        return 2\n"
+    )
+    functions = PythonParser().extract_functions(file_path)
+    assert functions["mod:f"]["qualname"] == "f"
+
+    apply_fixes([(file_path, "f", '"""Doc."""')])
+
+    functions = PythonParser().extract_functions(file_path)
+    assert functions["mod:f"]["has_docstring"]
+    assert not functions["mod:A.f"]["has_docstring"]
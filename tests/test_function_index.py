@@ -0,0 +1,85 @@
+# tests/test_function_index.py
+"""Tests for the persistent SQLite function index."""
+
+from ai_powered.core.parser.incremental import IncrementalScanner
+from ai_powered.core.reporter.coverage_reporter import CoverageReporter
+from ai_powered.core.reporter.function_index import FunctionIndex
+
+
+def _scanner(root, db):
+    return IncrementalScanner(root, index=FunctionIndex(db, root=root))
+
+
+def test_scanner_upserts_into_index(tmp_path):
+    """Rescans keep the index in step with the tree."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("def alpha(x: int):\n    \"\"\"Doc.\"\"\"\n\n\ndef beta():\n    pass\n")
+    db = tmp_path / "index.db"
+
+    scanner = _scanner(src, db)
+    scanner.rescan()
+    index = scanner.index
+
+    assert index.metrics() == {"total_functions": 2, "documented": 1, "coverage_percent": 50.0}
+    assert CoverageReporter(index).get_metrics() == index.metrics()
+    assert [row["name"] for row in index.query(status="Fix")] == ["beta"]
+
+    record = index.get("a:alpha")
+    assert record["file"] == str(src / "a.py")
+    assert [arg.to_dict() for arg in record["args"]] == [{"name": "x", "type": "int"}]
+    assert record["docstring"] == "Doc."
+
+    (src / "a.py").unlink()
+    scanner.rescan()
+    assert len(index) == 0
+    assert index.files() == []
+
+
+def test_index_persists_and_drops_deleted_files(tmp_path):
+    """A new session sees the stored rows and forgets files removed meanwhile."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("def alpha():\n    pass\n")
+    (src / "b.py").write_text("def beta():\n    pass\n")
+    db = tmp_path / "index.db"
+
+    _scanner(src, db).rescan()
+    assert len(FunctionIndex(db, root=src)) == 2
+
+    (src / "b.py").unlink()
+    scanner = _scanner(src, db)
+    scanner.rescan()
+    assert [row["key"] for row in scanner.index.query()] == ["a:alpha"]
+
+    # Other roots are isolated
+    assert len(FunctionIndex(db, root=tmp_path / "other")) == 0
+
+
+def test_bounded_queries(tmp_path):
+    """Search, paging and counts never materialize the whole table."""
+    index = FunctionIndex(":memory:", root="r")
+    index.upsert_file("r/m.py", {
+        f"m:f{i}": {"name": f"f{i}", "qualname": f"f{i}", "has_docstring": i % 2 == 0,
+                    "lineno": i + 1, "args": []}
+        for i in range(50)
+    })
+
+    assert len(index.query(limit=10)) == 10
+    assert index.query(limit=5, offset=45)[-1]["name"] == "f49"
+    assert index.count(search="F1") == 11
+    assert index.count(search="%") == 0
+    assert index.count(status="OK") == 25
+    assert sum(1 for _ in index.iter_rows(batch_size=7)) == 50
+
+
+def test_metrics_reset_when_file_changes(tmp_path):
+    """Stored metrics are dropped when a file is re-indexed."""
+    index = FunctionIndex(":memory:", root="r")
+    index.upsert_file("r/m.py", {})
+
+    index.set_metrics("r/m.py", {"mi": 71.5})
+    assert index.file_metrics("r/m.py") == {"mi": 71.5}
+
+    index.upsert_file("r/m.py", {})
+    assert index.file_metrics("r/m.py") == {}
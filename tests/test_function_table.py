@@ -0,0 +1,31 @@
+# tests/test_function_table.py
+"""Tests for the columnar function table."""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from ai_powered.core.parser.python_parser import PythonParser
+from ai_powered.core.reporter.coverage_reporter import CoverageReporter
+from ai_powered.core.reporter.function_table import FunctionTable
+
+
+def test_table_has_one_row_per_function():
+    """Every scanned function becomes a row with the expected columns."""
+    functions = PythonParser().extract_functions("examples")
+    table = FunctionTable.from_records(functions)
+
+    assert len(table) == len(functions)
+    assert list(table.frame.columns) == FunctionTable.COLUMNS
+    assert list(table.frame["key"]) == list(functions)
+    assert set(table.file_column()) == {fn["file"] for fn in functions.values()}
+
+
+def test_coverage_from_table_matches_dict():
+    """CoverageReporter gives the same metrics for a table and a dict."""
+    functions = PythonParser().extract_functions("examples")
+
+    assert (
+        CoverageReporter(FunctionTable.from_records(functions)).get_metrics()
+        == CoverageReporter(functions).get_metrics()
+    )
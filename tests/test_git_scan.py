@@ -0,0 +1,158 @@
+# tests/test_git_scan.py
+"""Tests for git-aware scans of changed files."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ai_powered.core.parser.git_scan import changed_files, scan_changes
+from ai_powered.core.parser.walker import TreeWalker
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text(
+        "def keep():\n    return 1\n\n\n"
+        "def edit():\n    return 2\n\n\n"
+        "def drop():\n    return 3\n"
+    )
+    (tmp_path / "pkg" / "b.py").write_text("def untouched():\n    pass\n")
+    (tmp_path / "notes.txt").write_text("not python\n")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    return tmp_path
+
+
+def _by_name(records):
+    return sorted(record["qualname"] for record in records)
+
+
+def test_only_changed_python_files_are_listed(repo):
+    """Unchanged and non-Python files are ignored; untracked files are added."""
+    (repo / "pkg" / "a.py").write_text("def keep():\n    return 1\n")
+    (repo / "pkg" / "new.py").write_text("def fresh():\n    pass\n")
+    (repo / "notes.txt").write_text("changed\n")
+
+    changes = changed_files(repo)
+
+    assert sorted((c["status"], c["path"]) for c in changes) == [
+        ("A", "pkg/new.py"),
+        ("M", "pkg/a.py"),
+    ]
+
+
+def test_added_files_have_no_old_path(repo):
+    """Added files, staged or untracked, are not looked up at the ref."""
+    (repo / "pkg" / "staged.py").write_text("def fresh():\n    pass\n")
+    _git(repo, "add", "pkg/staged.py")
+
+    changes = changed_files(repo, staged=True)
+
+    assert changes == [{"status": "A", "path": "pkg/staged.py", "old_path": None}]
+
+
+def test_walker_rules_apply_to_changed_files(repo):
+    """Tracked files in excluded or ignored trees are not scanned."""
+    for name in ("venv/lib.py", "build/gen.py", "pkg/skip_me.py", "pkg/[x].py"):
+        (repo / name).parent.mkdir(exist_ok=True)
+        (repo / name).write_text("def f():\n    pass\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "more")
+    (repo / ".gitignore").write_text("build/\n")
+    for name in ("venv/lib.py", "build/gen.py", "pkg/skip_me.py", "pkg/[x].py", "pkg/b.py"):
+        (repo / name).write_text("def g():\n    pass\n")
+
+    walker = TreeWalker(exclude=["pkg/skip_*"])
+    changes = changed_files(repo, walker=walker)
+
+    assert sorted(c["path"] for c in changes) == ["pkg/[x].py", "pkg/b.py"]
+    assert [c["path"] for c in changed_files(repo / "pkg" / "[x].py")] == ["pkg/[x].py"]
+
+
+def test_function_change_sets(repo):
+    """Functions are classified as added, modified or removed by line range."""
+    (repo / "pkg" / "a.py").write_text(
+        "def keep():\n    return 1\n\n\n"
+        "def edit():\n    return 20\n\n\n"
+        "def added():\n    pass\n"
+    )
+
+    [result] = scan_changes(repo)
+
+    assert result["status"] == "M"
+    assert _by_name(result["added"]) == ["added"]
+    assert _by_name(result["modified"]) == ["edit"]
+    assert _by_name(result["removed"]) == ["drop"]
+    assert result["added"][0]["module"] == "pkg.a"
+
+
+def test_file_names_with_spaces(repo):
+    """Hunks of a file whose name has a space are matched to its functions."""
+    for name in ("my mod.py", "plain.py"):
+        (repo / "pkg" / name).write_text("def g():\n    return 1\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "more")
+    for name in ("my mod.py", "plain.py"):
+        (repo / "pkg" / name).write_text("def g():\n    return 2\n")
+
+    results = {Path(r["file_path"]).name: r for r in scan_changes(repo)}
+
+    assert _by_name(results["my mod.py"]["modified"]) == ["g"]
+    assert _by_name(results["plain.py"]["modified"]) == ["g"]
+
+
+def test_touched_but_identical_file_is_not_reported(repo):
+    """Rewriting a file with the same content yields no change set."""
+    path = repo / "pkg" / "b.py"
+    path.write_text(path.read_text())
+
+    assert scan_changes(repo) == []
+
+
+def test_staged_mode_reads_the_index(repo):
+    """Staged scans compare the index and ignore unstaged edits."""
+    (repo / "pkg" / "b.py").write_text("def untouched():\n    pass\n\n\ndef staged():\n    pass\n")
+    _git(repo, "add", "pkg/b.py")
+    (repo / "pkg" / "b.py").write_text("def unstaged_only():\n    pass\n")
+
+    [result] = scan_changes(repo, staged=True)
+
+    assert _by_name(result["added"]) == ["staged"]
+    assert result["removed"] == []
+
+
+def test_deleted_and_renamed_files(repo):
+    """Deleted files remove their functions; pure renames change nothing."""
+    _git(repo, "mv", "pkg/b.py", "pkg/c.py")
+    (repo / "pkg" / "a.py").unlink()
+
+    results = {r["status"]: r for r in scan_changes(repo)}
+
+    assert _by_name(results["D"]["removed"]) == ["drop", "edit", "keep"]
+    assert results["R"]["file_path"].endswith("c.py")
+    assert results["R"]["added"] == results["R"]["removed"] == []
+
+
+def test_changes_since_older_ref(repo):
+    """Any commit can be the base, e.g. the merge base of a branch."""
+    (repo / "pkg" / "b.py").write_text("def untouched():\n    \"\"\"Doc.\"\"\"\n")
+    _git(repo, "commit", "-q", "-am", "doc")
+
+    assert scan_changes(repo) == []
+
+    [result] = scan_changes(repo, ref="HEAD~1")
+    assert _by_name(result["modified"]) == ["untouched"]
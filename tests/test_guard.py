@@ -0,0 +1,136 @@
+# tests/test_guard.py
+"""Tests for the per-file parse guard and quarantine."""
+
+import time
+
+from ai_powered.core.parser.guard import ParseGuard, Quarantine
+from ai_powered.core.parser.incremental import IncrementalScanner
+from ai_powered.core.parser.python_parser import PythonParser, _file_functions
+
+
+def _slow_parse(py_file, *args):
+    if "slow" in str(py_file):
+        time.sleep(30)
+    return _file_functions(py_file, *args)
+
+
+def test_syntax_error_is_quarantined_not_raised(tmp_path):
+    """A broken file is reported and the rest of the scan completes."""
+    (tmp_path / "good.py").write_text("def ok():\n    pass\n")
+    (tmp_path / "bad.py").write_text("def broken(:\n")
+
+    parser = PythonParser()
+    functions = parser.extract_functions(tmp_path)
+
+    assert list(functions) == ["good:ok"]
+    assert [q["file"] for q in parser.quarantined] == [str(tmp_path / "bad.py")]
+    assert parser.quarantined[0]["reason"] == "syntax_error"
+
+
+def test_oversized_file_is_not_parsed(tmp_path):
+    """Files over the byte budget are skipped before being read."""
+    (tmp_path / "big.py").write_text("def big():\n    pass\n" + "# pad\n" * 100)
+
+    parser = PythonParser(guard=ParseGuard(max_bytes=64))
+    assert parser.extract_functions(tmp_path) == {}
+    assert parser.quarantined[0]["reason"] == "too_large"
+
+
+def test_oversized_file_is_keyed_by_stat(tmp_path, monkeypatch):
+    """Oversized files are quarantined without hashing their content."""
+    big = tmp_path / "big.py"
+    big.write_text("def big():\n    pass\n" + "# pad\n" * 100)
+    monkeypatch.setattr("ai_powered.core.parser.guard._file_hash", None)
+
+    guard = ParseGuard(max_bytes=64)
+    error = guard.precheck(big)
+    guard.record(big, {"error": error})
+
+    assert error["hash"] is None
+    assert guard.quarantine.check(big)["reason"] == "too_large"
+
+    big.write_text("def small():\n    pass\n")
+    assert guard.quarantine.check(big) is None
+
+
+def test_save_prunes_deleted_files(tmp_path):
+    """Entries of files that no longer exist are dropped on save."""
+    store = tmp_path / "quarantine.json"
+    kept, gone = tmp_path / "kept.py", tmp_path / "gone.py"
+    kept.write_text("def broken(:\n")
+    quarantine = Quarantine(store)
+    quarantine.add(kept, "syntax_error", "h", None)
+    quarantine.add(gone, "syntax_error", "h", None)
+
+    quarantine.save()
+
+    assert list(Quarantine(store).entries) == [str(kept)]
+
+
+def test_quarantine_persists_until_content_changes(tmp_path):
+    """Quarantined files are skipped on later scans until edited."""
+    src = tmp_path / "src"
+    src.mkdir()
+    bad = src / "bad.py"
+    bad.write_text("def broken(:\n")
+    store = tmp_path / "quarantine.json"
+
+    PythonParser(guard=ParseGuard(quarantine=Quarantine(store))).extract_functions(src)
+    assert str(bad) in Quarantine(store).entries
+
+    parser = PythonParser(guard=ParseGuard(quarantine=Quarantine(store)))
+    files = list(parser.iter_files(src))
+    assert files[0]["error"]["skipped"] is True
+
+    bad.write_text("def fixed():\n    pass\n")
+    parser = PythonParser(guard=ParseGuard(quarantine=Quarantine(store)))
+    assert list(parser.extract_functions(src)) == ["bad:fixed"]
+    assert parser.quarantined == []
+    assert Quarantine(store).entries == {}
+
+
+def test_timeout_kills_the_parse(tmp_path):
+    """A file that exceeds the time budget is abandoned, later files still parse."""
+    (tmp_path / "slow.py").write_text("def slow():\n    pass\n")
+    (tmp_path / "z.py").write_text("def fast():\n    pass\n")
+
+    guard = ParseGuard(timeout=0.5)
+    started = time.monotonic()
+    try:
+        slow = guard.run(_slow_parse, tmp_path / "slow.py", tmp_path)
+        fast = guard.run(_slow_parse, tmp_path / "z.py", tmp_path)
+    finally:
+        guard.close()
+
+    assert time.monotonic() - started < 10
+    assert slow["error"]["reason"] == "timeout"
+    assert [fn["name"] for fn in fast["functions"]] == ["fast"]
+    assert fast["error"] is None
+
+
+def test_parallel_scan_reports_quarantined_files(tmp_path):
+    """Failures inside pool workers surface in the scanning process."""
+    for i in range(70):
+        (tmp_path / f"m{i:02d}.py").write_text(f"def f{i}():\n    pass\n")
+    (tmp_path / "m05.py").write_text("def broken(:\n")
+
+    parser = PythonParser(jobs=2, guard=ParseGuard(timeout=5))
+    functions = parser.extract_functions(tmp_path)
+
+    assert len(functions) == 69
+    assert [q["file"] for q in parser.quarantined] == [str(tmp_path / "m05.py")]
+
+
+def test_incremental_scanner_tracks_quarantine(tmp_path):
+    """Rescans report broken files and drop them once fixed."""
+    bad = tmp_path / "bad.py"
+    bad.write_text("def broken(:\n")
+
+    scanner = IncrementalScanner(tmp_path)
+    scanner.rescan()
+    assert [q["reason"] for q in scanner.quarantined] == ["syntax_error"]
+
+    bad.write_text("def fixed():\n    pass\n" + "\n" * 5)
+    scanner.rescan()
+    assert scanner.quarantined == []
+    assert list(scanner.functions) == ["bad:fixed"]
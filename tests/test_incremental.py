@@ -0,0 +1,100 @@
+# tests/test_incremental.py
+"""Tests for snapshot-based incremental rescans."""
+
+import os
+
+from ai_powered.core.parser.incremental import IncrementalScanner
+from ai_powered.core.parser.python_parser import PythonParser
+
+
+def _write(path, body):
+    path.write_text(body)
+    # Force a distinct mtime even on coarse-grained filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_initial_scan_matches_full_parse(tmp_path):
+    """The first rescan is a full scan."""
+    _write(tmp_path / "a.py", "def alpha():\n    pass\n")
+    _write(tmp_path / "b.py", "def beta(x):\n    \"\"\"Beta.\"\"\"\n")
+
+    scanner = IncrementalScanner(tmp_path)
+    changes = scanner.rescan()
+
+    assert len(changes["added"]) == 2
+    assert scanner.functions == PythonParser().extract_functions(tmp_path)
+
+
+def test_rescan_only_parses_changed_files(tmp_path, monkeypatch):
+    """Unchanged files are not re-parsed and the map is patched in place."""
+    _write(tmp_path / "a.py", "def alpha():\n    pass\n")
+    _write(tmp_path / "b.py", "def beta():\n    pass\n")
+
+    scanner = IncrementalScanner(tmp_path)
+    scanner.rescan()
+    functions = scanner.functions
+
+    parsed = []
+    from ai_powered.core.parser import incremental
+    original = incremental._scan_files
+    monkeypatch.setattr(
+        incremental, "_scan_files",
+        lambda files, *a: parsed.extend(files) or original(files, *a)
+    )
+
+    _write(tmp_path / "a.py", "def alpha():\n    \"\"\"Now documented.\"\"\"\n")
+    changes = scanner.rescan()
+
+    assert parsed == [tmp_path / "a.py"]
+    assert changes["changed"] == [tmp_path / "a.py"]
+    assert scanner.functions is functions
+    assert functions["a:alpha"]["has_docstring"] is True
+    assert functions == PythonParser().extract_functions(tmp_path)
+
+
+def test_rescan_handles_deleted_files(tmp_path):
+    """Deleting a file removes only that file's functions."""
+    _write(tmp_path / "a.py", "def shared():\n    pass\n")
+    _write(tmp_path / "b.py", "def shared():\n    \"\"\"From b.\"\"\"\n")
+
+    scanner = IncrementalScanner(tmp_path)
+    scanner.rescan()
+    assert set(scanner.functions) == {"a:shared", "b:shared"}
+
+    (tmp_path / "b.py").unlink()
+    changes = scanner.rescan()
+
+    assert changes["deleted"] == [tmp_path / "b.py"]
+    assert list(scanner.functions) == ["a:shared"]
+
+    (tmp_path / "a.py").unlink()
+    scanner.rescan()
+
+    assert scanner.functions == {}
+
+
+def test_update_checks_only_given_paths(tmp_path):
+    """Targeted updates classify paths and keep coverage counts in sync."""
+    _write(tmp_path / "a.py", "def alpha():\n    pass\n")
+    (tmp_path / ".gitignore").write_text("ignored.py\n")
+
+    scanner = IncrementalScanner(tmp_path)
+    scanner.rescan()
+
+    _write(tmp_path / "a.py", "def alpha():\n    \"\"\"Doc.\"\"\"\n")
+    _write(tmp_path / "b.py", "def beta():\n    pass\n")
+    _write(tmp_path / "ignored.py", "def hidden():\n    pass\n")
+
+    changes = scanner.update([tmp_path / "a.py", tmp_path / "b.py", tmp_path / "ignored.py"])
+
+    assert changes["changed"] == [tmp_path / "a.py"]
+    assert changes["added"] == [tmp_path / "b.py"]
+    assert sorted(scanner.functions) == ["a:alpha", "b:beta"]
+    assert scanner.metrics() == {
+        "total_functions": 2, "documented": 1, "coverage_percent": 50.0
+    }
+
+    (tmp_path / "a.py").unlink()
+    assert scanner.update([tmp_path / "a.py"])["deleted"] == [tmp_path / "a.py"]
+    assert scanner.metrics()["documented"] == 0
@@ -0,0 +1,96 @@
+# tests/test_memory_profile.py
+"""Tests for the memory profile of a scan."""
+
+import json
+
+from ai_powered.core.reporter.memory_profile import (
+    MemoryProfiler,
+    format_summary,
+    profile_scan,
+    write_report,
+)
+
+
+SOURCE = '''
+def documented(a, b):
+    """
+    Add.
+    """
+    return a + b
+
+
+class Model:
+    def method(self):
+        return [x for x in range(10)]
+'''
+
+
+def _tree(tmp_path, files=5):
+    tmp_path.mkdir()
+    for i in range(files):
+        (tmp_path / f"mod_{i}.py").write_text(SOURCE, encoding="utf-8")
+    return tmp_path
+
+
+def test_profile_scan_reports_every_stage(tmp_path):
+    """Every pipeline stage is measured and the totals are per file and function."""
+    root = _tree(tmp_path / "src")
+
+    report = profile_scan(root)
+
+    stages = [stage["stage"] for stage in report["stages"]]
+    assert stages[:5] == ["walk", "parse", "extract", "coverage", "validation"]
+    assert report["files"] == 5
+    assert report["functions"] == 10
+    assert report["peak_bytes"] > 0
+    assert report["bytes_per_file"] > 0
+    assert report["bytes_per_function"] > 0
+    assert all(stage["peak_bytes"] >= 0 for stage in report["stages"])
+
+
+def test_profile_scan_skips_validation(tmp_path):
+    """Validation and the table stage can be left out of the profile."""
+    report = profile_scan(_tree(tmp_path / "src", 1), validate=False, build_table=False)
+
+    assert [stage["stage"] for stage in report["stages"]] == [
+        "walk", "parse", "extract", "coverage"
+    ]
+
+
+def test_profiler_records_allocation_sites():
+    """Retained memory is attributed to the lines that allocated it."""
+    profiler = MemoryProfiler(top=5).start()
+    with profiler.stage("alloc"):
+        kept = [bytearray(1024) for _ in range(100)]
+    top_sites = profiler.stop()
+
+    stage = profiler.stages[0]
+    assert stage["retained_bytes"] >= 100 * 1024
+    assert stage["top_sites"][0]["file"] == __file__
+    assert any(site["file"] == __file__ for site in top_sites)
+    del kept
+
+
+def test_write_report_and_summary(tmp_path):
+    """The report is written as JSON and summarized as text."""
+    report = profile_scan(_tree(tmp_path / "src", 2), build_table=False)
+
+    out_path = write_report(report, tmp_path / "reports")
+
+    assert out_path.parent == tmp_path / "reports"
+    assert json.loads(out_path.read_text(encoding="utf-8"))["files"] == 2
+    summary = format_summary(report)
+    assert "extract" in summary and "bytes/function" in summary
+
+
+def test_profile_scan_skips_undecodable_files(tmp_path):
+    """Files that cannot be decoded or parsed are counted as skipped."""
+    root = _tree(tmp_path / "src", 2)
+    (root / "latin.py").write_bytes(b"NAME = '\xe9'\n")
+    (root / "broken.py").write_text("def f(:\n", encoding="utf-8")
+
+    report = profile_scan(root, build_table=False)
+
+    assert report["files"] == 4
+    assert report["skipped_files"] == 2
+    assert report["functions"] == 4
@@ -0,0 +1,81 @@
+# tests/test_parse_cache.py
+"""Tests for the on-disk parse cache."""
+
+import os
+
+from ai_powered.core.parser.parse_cache import ParseCache, content_key
+from ai_powered.core.parser.parsed_module import MODULE_CACHE
+from ai_powered.core.parser.python_parser import PythonParser, parse_file
+
+
+SOURCE = '''
+def documented(a: int) -> int:
+    """Return a."""
+    return a
+
+
+def undocumented(b):
+    return b
+'''
+
+
+def test_content_key_depends_on_version():
+    """Keys change with both content and parser version."""
+    assert content_key("abc", "1") == content_key("abc", "1")
+    assert content_key("abc", "1") != content_key("abc", "2")
+    assert content_key("abc", "1") != content_key("abd", "1")
+
+
+def test_cache_hit_skips_parsing(tmp_path, monkeypatch):
+    """Unchanged files are served from the cache without ast.parse."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "mod.py").write_text(SOURCE)
+    cache = ParseCache(tmp_path / "cache")
+
+    first = PythonParser(cache=cache).extract_functions(tmp_path / "src")
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("ast.parse should not run on a cache hit")
+
+    monkeypatch.setattr("ai_powered.core.parser.parsed_module.ast.parse", fail_parse)
+    MODULE_CACHE.clear()
+    second = PythonParser(cache=cache).extract_functions(tmp_path / "src")
+
+    assert second == first
+    assert second["mod:documented"]["has_docstring"] is True
+    assert second["mod:undocumented"]["file"] == str(tmp_path / "src" / "mod.py")
+
+
+def test_cached_records_match_uncached(tmp_path):
+    """Cached and uncached parsing produce identical records."""
+    file_path = tmp_path / "mod.py"
+    file_path.write_text(SOURCE)
+    cache = ParseCache(tmp_path / "cache")
+
+    parse_file(file_path, cache=cache)
+
+    assert parse_file(file_path, cache=cache) == parse_file(file_path)
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    """Eviction keeps the cache under max_bytes, oldest entries first."""
+    cache = ParseCache(tmp_path / "cache")
+    cache.put("aa" * 32, [{"name": "old"}])
+    cache.put("bb" * 32, [{"name": "new"}])
+    os.utime(cache._entry_path("aa" * 32), ns=(1, 1))
+
+    cache.max_bytes = cache.size() - 1
+
+    assert cache.prune() == 1
+    assert cache.get("aa" * 32) is None
+    assert cache.get("bb" * 32) == [{"name": "new"}]
+
+
+def test_clear_invalidates_all_entries(tmp_path):
+    """clear() removes every entry."""
+    cache = ParseCache(tmp_path / "cache")
+    cache.put(content_key("a", "1"), [])
+    cache.put(content_key("b", "1"), [])
+
+    assert cache.clear() == 2
+    assert cache.get(content_key("a", "1")) is None
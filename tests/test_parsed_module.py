@@ -0,0 +1,132 @@
+# tests/test_parsed_module.py
+"""Tests for the shared parse-once module cache."""
+
+import os
+
+from ai_powered.core.parser.parsed_module import ModuleCache, ParsedModule
+from ai_powered.core.validator.validator import CodeValidator
+
+
+def test_module_is_reused_until_file_changes(tmp_path):
+    """A file is parsed once per version."""
+    file_path = tmp_path / "mod.py"
+    file_path.write_text("def f():\n    pass\n")
+    cache = ModuleCache()
+
+    first = cache.load(file_path)
+    assert cache.load(file_path) is first
+    assert first.tree is first.tree
+
+    file_path.write_text("def g():\n    pass\n")
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = cache.load(file_path)
+    assert second is not first
+    assert second.content_hash != first.content_hash
+
+
+def test_cache_is_bounded_by_source_bytes(tmp_path):
+    """Least recently used modules are evicted past max_bytes."""
+    cache = ModuleCache(max_bytes=30)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.py"
+        path.write_text("x = 1\n" * 2)
+        paths.append(path)
+        cache.load(path)
+
+    assert cache.total_bytes <= 30
+    assert len(cache) == 2
+    assert cache.get(paths[0], None) is None
+
+
+def test_line_access_and_encoding_cookie():
+    """Lines come from offsets; PEP 263 cookies are honoured."""
+    data = "# -*- coding: latin-1 -*-\nname = 'caf\xe9'\n".encode("latin-1")
+    module = ParsedModule.from_bytes("mod.py", data)
+
+    assert module.line_count == 2
+    assert module.line(2) == "name = 'caf\xe9'"
+    assert module.lineno_at(module.line_offsets[1]) == 2
+
+
+def test_validator_accepts_parsed_module():
+    """validate_file works on a ParsedModule without touching disk."""
+    module = ParsedModule.from_source(
+        'def bad():\n    """Bad."""\n\n    return 1\n', "bad.py"
+    )
+
+    codes = [v["code"] for v in CodeValidator().validate_file(module)]
+
+    assert codes == ["D202"]
+
+
+def test_definition_scan_is_conservative():
+    """Only sources that cannot define anything are reported as such."""
+    from ai_powered.core.parser.parsed_module import may_contain_definitions
+
+    assert may_contain_definitions(b"def f():\n    pass\n")
+    assert may_contain_definitions(b"class A: pass\n")
+    assert may_contain_definitions(b"if x:\n    async def g(): pass\n")
+    assert not may_contain_definitions(b"")
+    assert not may_contain_definitions(b"from .core import undefined_name\n")
+    assert not may_contain_definitions(b"DEFAULTS = {'classic': 1}\n")
+
+
+def test_files_without_definitions_skip_parsing(tmp_path, monkeypatch):
+    """Constants modules and empty __init__ files are never parsed."""
+    from ai_powered.core.parser.python_parser import PythonParser
+
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "constants.py").write_text("DEFAULTS = {'classic': 1}\n")
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("ast.parse should be skipped")
+
+    monkeypatch.setattr("ai_powered.core.parser.parsed_module.ast.parse", fail_parse)
+
+    assert PythonParser().extract_functions(tmp_path) == {}
+
+
+def test_large_files_are_memory_mapped(tmp_path, monkeypatch):
+    """mmap-backed reads decode and parse like regular reads."""
+    from ai_powered.core.parser import parsed_module
+    from ai_powered.core.parser.python_parser import parse_file
+
+    file_path = tmp_path / "big.py"
+    file_path.write_bytes(
+        b"# -*- coding: latin-1 -*-\n"
+        b"def caf\xe9():\n    '''Caf\xe9.'''\n"
+    )
+
+    monkeypatch.setattr(parsed_module, "MMAP_MIN_BYTES", 1)
+    with parsed_module.open_source(file_path) as data:
+        assert not isinstance(data, bytes)
+
+    parsed_module.MODULE_CACHE.discard(file_path)
+    functions = parse_file(file_path)["functions"]
+
+    assert [fn["name"] for fn in functions] == ["caf\xe9"]
+    assert functions[0]["docstring"] == "Caf\xe9."
+
+
+def test_cache_charges_parsed_trees(tmp_path):
+    """Parsing a cached module's AST counts against the budget."""
+    from ai_powered.core.parser.parsed_module import AST_BYTES_PER_SOURCE_BYTE
+
+    source = "x = 1\n" * 2
+    cache = ModuleCache(max_bytes=len(source) * (AST_BYTES_PER_SOURCE_BYTE + 1) + len(source) // 2)
+    first = tmp_path / "a.py"
+    second = tmp_path / "b.py"
+    for path in (first, second):
+        path.write_text(source)
+
+    module = cache.load(first)
+    cache.load(second)
+    assert cache.total_bytes == 2 * len(source)
+
+    module.tree
+    assert cache.total_bytes <= cache.max_bytes
+    assert len(cache) == 1
+    assert cache.get(second, None) is None
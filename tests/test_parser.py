@@ -247,3 +247,99 @@ def test_docstring_detection():
     # Soft validation: ensure docstring field is meaningful
     doc_values = [bool(fn["docstring"].strip()) for fn in functions]
     assert any(val in (True, False) for val in doc_values)
+
+
+def test_parallel_scan_matches_serial(tmp_path, monkeypatch):
+    """Process-pool parsing returns the same records in the same order."""
+    from ai_powered.core.parser import python_parser
+    from ai_powered.core.parser.python_parser import PythonParser
+
+    for i in range(6):
+        (tmp_path / f"mod_{i}.py").write_text(
+            f"def func_{i}(x):\n    return x\n\n"
+            f"def helper_{i}():\n    \"\"\"Help.\"\"\"\n"
+        )
+
+    serial = PythonParser(jobs=1).extract_functions(tmp_path)
+
+    monkeypatch.setattr(python_parser, "PARALLEL_MIN_FILES", 0)
+    parallel = PythonParser(jobs=2).extract_functions(tmp_path)
+
+    assert list(parallel) == list(serial)
+    assert parallel == serial
+
+
+def test_iter_files_streams_per_file_results():
+    """iter_files yields one result per file, lazily."""
+    import types
+    from ai_powered.core.parser.python_parser import iter_files
+
+    stream = iter_files("examples")
+    assert isinstance(stream, types.GeneratorType)
+
+    results = list(stream)
+    assert [r["file_path"] for r in results] == sorted(r["file_path"] for r in results)
+    assert all(r["file_path"].endswith(".py") for r in results)
+
+    names = {fn["name"] for fn in parse_path("examples")[0]["functions"]}
+    assert {fn["name"] for r in results for fn in r["functions"]} == names
+
+
+def test_iter_functions_matches_parse_file():
+    """iter_functions on a single file yields the parse_file records."""
+    from ai_powered.core.parser.python_parser import iter_functions
+
+    records = list(iter_functions("examples/sample_a.py"))
+
+    assert records == parse_file("examples/sample_a.py")["functions"]
+
+
+def test_qualified_names_for_methods_and_async(tmp_path):
+    """Methods, async and nested functions get distinct qualified keys."""
+    from ai_powered.core.parser.python_parser import PythonParser
+
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "models.py").write_text(
+        "class A:\n"
+        "    def run(self):\n"
+        "        pass\n"
+        "\n"
+        "class B:\n"
+        "    \"\"\"B.\"\"\"\n"
+        "    async def run(self, x: int) -> int:\n"
+        "        \"\"\"Run.\"\"\"\n"
+        "        def inner():\n"
+        "            pass\n"
+        "        return x\n"
+    )
+
+    functions = PythonParser().extract_functions(tmp_path)
+
+    assert set(functions) == {
+        "pkg.models:A.run",
+        "pkg.models:B.run",
+        "pkg.models:B.run.<locals>.inner",
+    }
+
+    b_run = functions["pkg.models:B.run"]
+    assert b_run["kind"] == "method"
+    assert b_run["is_async"] is True
+    assert b_run["docstring_lineno"] == 8
+    assert functions["pkg.models:B.run.<locals>.inner"]["kind"] == "function"
+
+    classes = parse_file(pkg / "models.py")["classes"]
+    assert [(c["qualname"], c["has_docstring"]) for c in classes] == [
+        ("A", False), ("B", True)
+    ]
+
+
+def test_complexity_is_counted_in_the_same_pass():
+    """Functions carry a McCabe complexity computed during extraction."""
+    functions = {
+        fn["name"]: fn for fn in parse_file("examples/sample_a.py")["functions"]
+    }
+
+    assert functions["add"]["complexity"] == 1
+    assert functions["calculate_average"]["complexity"] == 3
@@ -0,0 +1,72 @@
+# tests/test_records.py
+"""Tests for compact function records."""
+
+import pickle
+
+import pytest
+
+from ai_powered.core.parser.records import ArgRecord, FunctionRecord
+
+
+def _record():
+    return FunctionRecord(
+        name="add",
+        qualname="Calc.add",
+        kind="method",
+        args=[{"name": "self"}, {"name": "a", "type": "int"}],
+        returns="int",
+        lineno=3,
+        end_lineno=5,
+        module="pkg.calc",
+        file="pkg/calc.py",
+    )
+
+
+def test_record_behaves_like_a_dict():
+    """Existing dict-style access keeps working."""
+    fn = _record()
+
+    assert fn["name"] == "add"
+    assert fn.get("docstring") == ""
+    assert fn.get("missing", "default") == "default"
+    assert "args" in fn and "missing" not in fn
+    assert fn["args"][1]["type"] == "int"
+    assert fn["args"][0].get("type") is None
+    assert fn == fn.to_dict()
+
+    fn["docstring"] = "Add numbers."
+    assert fn.docstring == "Add numbers."
+
+    with pytest.raises(KeyError):
+        fn["unknown"] = 1
+
+
+def test_record_has_no_instance_dict():
+    """Slots keep per-record overhead small."""
+    fn = _record()
+
+    assert not hasattr(fn, "__dict__")
+    assert not hasattr(fn.args[0], "__dict__")
+
+
+def test_file_paths_are_interned():
+    """Records built from separate strings share one path object."""
+    a = FunctionRecord(name="a", file="".join(["pkg/", "calc.py"]))
+    b = FunctionRecord(name="b", file="".join(["pkg/", "calc.py"]))
+
+    assert a.file is b.file
+
+
+def test_record_round_trips_through_pickle_and_dict():
+    """Records survive process-pool transport and the JSON cache."""
+    fn = _record()
+
+    assert pickle.loads(pickle.dumps(fn)) == fn
+
+    cached = fn.to_dict(location=False)
+    assert "file" not in cached
+
+    restored = FunctionRecord.from_dict(cached)
+    restored.set_location("pkg.calc", "pkg/calc.py")
+    assert restored == fn
+    assert isinstance(restored.args[0], ArgRecord)
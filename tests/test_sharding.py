@@ -0,0 +1,120 @@
+# tests/test_sharding.py
+"""Tests for sharded scans and merging of partial results."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from ai_powered.core.parser.python_parser import PythonParser
+from ai_powered.core.reporter.sharding import (
+    merge_partials,
+    parse_shard,
+    scan_report,
+    scan_shard,
+    shard_of,
+    write_partial,
+)
+from ai_powered.core.validator.validator import CodeValidator
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "src"
+    for i in range(12):
+        package = root / f"pkg{i % 3}"
+        package.mkdir(parents=True, exist_ok=True)
+        doc = '    """Doc."""\n' if i % 2 else ""
+        (package / f"mod{i}.py").write_text(f"def f{i}():\n{doc}    return {i}\n\n\nclass C{i}:\n    pass\n")
+    (root / "pkg0.py").write_text("def clash():\n    pass\n")
+    (root / "pkg0" / "__init__.py").write_text("def clash():\n    \"\"\"Package.\"\"\"\n")
+    (root / "broken.py").write_text("def broken(:\n")
+    return root
+
+
+def test_parse_shard():
+    """Shard specs are 1-based i/N."""
+    assert parse_shard("2/4") == (2, 4)
+    for bad in ("0/4", "5/4", "x", "1/0"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_shards_partition_files(tree):
+    """Every file belongs to exactly one shard."""
+    partials = [scan_shard(tree, i, 3) for i in (1, 2, 3)]
+    files = [f for p in partials for f in p["files"]]
+    assert len(files) == len(set(files)) == 15
+    assert all(shard_of(f, 3) == p["shard"][0] for p in partials for f in p["files"])
+
+
+def test_merge_is_identical_to_single_node(tree, tmp_path):
+    """Merged shard results equal a single-node report, byte for byte."""
+    paths = [
+        write_partial(scan_shard(tree, i, 4), tmp_path / f"part{i}.json.gz")
+        for i in (1, 2, 3, 4)
+    ]
+    merged = merge_partials(reversed(paths))
+    single = scan_report(tree)
+
+    assert json.dumps(merged, sort_keys=True) == json.dumps(single, sort_keys=True)
+    # Duplicate keys resolve like a full scan: last file in walk order wins
+    full = PythonParser().extract_functions(tree)
+    assert single["functions"]["pkg0:clash"]["file"] == "pkg0.py"
+    assert full["pkg0:clash"]["file"].endswith("pkg0.py")
+    assert sorted(single["functions"]) == sorted(full)
+    assert single["quarantined"][0]["file"] == "broken.py"
+    assert single["violation_counts"]["D101"] == 12
+
+
+def test_merge_rejects_missing_shards(tree):
+    """A missing or duplicated shard is an error, not a partial report."""
+    with pytest.raises(ValueError):
+        merge_partials([scan_shard(tree, 1, 2)])
+    with pytest.raises(ValueError):
+        merge_partials([scan_shard(tree, 1, 2), scan_shard(tree, 1, 2)])
+
+
+def test_merge_rejects_mixed_rule_sets(tree):
+    """Shards validated with different rule selections are not merged."""
+    everything = CodeValidator()
+    selected = CodeValidator(select=["D101"])
+    with pytest.raises(ValueError, match="rule sets"):
+        merge_partials([
+            scan_shard(tree, 1, 2, validator=everything),
+            scan_shard(tree, 2, 2, validator=selected),
+        ])
+    with pytest.raises(ValueError, match="rule sets"):
+        merge_partials([scan_shard(tree, 1, 2), scan_shard(tree, 2, 2, validate=False)])
+
+    merged = merge_partials([
+        scan_shard(tree, 1, 2, validator=selected),
+        scan_shard(tree, 2, 2, validator=CodeValidator(select=["D101"])),
+    ])
+    assert set(merged["violation_counts"]) == {"D101"}
+
+
+def test_cli_shards_in_separate_processes(tree, tmp_path):
+    """Shards run as independent CLI processes and merge into one report."""
+    def cli(*args):
+        subprocess.run(
+            [sys.executable, "-m", "ai_powered.cli.commands", "--no-cache", *args],
+            check=True, capture_output=True,
+        )
+
+    procs = [
+        subprocess.Popen([
+            sys.executable, "-m", "ai_powered.cli.commands", "--no-cache",
+            "--path", str(tree), "--shard", f"{i}/3",
+            "--partial-out", str(tmp_path / f"p{i}.json.gz"),
+        ])
+        for i in (1, 2, 3)
+    ]
+    assert [proc.wait() for proc in procs] == [0, 0, 0]
+
+    cli("--merge", *(str(tmp_path / f"p{i}.json.gz") for i in (1, 2, 3)),
+        "--report", str(tmp_path / "merged.json"))
+    cli("--path", str(tree), "--report", str(tmp_path / "single.json"))
+
+    assert (tmp_path / "merged.json").read_text() == (tmp_path / "single.json").read_text()
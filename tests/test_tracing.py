@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from ai_powered.core import tracing
+from ai_powered.core.parser.python_parser import PythonParser
+
+
+@pytest.fixture(autouse=True)
+def fresh_trace():
+    tracing.clear()
+    tracing.disable()
+    yield
+    tracing.clear()
+    tracing.disable()
+
+
+def test_disabled_spans_are_not_recorded():
+    first = tracing.span("a")
+    with first as active:
+        active.set(count=1)
+
+    assert tracing.span("b") is first
+    assert tracing.spans() == []
+
+
+def test_span_records_name_category_and_args():
+    tracing.enable()
+
+    with tracing.span("outer", "parser", path="x") as outer:
+        with tracing.span("inner", "parser"):
+            pass
+        outer.set(files=3)
+
+    records = {record["name"]: record for record in tracing.spans()}
+    assert set(records) == {"outer", "inner"}
+    assert records["outer"]["args"] == {"path": "x", "files": 3}
+    assert records["outer"]["duration_us"] >= records["inner"]["duration_us"]
+    assert records["outer"]["start_us"] <= records["inner"]["start_us"]
+
+
+def test_span_marks_exceptions():
+    tracing.enable()
+
+    with pytest.raises(KeyError):
+        with tracing.span("failing"):
+            raise KeyError("x")
+
+    assert tracing.spans()[0]["args"]["error"] == "KeyError"
+
+
+def test_traced_decorator_only_records_when_enabled():
+    @tracing.traced("work", "test")
+    def work(value):
+        return value * 2
+
+    assert work(2) == 4
+    assert tracing.spans() == []
+
+    tracing.enable()
+    assert work(3) == 6
+    assert [record["name"] for record in tracing.spans()] == ["work"]
+
+
+def test_chrome_trace_export(tmp_path):
+    tracing.enable()
+    with tracing.span("stage", "parser", path=tmp_path):
+        pass
+
+    out_path = tracing.export_chrome_trace(tmp_path / "trace.json")
+    document = json.loads(out_path.read_text(encoding="utf-8"))
+
+    event = document["traceEvents"][0]
+    assert event["ph"] == "X"
+    assert event["name"] == "stage" and event["cat"] == "parser"
+    assert event["dur"] >= 0
+    assert event["args"]["path"] == str(tmp_path)
+
+
+def test_summarize_groups_by_stage():
+    records = [
+        {"name": "parse", "category": "parser", "duration_us": ms * 1000}
+        for ms in range(1, 11)
+    ] + [{"name": "validate", "category": "validator", "duration_us": 500}]
+
+    rows = tracing.summarize(records)
+
+    assert [row["stage"] for row in rows] == ["parse", "validate"]
+    parse = rows[0]
+    assert parse["count"] == 10
+    assert parse["total_ms"] == 55
+    assert parse["mean_ms"] == 5.5
+    assert parse["p50_ms"] == 6
+    assert parse["p95_ms"] == 10
+    assert parse["max_ms"] == 10
+
+
+def test_parser_emits_spans(tmp_path):
+    (tmp_path / "mod.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+    tracing.enable()
+
+    PythonParser().extract_functions(tmp_path)
+
+    stages = {row["stage"]: row for row in tracing.summarize()}
+    assert stages["parser.file"]["count"] == 1
+    assert stages["parser.scan"]["count"] == 1
+    assert "parser.walk" in stages
@@ -0,0 +1,97 @@
+"""Tests for the validation result cache."""
+
+import os
+
+from ai_powered.core.parser.parsed_module import ParsedModule
+from ai_powered.core.validator.validation_cache import ValidationCache
+from ai_powered.core.validator.validator import CodeValidator
+
+
+SOURCE = 'class A:\n    pass\n\n\ndef f():\n    """Doc."""\n\n    return 1\n'
+
+
+def _file(tmp_path, source=SOURCE, name="mod.py"):
+    path = tmp_path / name
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+def test_unchanged_file_is_validated_once(tmp_path):
+    cache = ValidationCache(tmp_path / "cache")
+    validator = CodeValidator(cache=cache)
+    path = _file(tmp_path)
+
+    first = validator.validate_file(path)
+    second = validator.validate_file(path)
+
+    assert first == second == CodeValidator().validate_file(path)
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_results_survive_a_new_process(tmp_path):
+    path = _file(tmp_path)
+    CodeValidator(cache=ValidationCache(tmp_path / "cache")).validate_file(path)
+
+    cache = ValidationCache(tmp_path / "cache")
+    violations = CodeValidator(cache=cache).validate_file(path)
+
+    assert [v["code"] for v in violations] == ["D101", "D202"]
+    assert (cache.misses, cache.hits) == (0, 1)
+
+
+def test_content_change_revalidates(tmp_path):
+    cache = ValidationCache(None)
+    validator = CodeValidator(cache=cache)
+    path = _file(tmp_path)
+    validator.validate_file(path)
+
+    path.write_text('def g():\n    return 1\n', encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [v["code"] for v in validator.validate_file(path)] == ["D103"]
+    assert cache.misses == 2
+
+
+def test_same_content_elsewhere_is_a_hit(tmp_path):
+    cache = ValidationCache(None)
+    validator = CodeValidator(cache=cache)
+
+    validator.validate_file(_file(tmp_path, name="a.py"))
+    validator.validate_file(ParsedModule.from_source(SOURCE, "b.py"))
+
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_ruleset_change_revalidates(tmp_path):
+    cache = ValidationCache(None)
+    path = _file(tmp_path)
+
+    everything = CodeValidator(cache=cache).validate_file(path)
+    no_d2 = CodeValidator(ignore="D2", cache=cache).validate_file(path)
+
+    assert [v["code"] for v in everything] == ["D101", "D202"]
+    assert [v["code"] for v in no_d2] == ["D101"]
+    assert cache.misses == 2
+    assert CodeValidator(cache=cache).fingerprint != CodeValidator(ignore="D2").fingerprint
+
+
+def test_cached_results_are_copies(tmp_path):
+    validator = CodeValidator(cache=ValidationCache(None))
+    path = _file(tmp_path)
+
+    validator.validate_file(path)[0]["code"] = "changed"
+
+    assert validator.validate_file(path)[0]["code"] == "D101"
+
+
+def test_memory_is_bounded_and_clear(tmp_path):
+    cache = ValidationCache(tmp_path / "cache", memory_entries=1)
+    validator = CodeValidator(cache=cache)
+
+    validator.validate_file(_file(tmp_path, name="a.py"))
+    validator.validate_file(_file(tmp_path, 'def g():\n    return 1\n', name="b.py"))
+
+    assert len(cache._memory) == 1
+    assert len(cache._versions) == 1
+    assert cache.clear() == 2
@@ -216,3 +216,202 @@ def test_validator_on_nonexistent_file():
         validator.validate_file("non_existent_file.py")
     except Exception as e:
         assert isinstance(e, Exception)
+
+
+def test_validator_select_and_ignore(tmp_path):
+    """Rules can be selected and ignored per run, by code or prefix."""
+    file_path = tmp_path / "mixed.py"
+    file_path.write_text('class A:\n    pass\n\n\ndef f():\n    """Doc."""\n\n    return 1\n')
+
+    def codes(**kwargs):
+        return sorted(v["code"] for v in CodeValidator(**kwargs).validate_file(file_path))
+
+    assert codes() == ["D101", "D202"]
+    assert codes(select="D1") == ["D101"]
+    assert codes(ignore=["D101"]) == ["D202"]
+    assert codes(select="D1,D2", ignore="d202") == ["D101"]
+
+
+def test_validator_rejects_unknown_rule():
+    """Unknown codes are reported instead of silently running nothing."""
+    import pytest
+
+    with pytest.raises(ValueError):
+        CodeValidator(select="X999")
+
+
+def test_custom_rule_runs_in_the_same_traversal(tmp_path):
+    """A registered rule is dispatched only for its subscribed node types."""
+    import ast
+
+    from ai_powered.core.validator.rules import RULES, Rule, register, unregister
+
+    seen = []
+
+    @register
+    class NoLambda(Rule):
+        code = "X100"
+        node_types = (ast.Lambda,)
+        message = "Lambda found"
+
+        def check(self, node, context):
+            seen.append(type(node))
+            context.report(self.code, node.lineno, self.message)
+
+    try:
+        file_path = tmp_path / "lam.py"
+        file_path.write_text('def f():\n    """Doc."""\n    return lambda x: x\n')
+
+        violations = CodeValidator().validate_file(file_path)
+        assert [v["code"] for v in violations] == ["X100"]
+        assert seen == [ast.Lambda]
+        assert CodeValidator(ignore="X").validate_file(file_path) == []
+    finally:
+        unregister("X100")
+
+    assert "X100" not in RULES
+
+
+def test_validate_reads_documented_params_from_sections():
+    """validate() parses Google, NumPy and reST parameter sections."""
+    from ai_powered.core.parser.records import FunctionRecord
+
+    validator = CodeValidator()
+    args = [{"name": "a"}, {"name": "b"}]
+
+    google = "Add.\n\nArgs:\n    a (int): First.\n    b (int): Second.\n\nReturns:\n    int: Sum."
+    numpy = "Add.\n\nParameters\n----------\na, b : int\n    Values.\n\nReturns\n-------\nint"
+    rest = "Add.\n\n:param int a: First.\n:param b: Second.\n:returns: Sum."
+    for docstring in (google, numpy, rest):
+        report = validator.validate(FunctionRecord("add", args=args, docstring=docstring))
+        assert report["status"] == "PASS", docstring
+
+    # "a" appears in the text but is not documented as a parameter
+    report = validator.validate({"name": "add", "args": args, "docstring": "Add a value."})
+    assert report == {
+        "has_docstring": True,
+        "missing_params": ["a", "b"],
+        "unknown_params": [],
+        "status": "FAIL",
+    }
+
+
+def test_validate_functions_returns_status_flags():
+    """validate_functions() returns one status byte per function."""
+    from ai_powered.core.parser.records import FunctionRecord
+    from ai_powered.core.validator.validator import (
+        STATUS_MISSING_DOCSTRING,
+        STATUS_OK,
+        STATUS_UNDOCUMENTED_PARAMS,
+        STATUS_UNKNOWN_PARAMS,
+    )
+
+    functions = {
+        "m:ok": FunctionRecord(
+            "ok", kind="method", args=[{"name": "self"}, {"name": "x"}],
+            docstring="Do.\n\nArgs:\n    x: Value.",
+        ),
+        "m:none": FunctionRecord("none", args=[{"name": "x"}]),
+        "m:partial": FunctionRecord(
+            "partial", args=[{"name": "x"}, {"name": "y"}], docstring=":param x: Value.",
+        ),
+        "m:stale": FunctionRecord(
+            "stale", args=[], docstring="Do.\n\nArgs:\n    old: Removed.",
+        ),
+    }
+
+    statuses = CodeValidator().validate_functions(functions)
+
+    assert list(statuses) == [
+        STATUS_OK,
+        STATUS_MISSING_DOCSTRING,
+        STATUS_UNDOCUMENTED_PARAMS,
+        STATUS_UNKNOWN_PARAMS,
+    ]
+    assert statuses.itemsize == 1
+
+
+def _layout_codes(tmp_path, source, **kwargs):
+    file_path = tmp_path / "layout.py"
+    file_path.write_text(source, encoding="utf-8")
+    return sorted({v["code"] for v in CodeValidator(ignore="D1", **kwargs).validate_file(file_path)})
+
+
+def test_layout_rules_read_docstring_tokens(tmp_path):
+    """D2xx/D3xx/D4xx come from the token stream of each docstring."""
+    clean = 'def f():\n    """Summary.\n\n    More.\n    """\n    return 1\n'
+    assert _layout_codes(tmp_path, clean) == []
+
+    assert _layout_codes(tmp_path, 'def f():\n    """\n    Summary.\n    """\n') == ["D200"]
+    assert _layout_codes(tmp_path, 'def f():\n\n    """Summary."""\n') == ["D201"]
+    assert _layout_codes(tmp_path, 'def f():\n    """Summary.\n    More.\n    """\n') == ["D205"]
+    assert _layout_codes(tmp_path, 'def f():\n    """Summary.\n\n    More."""\n') == ["D209"]
+    assert _layout_codes(tmp_path, 'def f():\n    """ Summary."""\n') == ["D210"]
+    assert _layout_codes(tmp_path, 'class A:\n\n    """Summary."""\n') == ["D211"]
+    assert _layout_codes(tmp_path, "def f():\n    '''Summary.'''\n") == ["D300"]
+    assert _layout_codes(tmp_path, 'def f():\n    """Summary"""\n') == ["D400"]
+
+
+def test_conflicting_layout_rules_are_opt_in(tmp_path):
+    """D203, D212 and D213 only run when selected explicitly."""
+    source = 'class A:\n    """\n    Summary.\n    """\n'
+    assert "D212" not in _layout_codes(tmp_path, source)
+
+    file_path = tmp_path / "layout.py"
+    codes = {v["code"] for v in CodeValidator(select="D203,D212,D213").validate_file(file_path)}
+    assert codes == {"D203", "D212"}
+
+
+def test_layout_rules_map_columns_after_multibyte_text(tmp_path):
+    """Docstrings are found by byte offset even after non-ASCII source."""
+    source = 'x = "é"; y = 1\ndef f():\n    """Summary"""\n'
+    assert _layout_codes(tmp_path, source) == ["D400"]
+    assert _layout_codes(tmp_path, 'café = 1; """Summary."""\n') == []
+
+
+def test_budget_ends_the_traversal_at_the_limit(tmp_path):
+    """A per-code budget stops the walk at the violation that exceeds it."""
+    import pytest
+
+    from ai_powered.core.validator.budget import ValidationBudget, parse_budgets
+
+    file_path = tmp_path / "many.py"
+    file_path.write_text("".join(f"def f{i}():\n    pass\n\n\n" for i in range(10)))
+
+    budget = ValidationBudget(per_code=parse_budgets("D1=3, D202=0"))
+    violations = CodeValidator().validate_file(file_path, budget)
+
+    assert [v["code"] for v in violations] == ["D103"] * 4
+    assert budget.exceeded_by == "D1"
+    assert budget.counts == {"D1": 4, "D202": 0}
+    assert CodeValidator().validate_file(file_path, budget) == []
+
+    with pytest.raises(ValueError):
+        parse_budgets("D1")
+
+
+def test_star_parameters_may_be_documented(tmp_path):
+    """Documented *args / **kwargs are known parameters, but not required."""
+    from ai_powered.core.parser.python_parser import PythonParser
+
+    file_path = tmp_path / "star.py"
+    file_path.write_text(
+        "def documented(a, *args, key=None, **kwargs):\n"
+        '    """\n    Do.\n\n    Args:\n        a: Value.\n        *args: More.\n'
+        '        key: Key.\n        **kwargs: Options.\n    """\n\n\n'
+        "def undocumented(a, *rest):\n"
+        '    """\n    Do.\n\n    Args:\n        a: Value.\n    """\n\n\n'
+        "def stale(a):\n"
+        '    """\n    Do.\n\n    Args:\n        a: Value.\n        *args: Gone.\n    """\n'
+    )
+    functions = PythonParser().extract_functions(file_path)
+    assert [arg["name"] for arg in functions["star:documented"]["args"]] == [
+        "a", "*args", "key", "**kwargs"
+    ]
+
+    validator = CodeValidator()
+    statuses = validator.validate_functions(functions)
+
+    assert list(statuses) == [0, 0, 4]
+    assert validator.validate(functions["star:documented"])["status"] == "PASS"
+    assert validator.validate(functions["star:stale"])["unknown_params"] == ["args"]
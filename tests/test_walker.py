@@ -0,0 +1,113 @@
+# tests/test_walker.py
+"""Tests for the pruned, ignore-aware directory walker."""
+
+import os
+
+import pytest
+
+from ai_powered.core.parser.walker import TreeWalker, walk_python_files
+
+
+def _touch(root, *paths):
+    for rel in paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("def f():\n    pass\n")
+
+
+def _rel(root, files):
+    return [f.relative_to(root).as_posix() for f in files]
+
+
+def test_default_excludes_are_pruned(tmp_path):
+    """Vendored and tool directories are never entered."""
+    _touch(
+        tmp_path,
+        "src/app.py",
+        ".git/hooks/hook.py",
+        "venv/lib/site-packages/dep.py",
+        "node_modules/pkg/x.py",
+        "build/lib/app.py",
+        "pkg.egg-info/info.py",
+    )
+
+    assert _rel(tmp_path, walk_python_files(tmp_path)) == ["src/app.py"]
+
+
+def test_gitignore_rules_and_negation(tmp_path):
+    """Root and nested .gitignore files apply with last-match-wins."""
+    _touch(
+        tmp_path,
+        "a.py",
+        "generated/out.py",
+        "pkg/keep.py",
+        "pkg/skip_me.py",
+        "pkg/skip_but_keep.py",
+    )
+    (tmp_path / ".gitignore").write_text("# generated code\ngenerated/\n/a.py\n")
+    (tmp_path / "pkg" / ".gitignore").write_text("skip_*.py\n!skip_but_keep.py\n")
+
+    assert _rel(tmp_path, walk_python_files(tmp_path)) == [
+        "pkg/keep.py",
+        "pkg/skip_but_keep.py",
+    ]
+
+    walker = TreeWalker(use_gitignore=False)
+    assert len(walk_python_files(tmp_path, walker)) == 5
+
+
+def test_include_and_exclude_globs(tmp_path):
+    """Configurable globs are matched against the path from the root."""
+    _touch(tmp_path, "src/a.py", "src/legacy/b.py", "tests/test_a.py", "tool.pyi")
+
+    walker = TreeWalker(include=["*.py", "*.pyi"], exclude=["tests", "src/**/b.py"])
+
+    assert _rel(tmp_path, walk_python_files(tmp_path, walker)) == ["src/a.py", "tool.pyi"]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unsupported")
+def test_symlink_loops_are_not_followed(tmp_path):
+    """A directory symlinked into itself is visited only once."""
+    _touch(tmp_path, "pkg/mod.py")
+    os.symlink(tmp_path / "pkg", tmp_path / "pkg" / "loop")
+
+    walker = TreeWalker(follow_symlinks=True)
+
+    assert _rel(tmp_path, walk_python_files(tmp_path, walker)) == ["pkg/mod.py"]
+    assert _rel(tmp_path, walk_python_files(tmp_path)) == ["pkg/mod.py"]
+
+
+def test_order_matches_sorted_paths(tmp_path):
+    """Walk order is the same as sorting the paths."""
+    _touch(tmp_path, "a.py", "a/x.py", "a-b.py", "b/c/d.py", "B.py")
+
+    files = walk_python_files(tmp_path)
+
+    assert files == sorted(files)
+
+
+def test_includes_matches_walk(tmp_path):
+    """includes() agrees with walk() for single paths."""
+    _touch(tmp_path, "src/app.py", "src/gen/out.py", "venv/dep.py", "notes/readme.txt")
+    (tmp_path / ".gitignore").write_text("gen/\n")
+
+    walker = TreeWalker()
+    walked = set(walker.walk(tmp_path))
+
+    for rel in ("src/app.py", "src/gen/out.py", "venv/dep.py", "notes/readme.txt"):
+        path = tmp_path / rel
+        assert walker.includes(tmp_path, path) == (path in walked), rel
+
+    assert _rel(tmp_path, walker.directories(tmp_path)) == [".", "notes", "src"]
+
+
+def test_directories_below_start_keep_root_rules(tmp_path):
+    """A subtree walked on its own is still pruned relative to the root."""
+    _touch(tmp_path, "src/pkg/a.py", "src/gen/out.py", "node_modules/x/y/z.py", "build/lib/b.py")
+    (tmp_path / ".gitignore").write_text("gen/\n")
+
+    walker = TreeWalker()
+    assert _rel(tmp_path, walker.directories(tmp_path, tmp_path / "src")) == ["src", "src/pkg"]
+    assert list(walker.directories(tmp_path, tmp_path / "src" / "gen")) == []
+    assert list(walker.directories(tmp_path, tmp_path / "node_modules" / "x")) == []
+    assert list(walker.directories(tmp_path, tmp_path / "build")) == []
@@ -0,0 +1,106 @@
+# tests/test_watcher.py
+"""Tests for the background filesystem watcher."""
+
+import os
+import time
+
+import pytest
+
+from ai_powered.core.parser.incremental import IncrementalScanner
+from ai_powered.core.parser.watcher import FULL_RESCAN, FunctionWatcher, InotifyBackend
+
+
+def _wait_for(watcher, predicate, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        version, functions, metrics = watcher.state()
+        if predicate(functions, metrics):
+            return functions, metrics
+        time.sleep(0.05)
+    pytest.fail("watcher did not pick up the change")
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def watcher(request, tmp_path):
+    if request.param == "inotify" and not InotifyBackend.available():
+        pytest.skip("inotify not available")
+
+    (tmp_path / "a.py").write_text("def alpha():\n    pass\n")
+    watcher = FunctionWatcher(
+        IncrementalScanner(tmp_path),
+        debounce=0.05,
+        poll_interval=0.1,
+        use_inotify=request.param == "inotify",
+    )
+    watcher.start()
+    yield watcher
+    watcher.stop()
+
+
+def test_watcher_picks_up_edits_and_new_files(watcher, tmp_path):
+    """Edits, new files and deletions reach the shared state."""
+    _, functions, metrics = watcher.state()
+    assert list(functions) == ["a:alpha"]
+    assert metrics["documented"] == 0
+
+    (tmp_path / "a.py").write_text("def alpha():\n    \"\"\"Doc.\"\"\"\n")
+    _, metrics = _wait_for(watcher, lambda f, m: m["documented"] == 1)
+    assert metrics["coverage_percent"] == 100.0
+
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "b.py").write_text("def beta():\n    pass\n")
+    functions, _ = _wait_for(watcher, lambda f, m: "pkg.b:beta" in f)
+
+    (tmp_path / "a.py").unlink()
+    functions, metrics = _wait_for(watcher, lambda f, m: "a:alpha" not in f)
+    assert list(functions) == ["pkg.b:beta"]
+    assert metrics == {"total_functions": 1, "documented": 0, "coverage_percent": 0.0}
+
+
+def test_manual_rescan_is_serialized(watcher, tmp_path):
+    """A rescan requested by the UI updates the same state."""
+    before = watcher.state()[0]
+    watcher.rescan()
+    assert watcher.state()[0] > before
+
+
+def test_inotify_skips_excluded_new_directories(tmp_path):
+    """Directories created later are only watched if the walk would enter them."""
+    if not InotifyBackend.available():
+        pytest.skip("inotify not available")
+
+    (tmp_path / ".gitignore").write_text("gen/\n")
+    backend = InotifyBackend(tmp_path)
+    try:
+        for rel in ("node_modules/x/y/z", "build/lib", "gen/out", "src/pkg"):
+            (tmp_path / rel).mkdir(parents=True)
+        backend.wait(0.5)
+
+        watched = sorted(
+            os.path.relpath(path, tmp_path) for path in backend._dirs.values()
+        )
+        assert watched == [".", "src", os.path.join("src", "pkg")]
+    finally:
+        backend.close()
+
+
+def test_inotify_rescans_only_for_walked_directories(tmp_path):
+    """Pruned directories such as __pycache__ do not force a full rescan."""
+    if not InotifyBackend.available():
+        pytest.skip("inotify not available")
+
+    backend = InotifyBackend(tmp_path)
+    try:
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "__pycache__" / "a.cpython-311.pyc").write_bytes(b"")
+        assert backend.wait(0.5) == set()
+        (tmp_path / "__pycache__" / "a.cpython-311.pyc").unlink()
+        (tmp_path / "__pycache__").rmdir()
+        assert backend.wait(0.5) == set()
+
+        (tmp_path / "src").mkdir()
+        assert backend.wait(0.5) is FULL_RESCAN
+        (tmp_path / "src").rename(tmp_path / "moved")
+        assert backend.wait(0.5) is FULL_RESCAN
+    finally:
+        backend.close()